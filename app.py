@@ -1,8 +1,11 @@
+import time
+import threading
 import streamlit as st
 from datetime import datetime
-from utils.meet_bot import GoogleMeetBot
-from utils.transcription import TranscriptionService
-from utils.file_generator import FileGenerator
+import config
+from utils.metrics import get_metrics, start_metrics_server
+from utils.transcript_index import get_transcript_index
+from utils.transcript_model import format_timestamp
 
 st.set_page_config(page_title="Google Meet Recorder", page_icon="🎤", layout="wide")
 st.title("🎤 Google Meet Recorder")
@@ -14,42 +17,156 @@ def initialize_session_state():
         st.session_state.is_recording = False
     if 'current_session' not in st.session_state:
         st.session_state.current_session = None
+    if 'active_job_id' not in st.session_state:
+        st.session_state.active_job_id = None
+
+@st.cache_resource
+def create_project_directories():
+    config.create_project_directories()
+    return True
+
+@st.cache_resource
+def get_job_queue():
+    from utils.job_queue import JobQueue
+    return JobQueue()
+
+@st.cache_resource
+def get_job_workers():
+    from utils.job_queue import JobWorkerPool
+    return JobWorkerPool().start()
+
+@st.cache_resource
+def get_metrics_server():
+    if not config.METRICS_PORT:
+        return None
+    try:
+        return start_metrics_server()
+    except OSError as error:
+        print(f"Metrics endpoint unavailable: {error}")
+        return None
+
+@st.cache_resource
+def start_transcript_backfill():
+    backfill_thread = threading.Thread(target=get_transcript_index().backfill, daemon=True)
+    backfill_thread.start()
+    return backfill_thread
 
 def create_session_id():
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
-def join_meeting_and_start_recording(meeting_url):
-    st.session_state.meet_bot = GoogleMeetBot()
+def join_meeting_and_start_recording(meeting_url, live_transcription=False):
+    from utils.meet_bot import GoogleMeetBot
+    
+    st.session_state.current_session = create_session_id()
+    st.session_state.meet_bot = GoogleMeetBot(session_name=st.session_state.current_session)
     join_success = st.session_state.meet_bot.join_meeting(meeting_url)
     
     if join_success:
-        st.session_state.current_session = create_session_id()
-        recording_started = st.session_state.meet_bot.start_recording(st.session_state.current_session)
+        recording_started = st.session_state.meet_bot.start_recording(
+            st.session_state.current_session,
+            live_transcription=live_transcription
+        )
         
         if recording_started:
             st.session_state.is_recording = True
             st.success("✅ Meeting joined and recording started")
             st.rerun()
         else:
+            st.session_state.meet_bot.leave_meeting()
             st.error("Failed to start recording")
     else:
+        st.session_state.meet_bot.leave_meeting()
         st.error("Failed to join meeting")
 
 def stop_recording_and_generate_files():
     audio_file_path = st.session_state.meet_bot.stop_recording()
+    live_transcript = st.session_state.meet_bot.finish_live_transcription()
+    
+    st.session_state.meet_bot.leave_meeting()
     
     if audio_file_path:
-        transcription_service = TranscriptionService()
-        transcript_text = transcription_service.transcribe_audio(audio_file_path)
+        st.session_state.active_job_id = get_job_queue().enqueue(
+            st.session_state.current_session,
+            audio_file_path,
+            live_transcript=live_transcript
+        )
+    else:
+        st.error("No audio was recorded")
+    
+    reset_session()
+    st.rerun()
+
+def display_job_status(job_id):
+    job = get_job_queue().get_job(job_id)
+    if not job:
+        return False
+    
+    if job['status'] == 'completed':
+        result = job['result']
+        display_results(
+            result['audio_file_path'],
+            result['transcript_text'],
+            result['text_file_path'],
+            result['pdf_file_path'],
+            job['session_name'],
+            result.get('extra_file_paths', {})
+        )
+        display_session_report(job['session_name'])
+        return False
+    
+    if job['status'] == 'failed':
+        st.error(f"Processing failed after {job['attempts']} attempts: {job['error']}")
+        return False
+    
+    status_text = f"⏳ Session {job['session_name']}: {job['stage']}"
+    if job['status'] == 'queued' and job['error']:
+        status_text += f" (attempt {job['attempts']} failed: {job['error']})"
+    st.progress(job['progress'], text=status_text)
+    return True
+
+def display_session_report(session_name):
+    session_report = get_metrics().load_session_report(session_name)
+    if not session_report:
+        return
+    
+    with st.expander("⏱️ Stage Timings"):
+        st.table([
+            {"stage": stage, "runs": totals["count"], "seconds": round(totals["total_seconds"], 2),
+             "errors": totals["errors"]}
+            for stage, totals in session_report["stages"].items()
+        ])
+        if session_report["counters"]:
+            st.json(session_report["counters"])
+
+def display_recent_jobs():
+    recent_jobs = get_job_queue().list_jobs(limit=10)
+    if not recent_jobs:
+        return
+    
+    with st.expander("🗂️ Recent Recordings"):
+        for job in recent_jobs:
+            col1, col2 = st.columns([4, 1])
+            col1.write(f"{job['session_name']} — {job['status']} ({job['stage']})")
+            if col2.button("Show", key=f"show_job_{job['job_id']}"):
+                st.session_state.active_job_id = job['job_id']
+                st.rerun()
+
+def display_transcript_search():
+    with st.expander("🔎 Search Transcripts"):
+        search_text = st.text_input("Search all meetings:", placeholder="budget review")
+        if not search_text:
+            return
         
-        file_generator = FileGenerator()
-        text_file_path = file_generator.create_text_file(transcript_text, st.session_state.current_session)
-        pdf_file_path = file_generator.create_pdf_file(transcript_text, st.session_state.current_session)
+        search_start = time.perf_counter()
+        search_results = get_transcript_index().search(search_text)
+        st.caption(f"{len(search_results)} results in {(time.perf_counter() - search_start) * 1000:.0f} ms")
         
-        display_results(audio_file_path, transcript_text, text_file_path, pdf_file_path)
-        reset_session()
+        for result in search_results:
+            position = f" · `{format_timestamp(result['start_seconds'])}`" if result['start_seconds'] is not None else ""
+            st.markdown(f"**{result['session_name']}**{position} — {result['snippet']}")
 
-def display_results(audio_file_path, transcript_text, text_file_path, pdf_file_path):
+def display_results(audio_file_path, transcript_text, text_file_path, pdf_file_path, session_name,
+                    extra_file_paths=None):
     st.success("✅ Recording completed and transcript generated")
     
     st.audio(audio_file_path, format='audio/wav')
@@ -62,7 +179,7 @@ def display_results(audio_file_path, transcript_text, text_file_path, pdf_file_p
             st.download_button(
                 "📄 Download Text File",
                 text_file.read(),
-                file_name=f"transcript_{st.session_state.current_session}.txt"
+                file_name=f"transcript_{session_name}.txt"
             )
     
     with col2:
@@ -70,9 +187,27 @@ def display_results(audio_file_path, transcript_text, text_file_path, pdf_file_p
             st.download_button(
                 "📑 Download PDF File",
                 pdf_file.read(),
-                file_name=f"transcript_{st.session_state.current_session}.pdf",
+                file_name=f"transcript_{session_name}.pdf",
                 mime="application/pdf"
             )
+    
+    if extra_file_paths:
+        for column, (output_format, output_path) in zip(st.columns(len(extra_file_paths)), extra_file_paths.items()):
+            with column, open(output_path, 'r', encoding='utf-8') as output_file:
+                st.download_button(
+                    f"⬇️ Download {output_format.upper()}",
+                    output_file.read(),
+                    file_name=f"transcript_{session_name}.{output_format}"
+                )
+
+def display_live_transcript():
+    live_transcript = st.session_state.meet_bot.get_live_transcript()
+    if live_transcript is None:
+        return
+    
+    st.text_area("Live Transcript:", live_transcript or "Waiting for the first window...", height=200)
+    if st.button("🔄 Refresh Transcript", use_container_width=True):
+        st.rerun()
 
 def reset_session():
     st.session_state.is_recording = False
@@ -80,20 +215,40 @@ def reset_session():
 
 def main():
     initialize_session_state()
+    create_project_directories()
+    get_job_workers().ensure_running()
+    get_metrics_server()
     
     meeting_url = st.text_input("📹 Enter Google Meet URL:", placeholder="https://meet.google.com/abc-defg-hij")
     
     if meeting_url and not st.session_state.is_recording:
+        live_transcription = st.checkbox("📝 Transcribe live during the meeting")
+        
         if st.button("🚀 Join Meeting", type="primary", use_container_width=True):
             with st.spinner("Joining meeting and starting recording..."):
-                join_meeting_and_start_recording(meeting_url)
+                join_meeting_and_start_recording(meeting_url, live_transcription)
     
     if st.session_state.is_recording:
         st.success("🔴 Recording in progress...")
+        display_live_transcript()
         
         if st.button("⏹️ Stop Recording & Save", type="secondary", use_container_width=True):
-            with st.spinner("Processing recording and generating transcript..."):
+            with st.spinner("Stopping recording..."):
                 stop_recording_and_generate_files()
+    
+    job_in_progress = False
+    if st.session_state.active_job_id:
+        job_in_progress = display_job_status(st.session_state.active_job_id)
+    
+    display_recent_jobs()
+    
+    if config.TRANSCRIPT_INDEX_ENABLED:
+        start_transcript_backfill()
+        display_transcript_search()
+    
+    if job_in_progress:
+        time.sleep(config.JOB_POLL_INTERVAL)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
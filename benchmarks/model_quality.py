@@ -0,0 +1,95 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import config
+
+FIXTURES_DIR = os.path.join(config.PROJECT_ROOT, 'assets', 'fixtures')
+TEST_CLIP_PATH = os.path.join(FIXTURES_DIR, 'harvard_list1.wav')
+REFERENCE_PATH = os.path.join(FIXTURES_DIR, 'harvard_list1.txt')
+
+def normalize_words(text):
+    return re.findall(r"[a-z0-9']+", text.lower())
+
+def word_error_rate(reference_text, hypothesis_text):
+    reference_words = normalize_words(reference_text)
+    hypothesis_words = normalize_words(hypothesis_text)
+    previous_row = list(range(len(hypothesis_words) + 1))
+    for reference_index, reference_word in enumerate(reference_words, start=1):
+        current_row = [reference_index]
+        for hypothesis_index, hypothesis_word in enumerate(hypothesis_words, start=1):
+            current_row.append(min(
+                previous_row[hypothesis_index] + 1,
+                current_row[hypothesis_index - 1] + 1,
+                previous_row[hypothesis_index - 1] + (reference_word != hypothesis_word)
+            ))
+        previous_row = current_row
+    return previous_row[-1] / max(1, len(reference_words))
+
+def benchmark_model_quality(clip_path=None, reference_path=None, model_names=None, quantizations=None):
+    from utils.model_cache import WHISPER_AVAILABLE, WhisperModelCache
+    from utils.system_resources import read_available_cores
+    from utils.audio_processing import load_whisper_audio, WHISPER_SAMPLE_RATE
+
+    clip_path = clip_path or TEST_CLIP_PATH
+    if not WHISPER_AVAILABLE:
+        return {"error": "Whisper is not installed"}
+    if not os.path.exists(clip_path):
+        return {"error": f"Test clip not found: {clip_path} (record the sentences in "
+                         f"{os.path.basename(reference_path or REFERENCE_PATH)} and save them there)"}
+
+    with open(reference_path or REFERENCE_PATH, encoding='utf-8') as reference_file:
+        reference_text = reference_file.read()
+    speech_audio = load_whisper_audio(clip_path)
+    audio_seconds = len(speech_audio) / WHISPER_SAMPLE_RATE
+    available_cores = read_available_cores()
+
+    results = []
+    for model_name in model_names or config.WHISPER_POLICY_MODELS:
+        for quantization in quantizations or ["none", "int8"]:
+            model_cache = WhisperModelCache(max_models=1)
+            load_start = time.perf_counter()
+            whisper_model = model_cache.get_model(model_name, device="cpu", quantization=quantization)
+            load_seconds = time.perf_counter() - load_start
+
+            transcribe_start = time.perf_counter()
+            result = whisper_model.transcribe(speech_audio, fp16=False)
+            transcribe_seconds = time.perf_counter() - transcribe_start
+
+            real_time_factor = transcribe_seconds / audio_seconds
+            results.append({
+                "model": model_name,
+                "quantization": quantization,
+                "load_seconds": load_seconds,
+                "transcribe_seconds": transcribe_seconds,
+                "real_time_factor": real_time_factor,
+                "cpu_rtf": real_time_factor * available_cores ** config.WHISPER_THREAD_SCALING,
+                "memory_mb": model_cache.get_stats()["memory_mb"],
+                "word_error_rate": word_error_rate(reference_text, result["text"]),
+                "transcript": result["text"].strip()
+            })
+            model_cache.clear()
+
+    return {"clip": clip_path, "audio_seconds": audio_seconds, "available_cores": available_cores,
+            "results": results}
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Whisper model speed and word error rate on a test clip")
+    parser.add_argument("--clip", default=TEST_CLIP_PATH)
+    parser.add_argument("--reference", default=REFERENCE_PATH)
+    parser.add_argument("--models", nargs="+", default=config.WHISPER_POLICY_MODELS)
+    parser.add_argument("--quantizations", nargs="+", default=["none", "int8"], choices=["none", "int8"])
+    arguments = parser.parse_args()
+
+    report = benchmark_model_quality(arguments.clip, arguments.reference, arguments.models, arguments.quantizations)
+    print(json.dumps(report, indent=2))
+    if "error" in report:
+        sys.exit(1)
+
+    print("Full-precision cpu_rtf values calibrate WHISPER_MODEL_CPU_RTF, and their ratio to the int8 values "
+          "calibrates WHISPER_INT8_SPEEDUP", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+from datetime import datetime
+import numpy as np
+import config
+from benchmarks.synthetic_audio import generate_meeting_audio, write_meeting_recording
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FIXTURE_PAGE = os.path.join(config.PROJECT_ROOT, 'assets', 'fixtures', 'meet_prejoin.html')
+TRANSCRIPT_WORDS = "so the next item on the agenda is the quarterly review of the release schedule".split()
+
+def read_peak_rss_mb():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+def benchmark_recorder(duration_seconds, speed):
+    from utils.audio_recorder import AudioRecorder
+    from utils.audio_sources import ArrayReplaySource
+
+    audio = generate_meeting_audio(duration_seconds, config.AUDIO_CAPTURE_RATE, config.AUDIO_CAPTURE_CHANNELS)
+    replay_source = ArrayReplaySource(audio, config.AUDIO_CAPTURE_RATE, speed)
+    with tempfile.TemporaryDirectory() as recording_dir:
+        recorder = AudioRecorder(audio_source=replay_source)
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+
+        recorder.start_recording("benchmark", recording_dir)
+        replay_source.finished.wait()
+        stop_start = time.perf_counter()
+        audio_file_path = recorder.stop_recording()
+        stop_seconds = time.perf_counter() - stop_start
+
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        return {
+            "audio_seconds": duration_seconds,
+            "replay_speed": speed,
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": cpu_seconds,
+            "cpu_percent": 100 * cpu_seconds / wall_seconds,
+            "stop_seconds": stop_seconds,
+            "delivered_frames": replay_source.delivered_frames,
+            "captured_seconds": recorder.frames_written / recorder.sample_rate,
+            "dropped_frames": recorder.ring_buffer.dropped_frames,
+            "overflow_count": recorder.overflow_count,
+            "archive_bytes": os.path.getsize(audio_file_path) if audio_file_path else 0,
+            "peak_rss_mb": read_peak_rss_mb()
+        }
+
+def benchmark_transcription(audio_file_path, audio_seconds, backends, model_names):
+    from utils.transcription import TranscriptionService, ASSEMBLYAI_AVAILABLE
+    from utils.model_cache import WHISPER_AVAILABLE
+
+    results = []
+    if "whisper" in backends and WHISPER_AVAILABLE:
+        for model_name in model_names:
+            transcription_service = TranscriptionService(model_name=model_name, parallel=False, transcript_cache=False)
+
+            load_start = time.perf_counter()
+            transcription_service.model_cache.get_model(model_name)
+            load_seconds = time.perf_counter() - load_start
+
+            transcribe_start = time.perf_counter()
+            result = transcription_service.run_whisper(audio_file_path)
+            transcribe_seconds = time.perf_counter() - transcribe_start
+
+            results.append({
+                "backend": "whisper",
+                "model": model_name,
+                "audio_seconds": audio_seconds,
+                "load_seconds": load_seconds,
+                "transcribe_seconds": transcribe_seconds,
+                "real_time_factor": transcribe_seconds / audio_seconds,
+                "transcript_characters": len(result["text"])
+            })
+    elif "whisper" in backends:
+        results.append({"backend": "whisper", "error": "Whisper is not installed"})
+
+    if "assemblyai" in backends:
+        transcription_service = TranscriptionService(transcript_cache=False)
+        if not (ASSEMBLYAI_AVAILABLE and transcription_service.assemblyai_client):
+            results.append({"backend": "assemblyai", "error": "ASSEMBLYAI_API_KEY is not set"})
+        else:
+            transcribe_start = time.perf_counter()
+            transcript = transcription_service.use_assemblyai(audio_file_path)
+            transcribe_seconds = time.perf_counter() - transcribe_start
+            results.append({
+                "backend": "assemblyai",
+                "base_url": config.ASSEMBLYAI_BASE_URL,
+                "audio_seconds": audio_seconds,
+                "transcribe_seconds": transcribe_seconds,
+                "real_time_factor": transcribe_seconds / audio_seconds,
+                "transcript_characters": len(transcript.text) if transcript else 0
+            })
+    return results
+
+def build_transcript_segments(segment_count):
+    random_generator = np.random.default_rng(0)
+    segments = []
+    start_time = 0.0
+    for _ in range(segment_count):
+        word_count = int(random_generator.integers(5, 40))
+        words = random_generator.choice(TRANSCRIPT_WORDS, size=word_count)
+        segments.append({"start": start_time, "text": " ".join(words)})
+        start_time += word_count * 0.4
+    return segments
+
+def benchmark_file_generator(segment_count):
+    from utils.file_generator import FileGenerator
+
+    segments = build_transcript_segments(segment_count)
+    transcript_text = "\n".join(segment["text"] for segment in segments)
+    results = {"segments": segment_count, "transcript_mb": len(transcript_text.encode('utf-8')) / (1024 * 1024)}
+
+    with tempfile.TemporaryDirectory() as transcripts_dir:
+        file_generator = FileGenerator(transcripts_dir=transcripts_dir)
+        for input_name, transcript_content in (("text", transcript_text), ("segments", segments)):
+            export_start = time.perf_counter()
+            text_file_path, pdf_file_path = file_generator.create_transcript_files(transcript_content, "benchmark")
+            export_seconds = time.perf_counter() - export_start
+
+            results[input_name] = {
+                "export_seconds": export_seconds,
+                "segments_per_second": segment_count / export_seconds,
+                "text_file_mb": os.path.getsize(text_file_path) / (1024 * 1024) if text_file_path else None,
+                "pdf_file_mb": os.path.getsize(pdf_file_path) / (1024 * 1024) if pdf_file_path else None
+            }
+    results["peak_rss_mb"] = read_peak_rss_mb()
+    return results
+
+def benchmark_join(runs, ready_ms, admit_ms):
+    from utils.meet_bot import GoogleMeetBot
+
+    fixture_url = f"file://{os.path.abspath(FIXTURE_PAGE)}#ready={ready_ms}&admit={admit_ms}"
+    join_timings = []
+    leave_timings = []
+    for _ in range(runs):
+        meet_bot = GoogleMeetBot(headless=True)
+        join_start = time.perf_counter()
+        joined = meet_bot.join_meeting(fixture_url)
+        join_timings.append(time.perf_counter() - join_start)
+        if not joined:
+            return {"error": "join_meeting returned False", "join_seconds": join_timings}
+
+        leave_start = time.perf_counter()
+        meet_bot.leave_meeting()
+        leave_timings.append(time.perf_counter() - leave_start)
+
+    return {
+        "fixture_url": fixture_url,
+        "runs": runs,
+        "join_seconds": join_timings,
+        "join_median_seconds": statistics.median(join_timings),
+        "join_overhead_seconds": statistics.median(join_timings) - (ready_ms + admit_ms) / 1000,
+        "leave_median_seconds": statistics.median(leave_timings)
+    }
+
+def run_section(section_name, benchmark_function, *args):
+    print(f"Running {section_name} benchmark...", file=sys.stderr)
+    try:
+        return benchmark_function(*args)
+    except Exception as error:
+        print(f"{section_name} benchmark failed: {error}", file=sys.stderr)
+        return {"error": str(error)}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure recorder, transcription, model quality, export, join and startup performance")
+    parser.add_argument("--sections", nargs="+", default=["recorder", "transcription", "export", "join", "startup"],
+                        choices=["recorder", "transcription", "quality", "export", "join", "startup"])
+    parser.add_argument("--audio-seconds", type=float, default=60)
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="Replay speed for the recorder benchmark (1.0 = real time, 0 = unpaced)")
+    parser.add_argument("--backends", nargs="+", default=["whisper", "assemblyai"])
+    parser.add_argument("--models", nargs="+", default=[config.WHISPER_MODEL])
+    parser.add_argument("--transcript-segments", type=int, default=20000)
+    parser.add_argument("--join-runs", type=int, default=3)
+    parser.add_argument("--join-ready-ms", type=int, default=1000)
+    parser.add_argument("--join-admit-ms", type=int, default=300)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    arguments = parser.parse_args()
+    config.create_project_directories()
+
+    report = {
+        "generated": datetime.now().isoformat(timespec='seconds'),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        }
+    }
+
+    if "recorder" in arguments.sections:
+        report["recorder"] = run_section("recorder", benchmark_recorder, arguments.audio_seconds,
+                                         arguments.replay_speed)
+
+    if "transcription" in arguments.sections:
+        with tempfile.TemporaryDirectory() as audio_dir:
+            audio_file_path = write_meeting_recording(os.path.join(audio_dir, "benchmark.wav"),
+                                                      arguments.audio_seconds)
+            report["transcription"] = run_section("transcription", benchmark_transcription, audio_file_path,
+                                                  arguments.audio_seconds, arguments.backends, arguments.models)
+
+    if "quality" in arguments.sections:
+        from benchmarks.model_quality import benchmark_model_quality
+        report["quality"] = run_section("quality", benchmark_model_quality)
+
+    if "export" in arguments.sections:
+        report["file_generator"] = run_section("export", benchmark_file_generator, arguments.transcript_segments)
+
+    if "join" in arguments.sections:
+        report["join"] = run_section("join", benchmark_join, arguments.join_runs, arguments.join_ready_ms,
+                                     arguments.join_admit_ms)
+
+    if "startup" in arguments.sections:
+        from benchmarks.startup import benchmark_startup
+        report["startup"] = run_section("startup", benchmark_startup)
+
+    report_json = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(report_json)
+        print(f"Benchmark report written to {arguments.output}", file=sys.stderr)
+    else:
+        print(report_json)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import config
+
+STARTUP_MODULES = ["config", "utils.metrics", "utils.transcript_index", "utils.transcript_model"]
+HEAVY_MODULES = ["torch", "whisper", "numpy", "selenium", "fpdf", "sounddevice", "soundfile", "scipy"]
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+APP_PATH = os.path.join(config.PROJECT_ROOT, 'app.py')
+
+def parse_import_times(importtime_output):
+    import_times = []
+    for line in importtime_output.splitlines():
+        import_time = IMPORT_TIME_PATTERN.match(line)
+        if import_time:
+            self_us, cumulative_us, indent, module_name = import_time.groups()
+            import_times.append((module_name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return import_times
+
+def measure_imports(module_names, runs=3, top_count=10):
+    import_statement = "; ".join(f"import {module_name}" for module_name in module_names)
+    check_statement = f"import sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    wall_timings = []
+    import_times = []
+    heavy_modules_loaded = []
+
+    for _ in range(runs):
+        start_time = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"{import_statement}; {check_statement}"],
+            cwd=config.PROJECT_ROOT, capture_output=True, text=True
+        )
+        wall_timings.append(time.perf_counter() - start_time)
+        if completed.returncode != 0:
+            raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+        import_times = parse_import_times(completed.stderr)
+        heavy_modules_loaded = [name for name in completed.stdout.strip().split(",") if name]
+
+    top_level_ms = sum(cumulative_us for name, _, cumulative_us, depth in import_times
+                       if depth == 0 and name in module_names) / 1000
+    slowest_imports = sorted(import_times, key=lambda import_time: import_time[1], reverse=True)[:top_count]
+    return {
+        "modules": module_names,
+        "import_ms": top_level_ms,
+        "process_median_seconds": statistics.median(wall_timings),
+        "heavy_modules_loaded": heavy_modules_loaded,
+        "slowest_imports": [
+            {"module": name, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+            for name, self_us, cumulative_us, _ in slowest_imports
+        ]
+    }
+
+def measure_app_runs(app_path=APP_PATH, timeout=60):
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return {"error": "streamlit is not installed"}
+
+    app_test = AppTest.from_file(app_path, default_timeout=timeout)
+    start_time = time.perf_counter()
+    app_test.run()
+    first_run_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    app_test.run()
+    rerun_seconds = time.perf_counter() - start_time
+    return {
+        "first_run_seconds": first_run_seconds,
+        "rerun_seconds": rerun_seconds,
+        "exceptions": [str(exception.value) for exception in app_test.exception]
+    }
+
+def benchmark_startup(runs=3, include_app=True):
+    report = {"imports": measure_imports(STARTUP_MODULES, runs)}
+    if include_app:
+        report["app"] = measure_app_runs()
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how long the Streamlit app takes to import and render")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--skip-app", action="store_true", help="Only measure module imports")
+    parser.add_argument("--max-import-ms", type=float,
+                        help="Exit with an error when the startup imports take longer than this")
+    arguments = parser.parse_args()
+
+    report = benchmark_startup(arguments.runs, not arguments.skip_app)
+    print(json.dumps(report, indent=2))
+
+    import_report = report["imports"]
+    if import_report["heavy_modules_loaded"]:
+        print(f"Heavy modules imported at startup: {', '.join(import_report['heavy_modules_loaded'])}",
+              file=sys.stderr)
+        sys.exit(1)
+    if arguments.max_import_ms and import_report["import_ms"] > arguments.max_import_ms:
+        print(f"Startup imports took {import_report['import_ms']:.0f} ms "
+              f"(limit {arguments.max_import_ms:.0f} ms)", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
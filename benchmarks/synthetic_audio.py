@@ -0,0 +1,54 @@
+import numpy as np
+import soundfile as sf
+
+FORMANT_FREQUENCIES = [(700, 1200), (400, 2000), (300, 2300), (500, 900), (600, 1700)]
+
+def generate_voiced_burst(duration_seconds, sample_rate, random_generator):
+    sample_times = np.arange(int(duration_seconds * sample_rate)) / sample_rate
+    start_pitch, end_pitch = random_generator.uniform(100, 250, size=2)
+    pitch = np.linspace(start_pitch, end_pitch, len(sample_times))
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+
+    first_formant, second_formant = FORMANT_FREQUENCIES[random_generator.integers(len(FORMANT_FREQUENCIES))]
+    burst = np.zeros(len(sample_times))
+    for harmonic in range(1, 16):
+        harmonic_frequency = pitch * harmonic
+        formant_gain = (np.exp(-((harmonic_frequency - first_formant) / 300) ** 2) +
+                        0.5 * np.exp(-((harmonic_frequency - second_formant) / 400) ** 2) + 0.05)
+        burst += formant_gain * np.sin(harmonic * phase) / harmonic
+
+    syllable_rate = random_generator.uniform(3, 6)
+    syllable_envelope = 0.5 * (1 - np.cos(2 * np.pi * syllable_rate * sample_times))
+    fade_length = min(len(burst) // 2, int(0.02 * sample_rate))
+    edge_fade = np.ones(len(burst))
+    edge_fade[:fade_length] = np.linspace(0, 1, fade_length)
+    edge_fade[len(burst) - fade_length:] = np.linspace(1, 0, fade_length)
+
+    burst *= syllable_envelope * edge_fade
+    return burst / max(np.abs(burst).max(), 1e-9)
+
+def generate_meeting_audio(duration_seconds, sample_rate, channels=1, speech_ratio=0.6, seed=0):
+    random_generator = np.random.default_rng(seed)
+    total_samples = int(duration_seconds * sample_rate)
+    audio = random_generator.normal(0, 0.002, total_samples)
+
+    position = 0
+    while position < total_samples:
+        speech_seconds = random_generator.uniform(0.5, 4.0)
+        silence_seconds = speech_seconds * (1 - speech_ratio) / max(speech_ratio, 0.01)
+        silence_seconds *= random_generator.uniform(0.5, 1.5)
+
+        burst = generate_voiced_burst(speech_seconds, sample_rate, random_generator)
+        burst = burst[:total_samples - position]
+        audio[position:position + len(burst)] += random_generator.uniform(0.2, 0.6) * burst
+        position += len(burst) + int(silence_seconds * sample_rate)
+
+    audio = np.clip(audio, -1.0, 1.0).astype(np.float32)
+    if channels == 1:
+        return audio
+    return np.repeat(audio[:, None], channels, axis=1)
+
+def write_meeting_recording(file_path, duration_seconds, sample_rate=16000, channels=1, speech_ratio=0.6, seed=0):
+    audio = generate_meeting_audio(duration_seconds, sample_rate, channels, speech_ratio, seed)
+    sf.write(file_path, audio, sample_rate, subtype='PCM_16')
+    return file_path
@@ -1,12 +1,122 @@
 import os
 
-AUDIO_SAMPLE_RATE = 44100
-AUDIO_CHANNELS = 2
+AUDIO_CAPTURE_RATE = 44100
+AUDIO_CAPTURE_CHANNELS = 2
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_CHANNELS = 1
+AUDIO_SAMPLE_FORMAT = 'int16'
+AUDIO_BLOCK_SIZE = 1024
+AUDIO_BUFFER_SECONDS = 10
+AUDIO_ARCHIVE_QUEUE_BLOCKS = 64
+
+AUDIO_SOURCE = os.getenv('AUDIO_SOURCE', 'sounddevice')
+AUDIO_DEVICE = os.getenv('AUDIO_DEVICE')
+AUDIO_FFMPEG_INPUT = os.getenv('AUDIO_FFMPEG_INPUT', '-f pulse -i default')
+AUDIO_FIFO_PATH = os.getenv('AUDIO_FIFO_PATH', '/tmp/meetbot_audio.fifo')
+AUDIO_REPLAY_FILE = os.getenv('AUDIO_REPLAY_FILE')
+AUDIO_REPLAY_SPEED = float(os.getenv('AUDIO_REPLAY_SPEED', '1.0'))
+AUDIO_BACKPRESSURE_TIMEOUT = 1.0
+PULSEAUDIO_SINK_PREFIX = 'meetbot'
+FFMPEG_PATH = os.getenv('FFMPEG_PATH', 'ffmpeg')
+
+AUDIO_ANALYSIS_FRAME_SECONDS = 0.02
+AUDIO_ANALYSIS_FRAMES_PER_BLOCK = 500
+AUDIO_SILENCE_RMS = 0.01
+AUDIO_CLIPPING_LEVEL = 0.999
+
+VAD_ENABLED = True
+VAD_FRAME_SECONDS = 0.03
+VAD_ENERGY_MARGIN_DB = 12
+VAD_MIN_ENERGY_DB = -55
+VAD_UNVOICED_MARGIN_DB = 6
+VAD_UNVOICED_ZCR = 0.25
+VAD_HANGOVER_SECONDS = 0.3
+VAD_PREROLL_SECONDS = 0.1
+VAD_MIN_GAP_SECONDS = 0.5
+
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'base')
+WHISPER_CACHE_MAX_MODELS = 2
+WHISPER_CACHE_MEMORY_MB = 4096
+WHISPER_PARALLEL_ENABLED = os.getenv('WHISPER_PARALLEL_ENABLED', '0') == '1'
+WHISPER_PARALLEL_WORKERS = int(os.getenv('WHISPER_PARALLEL_WORKERS', '0'))
+WHISPER_PARALLEL_MAX_POOLS = 2
+WHISPER_WORD_TIMESTAMPS = os.getenv('WHISPER_WORD_TIMESTAMPS', '0') == '1'
+WHISPER_PARALLEL_MIN_SECONDS = 120
+WHISPER_MODEL_MEMORY_MB = {"tiny": 400, "base": 600, "small": 1200, "medium": 3000, "large": 6000}
+WHISPER_QUANTIZATION = os.getenv('WHISPER_QUANTIZATION', 'none')
+
+WHISPER_MODEL_POLICY = os.getenv('WHISPER_MODEL_POLICY', 'fixed')
+WHISPER_POLICY_MODELS = ['tiny', 'base', 'small']
+WHISPER_POLICY_TARGET_RTF = float(os.getenv('WHISPER_POLICY_TARGET_RTF', '0.5'))
+WHISPER_POLICY_MIN_BUDGET_SECONDS = 60
+WHISPER_MODEL_CPU_RTF = {"tiny": 0.5, "base": 1.0, "small": 3.0, "medium": 8.0, "large": 16.0}
+WHISPER_INT8_SPEEDUP = 1.8
+WHISPER_THREAD_SCALING = 0.7
+
+PARALLEL_SEGMENT_SECONDS = 60
+PARALLEL_SPLIT_SEARCH_SECONDS = 10
+
+TRANSCRIPTION_STRATEGY = os.getenv('TRANSCRIPTION_STRATEGY', 'cascade')
+HEDGE_DELAY_SECONDS = float(os.getenv('HEDGE_DELAY_SECONDS', '5'))
+ASSEMBLYAI_BASE_URL = os.getenv('ASSEMBLYAI_BASE_URL')
+ASSEMBLYAI_POLL_INTERVAL = 1.0
+
+TRANSCRIPT_CACHE_ENABLED = os.getenv('TRANSCRIPT_CACHE_ENABLED', '1') == '1'
+TRANSCRIPT_CACHE_MAX_MB = 200
+
+PDF_FONT_PATH = os.getenv('PDF_FONT_PATH')
+EXPORT_PARALLEL = True
+EXPORT_QUEUE_LINES = 1000
+EXPORT_EXTRA_FORMATS = ['srt', 'vtt', 'json']
+
+LIVE_WINDOW_SECONDS = 30
+LIVE_OVERLAP_SECONDS = 1.0
+LIVE_SILENCE_FRAME_SECONDS = 0.1
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 RECORDINGS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'recordings')
 TRANSCRIPTS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'transcripts')
 
+BROWSER_HEADLESS = os.getenv('BROWSER_HEADLESS', '0') == '1'
+BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '2'))
+BROWSER_POOL_MAX_USES = 5
+BROWSER_POOL_ACQUIRE_TIMEOUT = 2
+CHROMEDRIVER_VERSION = "139.0.7258.80"
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')
+CHROMEDRIVER_CACHE_PATH = os.path.join(PROJECT_ROOT, 'assets', '.cache', 'chromedriver.json')
+JOIN_READY_TIMEOUT = 20
+JOIN_CONFIRM_TIMEOUT = 10
+JOIN_POLL_INTERVAL = 0.2
+TRANSCRIPT_CACHE_PATH = os.path.join(PROJECT_ROOT, 'assets', '.cache', 'transcripts.sqlite3')
+TRANSCRIPT_INDEX_ENABLED = os.getenv('TRANSCRIPT_INDEX_ENABLED', '1') == '1'
+TRANSCRIPT_INDEX_PATH = os.path.join(TRANSCRIPTS_DIR, 'index.sqlite3')
+SEARCH_RESULT_LIMIT = 50
+SELECTOR_STATS_PATH = os.path.join(PROJECT_ROOT, 'assets', 'selector_stats.json')
+
+BOT_CPU_CORES = 1.0
+BOT_MEMORY_MB = 700
+ORCHESTRATOR_MAX_BOTS = int(os.getenv('ORCHESTRATOR_MAX_BOTS', '0'))
+ORCHESTRATOR_MAX_PROCESSING = 2
+ORCHESTRATOR_AUDIO_SOURCE = os.getenv('ORCHESTRATOR_AUDIO_SOURCE', 'pulseaudio')
+ORCHESTRATOR_DEFAULT_MINUTES = 60
+ORCHESTRATOR_OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'assets', 'meetings')
+
+JOB_QUEUE_PATH = os.path.join(PROJECT_ROOT, 'assets', '.cache', 'jobs.sqlite3')
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_BACKOFF_SECONDS = 10
+JOB_LEASE_SECONDS = 600
+JOB_POLL_INTERVAL = 1.0
+
+BATCH_THREADS_PER_WORKER = 2
+BATCH_MANIFEST_PATH = os.path.join(TRANSCRIPTS_DIR, 'batch_manifest.jsonl')
+
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9464'))
+METRICS_DIR = os.path.join(PROJECT_ROOT, 'assets', '.cache', 'metrics')
+METRICS_TIMELINE_LIMIT = 500
+METRICS_SNAPSHOT_MAX_AGE_SECONDS = 24 * 3600
+SESSION_REPORTS_DIR = os.path.join(PROJECT_ROOT, 'assets', 'reports')
+
 def create_project_directories():
     directories_to_create = [
         RECORDINGS_DIR,
@@ -16,5 +126,3 @@ def create_project_directories():
     
     for directory in directories_to_create:
         os.makedirs(directory, exist_ok=True)
-
-create_project_directories()
@@ -0,0 +1,13 @@
+import pytest
+from utils.model_cache import estimate_model_bytes
+
+torch = pytest.importorskip("torch")
+
+def test_estimate_model_bytes_counts_quantized_linear_weights():
+    model = torch.nn.Sequential(torch.nn.Linear(64, 32), torch.nn.ReLU(), torch.nn.Linear(32, 8))
+    full_precision_bytes = estimate_model_bytes(model)
+    quantized_model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    quantized_bytes = estimate_model_bytes(quantized_model)
+
+    assert (64 * 32 + 32 * 8) <= quantized_bytes < full_precision_bytes
@@ -0,0 +1,31 @@
+import numpy as np
+from utils.vad import trim_silence
+from utils.audio_processing import WHISPER_SAMPLE_RATE
+
+def test_trim_silence_keeps_steady_audio():
+    random_generator = np.random.default_rng(0)
+    noise = (0.1 * random_generator.standard_normal(WHISPER_SAMPLE_RATE * 3)).astype(np.float32)
+    tone = (0.1 * np.sin(2 * np.pi * 220 * np.arange(WHISPER_SAMPLE_RATE * 3) / WHISPER_SAMPLE_RATE)).astype(np.float32)
+
+    for audio_data in (noise, tone):
+        trimmed_audio, offset_map = trim_silence(audio_data)
+        assert len(trimmed_audio) == len(audio_data)
+        assert offset_map.to_original_time(1.5) == 1.5
+
+def test_trim_silence_removes_long_pauses():
+    time_axis = np.arange(WHISPER_SAMPLE_RATE) / WHISPER_SAMPLE_RATE
+    speech = (0.3 * np.sin(2 * np.pi * 220 * time_axis)).astype(np.float32)
+    silence = np.zeros(WHISPER_SAMPLE_RATE * 2, dtype=np.float32)
+    audio_data = np.concatenate((speech, silence, speech))
+
+    trimmed_audio, offset_map = trim_silence(audio_data)
+
+    assert 2 * WHISPER_SAMPLE_RATE <= len(trimmed_audio) < len(audio_data)
+    assert abs(offset_map.to_original_time(1.5) - 3.5) < 0.5
+
+def test_trim_silence_keeps_audio_without_speech_regions():
+    audio_data = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+
+    trimmed_audio, _ = trim_silence(audio_data)
+
+    assert len(trimmed_audio) == len(audio_data)
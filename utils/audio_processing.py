@@ -0,0 +1,157 @@
+import math
+import struct
+import numpy as np
+import soundfile as sf
+
+WHISPER_SAMPLE_RATE = 16000
+
+class PolyphaseResampler:
+    def __init__(self, source_rate, target_rate, taps_per_phase=24):
+        rate_divisor = math.gcd(source_rate, target_rate)
+        self.up = target_rate // rate_divisor
+        self.down = source_rate // rate_divisor
+        self.taps_per_phase = taps_per_phase
+        self.phase_filters = self.design_phase_filters()
+        self.history = np.zeros(taps_per_phase - 1, dtype=np.float32)
+        self.consumed_frames = 0
+        self.next_output = 0
+
+    def design_phase_filters(self):
+        filter_length = self.taps_per_phase * self.up
+        cutoff = 0.5 / max(self.up, self.down) * 0.95
+        sample_offsets = np.arange(filter_length) - (filter_length - 1) / 2
+        prototype = 2 * cutoff * np.sinc(2 * cutoff * sample_offsets) * np.kaiser(filter_length, 8.0)
+        prototype *= self.up / prototype.sum()
+        return prototype.reshape(self.taps_per_phase, self.up).T.astype(np.float32)
+
+    def process(self, audio_block):
+        if self.up == self.down:
+            return audio_block.astype(np.float32)
+
+        extended_block = np.concatenate((self.history, audio_block.astype(np.float32)))
+        total_frames = self.consumed_frames + len(audio_block)
+        output_end = -(-total_frames * self.up // self.down)
+
+        output_positions = np.arange(self.next_output, output_end, dtype=np.int64) * self.down
+        input_positions = output_positions // self.up - self.consumed_frames + self.taps_per_phase - 1
+        phases = output_positions % self.up
+
+        input_windows = extended_block[input_positions[:, None] - np.arange(self.taps_per_phase)]
+        resampled_block = np.einsum('ij,ij->i', input_windows, self.phase_filters[phases])
+
+        self.history = extended_block[len(extended_block) - (self.taps_per_phase - 1):]
+        self.consumed_frames = total_frames
+        self.next_output = output_end
+        return resampled_block.astype(np.float32)
+
+class CapturePipeline:
+    def __init__(self, capture_rate, capture_channels, target_rate, target_channels, sample_format):
+        self.capture_channels = capture_channels
+        self.target_channels = target_channels
+        self.sample_format = sample_format
+        self.resamplers = [PolyphaseResampler(capture_rate, target_rate) for _ in range(target_channels)]
+
+    def process(self, audio_block):
+        if self.target_channels == 1:
+            channel_blocks = [audio_block.mean(axis=1)]
+        else:
+            channel_blocks = [audio_block[:, channel] for channel in range(self.target_channels)]
+
+        output_block = np.stack([
+            resampler.process(channel_block)
+            for resampler, channel_block in zip(self.resamplers, channel_blocks)
+        ], axis=1)
+
+        if self.sample_format == 'int16':
+            return float_to_int16(output_block)
+        return output_block
+
+def float_to_int16(audio_data):
+    return np.round(np.clip(audio_data, -1.0, 1.0) * 32767).astype(np.int16)
+
+def int16_to_float(audio_data):
+    return audio_data.astype(np.float32) / 32768
+
+def resample_audio(audio_data, source_rate, target_rate=WHISPER_SAMPLE_RATE):
+    if source_rate == target_rate or not len(audio_data):
+        return audio_data.astype(np.float32)
+
+    resampler = PolyphaseResampler(source_rate, target_rate)
+    chunk_frames = source_rate * 30
+    return np.concatenate([
+        resampler.process(audio_data[chunk_start:chunk_start + chunk_frames])
+        for chunk_start in range(0, len(audio_data), chunk_frames)
+    ])
+
+def find_quietest_frame(audio_data, search_start, search_end, frame_length):
+    search_region = audio_data[search_start:search_end]
+    frame_count = len(search_region) // frame_length
+    if frame_count == 0:
+        return search_end
+
+    frames = search_region[:frame_count * frame_length].reshape(frame_count, frame_length)
+    frame_energy = np.mean(frames ** 2, axis=1)
+    quietest_frame = int(np.argmin(frame_energy))
+    return search_start + quietest_frame * frame_length + frame_length // 2
+
+def load_mono_audio(audio_file_path, target_rate=WHISPER_SAMPLE_RATE):
+    file_info = sf.info(audio_file_path)
+    mono_chunks = [
+        audio_block.mean(axis=1)
+        for audio_block in sf.blocks(audio_file_path, blocksize=file_info.samplerate * 60,
+                                     dtype='float32', always_2d=True)
+    ]
+    mono_audio = np.concatenate(mono_chunks) if mono_chunks else np.zeros(0, dtype=np.float32)
+    return resample_audio(mono_audio, file_info.samplerate, target_rate)
+
+def map_wav_file(audio_file_path):
+    with open(audio_file_path, 'rb') as wav_file:
+        riff_header = wav_file.read(12)
+        if len(riff_header) < 12 or riff_header[:4] != b'RIFF' or riff_header[8:12] != b'WAVE':
+            return None, None
+
+        sample_dtype = None
+        channels = sample_rate = None
+        while True:
+            chunk_header = wav_file.read(8)
+            if len(chunk_header) < 8:
+                return None, None
+
+            chunk_id = chunk_header[:4]
+            chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+            if chunk_id == b'fmt ':
+                format_chunk = wav_file.read(chunk_size + chunk_size % 2)
+                audio_format, channels, sample_rate = struct.unpack('<HHI', format_chunk[:8])
+                bits_per_sample = struct.unpack('<H', format_chunk[14:16])[0]
+                if audio_format == 0xFFFE:
+                    audio_format = struct.unpack('<H', format_chunk[24:26])[0]
+                sample_dtype = {(1, 16): np.int16, (3, 32): np.float32}.get((audio_format, bits_per_sample))
+            elif chunk_id == b'data':
+                if sample_dtype is None:
+                    return None, None
+                data_offset = wav_file.tell()
+                frame_count = chunk_size // (np.dtype(sample_dtype).itemsize * channels)
+                break
+            else:
+                wav_file.seek(chunk_size + chunk_size % 2, 1)
+
+    if not frame_count:
+        return np.zeros((0, channels), dtype=sample_dtype), sample_rate
+
+    mapped_audio = np.memmap(audio_file_path, dtype=sample_dtype, mode='r', offset=data_offset,
+                             shape=(frame_count, channels))
+    return mapped_audio, sample_rate
+
+def load_whisper_audio(audio_file_path):
+    mapped_audio, sample_rate = map_wav_file(audio_file_path)
+    if mapped_audio is None or sample_rate != WHISPER_SAMPLE_RATE:
+        return load_mono_audio(audio_file_path)
+
+    mono_audio = mapped_audio[:, 0] if mapped_audio.shape[1] == 1 else mapped_audio.mean(axis=1, dtype=np.float32)
+    if mono_audio.dtype == np.int16:
+        return int16_to_float(mono_audio)
+    return mono_audio
+
+def write_wav(audio_file_path, audio_data, sample_rate=WHISPER_SAMPLE_RATE):
+    sf.write(audio_file_path, audio_data, sample_rate, subtype='PCM_16')
+    return audio_file_path
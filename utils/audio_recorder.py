@@ -1,49 +1,202 @@
-import sounddevice as sd
 import soundfile as sf
 import numpy as np
 import threading
+import queue
 import time
 import os
+import config
+from utils.audio_processing import CapturePipeline
+from utils.audio_sources import create_audio_source
+from utils.metrics import get_metrics
+
+class AudioRingBuffer:
+    def __init__(self, capacity_frames, channels, dtype='float32'):
+        self.buffer = np.zeros((capacity_frames, channels), dtype=dtype)
+        self.capacity_frames = capacity_frames
+        self.read_position = 0
+        self.available_frames = 0
+        self.dropped_frames = 0
+        self.dropped_blocks = 0
+        self.lock = threading.Lock()
+        self.data_ready = threading.Condition(self.lock)
+        self.space_ready = threading.Condition(self.lock)
+
+    def write(self, frames, wait_timeout=None):
+        with self.lock:
+            if wait_timeout:
+                self.space_ready.wait_for(
+                    lambda: self.capacity_frames - self.available_frames >= len(frames), wait_timeout
+                )
+            free_frames = self.capacity_frames - self.available_frames
+            if len(frames) > free_frames:
+                self.dropped_frames += len(frames) - free_frames
+                self.dropped_blocks += 1
+                frames = frames[:free_frames]
+
+            frame_count = len(frames)
+            write_position = (self.read_position + self.available_frames) % self.capacity_frames
+            first_part = min(frame_count, self.capacity_frames - write_position)
+            self.buffer[write_position:write_position + first_part] = frames[:first_part]
+            self.buffer[:frame_count - first_part] = frames[first_part:]
+
+            self.available_frames += frame_count
+            self.data_ready.notify()
+
+    def read(self, max_frames, timeout=None):
+        with self.lock:
+            if not self.available_frames and timeout:
+                self.data_ready.wait(timeout)
+
+            frame_count = min(max_frames, self.available_frames)
+            first_part = min(frame_count, self.capacity_frames - self.read_position)
+            frames = np.concatenate((
+                self.buffer[self.read_position:self.read_position + first_part],
+                self.buffer[:frame_count - first_part]
+            ))
+
+            self.read_position = (self.read_position + frame_count) % self.capacity_frames
+            self.available_frames -= frame_count
+            if frame_count:
+                self.space_ready.notify()
+            return frames
 
 class AudioRecorder:
-    def __init__(self):
-        self.audio_chunks = []
+    def __init__(self, device=None, audio_source=None):
+        self.device = device
+        self.audio_source = audio_source or create_audio_source(device=device)
+        self.capture_rate = config.AUDIO_CAPTURE_RATE
+        self.capture_channels = config.AUDIO_CAPTURE_CHANNELS
+        self.sample_rate = config.AUDIO_SAMPLE_RATE
+        self.channels = config.AUDIO_CHANNELS
+        self.sample_format = config.AUDIO_SAMPLE_FORMAT
+        self.capture_pipeline = None
+        self.block_size = config.AUDIO_BLOCK_SIZE
+        self.ring_buffer = None
+        self.archive_queue = queue.Queue(maxsize=config.AUDIO_ARCHIVE_QUEUE_BLOCKS)
         self.is_recording = False
         self.recording_thread = None
+        self.archive_thread = None
+        self.stop_requested = threading.Event()
         self.current_session = None
         self.save_location = None
-    
+        self.audio_file_path = None
+        self.frames_written = 0
+        self.overflow_count = 0
+        self.block_listeners = []
+        self.metrics = get_metrics()
+
+    def add_block_listener(self, listener):
+        self.block_listeners.append(listener)
+
     def start_recording(self, session_name, save_directory):
         os.makedirs(save_directory, exist_ok=True)
-        
+
         self.current_session = session_name
         self.save_location = save_directory
-        self.audio_chunks = []
+        self.audio_file_path = f"{self.save_location}/{self.current_session}.wav"
+        self.capture_rate = self.audio_source.sample_rate or config.AUDIO_CAPTURE_RATE
+        self.capture_channels = self.audio_source.channels or config.AUDIO_CAPTURE_CHANNELS
+        self.ring_buffer = AudioRingBuffer(self.capture_rate * config.AUDIO_BUFFER_SECONDS, self.capture_channels)
+        self.capture_pipeline = CapturePipeline(
+            self.capture_rate, self.capture_channels, self.sample_rate, self.channels, self.sample_format
+        )
+        self.frames_written = 0
+        self.overflow_count = 0
+        self.stop_requested.clear()
         self.is_recording = True
-        
-        self.recording_thread = threading.Thread(target=self.capture_audio)
+
+        self.archive_thread = threading.Thread(target=self.archive_audio, daemon=True)
+        self.archive_thread.start()
+        self.recording_thread = threading.Thread(target=self.capture_audio, daemon=True)
         self.recording_thread.start()
         return True
-    
+
+    def on_audio_block(self, audio_data, frame_count, time_info, status):
+        if status.input_overflow:
+            self.overflow_count += 1
+            self.metrics.increment("audio_input_overflows", session=self.current_session)
+        wait_timeout = config.AUDIO_BACKPRESSURE_TIMEOUT if self.audio_source.waits_for_space else None
+        self.ring_buffer.write(audio_data, wait_timeout)
+
     def capture_audio(self):
         try:
-            with sd.InputStream(samplerate=44100, channels=2, dtype='float32') as audio_stream:
-                while self.is_recording:
-                    audio_data, _ = audio_stream.read(1024)
-                    self.audio_chunks.append(audio_data.copy())
-                    time.sleep(0.001)
+            with self.metrics.span("capture", self.current_session):
+                with self.audio_source.open_stream(self.capture_rate, self.capture_channels,
+                                                   self.block_size, self.on_audio_block):
+                    while not self.stop_requested.is_set() and not self.audio_source.finished.is_set():
+                        self.process_buffered_audio(timeout=0.1)
+
+                self.process_buffered_audio()
         except Exception as error:
             print(f"Audio capture failed: {error}")
-    
+        finally:
+            self.archive_queue.put(None)
+            self.is_recording = False
+
+    def process_buffered_audio(self, timeout=None):
+        captured_audio = self.ring_buffer.read(self.ring_buffer.capacity_frames, timeout)
+        while len(captured_audio):
+            audio_data = self.capture_pipeline.process(captured_audio)
+            self.archive_queue.put(audio_data)
+            self.frames_written += len(audio_data)
+            self.notify_block_listeners(audio_data)
+            captured_audio = self.ring_buffer.read(self.ring_buffer.capacity_frames)
+
+    def archive_audio(self):
+        started_at = time.time()
+        write_seconds = 0.0
+        write_error = None
+        audio_data = False
+        try:
+            file_subtype = 'PCM_16' if self.sample_format == 'int16' else 'FLOAT'
+            with sf.SoundFile(self.audio_file_path, mode='w', samplerate=self.sample_rate,
+                              channels=self.channels, subtype=file_subtype) as audio_file:
+                audio_data = self.archive_queue.get()
+                while audio_data is not None:
+                    write_start = time.perf_counter()
+                    audio_file.write(audio_data)
+                    write_seconds += time.perf_counter() - write_start
+                    audio_data = self.archive_queue.get()
+        except Exception as error:
+            write_error = type(error).__name__
+            print(f"Audio archive failed: {error}")
+            while audio_data is not None:
+                audio_data = self.archive_queue.get()
+        finally:
+            self.metrics.record_duration("write", write_seconds, started_at, self.current_session, write_error)
+
+    def notify_block_listeners(self, audio_data):
+        for listener in self.block_listeners:
+            try:
+                listener(audio_data)
+            except Exception as error:
+                print(f"Audio block listener failed: {error}")
+
+    def wait_until_archived(self, timeout=None):
+        if self.archive_thread:
+            self.archive_thread.join(timeout)
+        return not (self.archive_thread and self.archive_thread.is_alive())
+
     def stop_recording(self):
-        self.is_recording = False
-        
+        self.stop_requested.set()
+
         if self.recording_thread:
             self.recording_thread.join()
-        
-        if self.audio_chunks:
-            complete_audio = np.concatenate(self.audio_chunks, axis=0)
-            audio_file_path = f"{self.save_location}/{self.current_session}.wav"
-            sf.write(audio_file_path, complete_audio, 44100)
-            return audio_file_path
+
+        if self.ring_buffer and self.ring_buffer.dropped_frames:
+            print(f"Dropped {self.ring_buffer.dropped_frames} audio frames (writer fell behind)")
+            self.metrics.increment("audio_dropped_frames", self.ring_buffer.dropped_frames,
+                                   session=self.current_session)
+            self.metrics.increment("audio_dropped_blocks", self.ring_buffer.dropped_blocks,
+                                   session=self.current_session)
+        self.metrics.increment("audio_recorded_seconds", self.frames_written / self.sample_rate,
+                               session=self.current_session)
+
+        self.wait_until_archived()
+
+        if self.frames_written:
+            return self.audio_file_path
+
+        if self.audio_file_path and os.path.exists(self.audio_file_path):
+            os.remove(self.audio_file_path)
         return None
@@ -0,0 +1,253 @@
+import os
+import re
+import time
+import shlex
+import threading
+import subprocess
+import numpy as np
+import config
+
+RAW_STREAM_CLOSE_TIMEOUT = 5
+ISOLATED_SOURCE_TYPES = ("pulseaudio", "replay")
+BROWSER_ENVIRONMENT_SOURCE_TYPES = ("pulseaudio",)
+
+class CaptureStatus:
+    def __init__(self, input_overflow=False):
+        self.input_overflow = input_overflow
+
+class AudioSource:
+    sample_rate = None
+    channels = None
+    waits_for_space = False
+
+    def __init__(self):
+        self.finished = threading.Event()
+
+    def open_stream(self, sample_rate, channels, block_size, callback):
+        raise NotImplementedError
+
+    def browser_environment(self):
+        return {}
+
+    def close(self):
+        pass
+
+class SoundDeviceSource(AudioSource):
+    def __init__(self, device=None):
+        super().__init__()
+        if isinstance(device, str) and device.isdigit():
+            device = int(device)
+        self.device = device
+
+    def open_stream(self, sample_rate, channels, block_size, callback):
+        import sounddevice as sd
+
+        self.finished.clear()
+        return sd.InputStream(device=self.device, samplerate=sample_rate, channels=channels, dtype='float32',
+                              blocksize=block_size, callback=callback)
+
+class RawStream:
+    def __init__(self, audio_source, open_reader, channels, block_size, callback, process=None):
+        self.audio_source = audio_source
+        self.open_reader = open_reader
+        self.channels = channels
+        self.block_size = block_size
+        self.callback = callback
+        self.process = process
+        self.reader = None
+        self.stop_requested = threading.Event()
+        self.stream_thread = None
+
+    def __enter__(self):
+        self.stream_thread = threading.Thread(target=self.deliver_blocks, daemon=True)
+        self.stream_thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop_requested.set()
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+        self.stream_thread.join(RAW_STREAM_CLOSE_TIMEOUT)
+        if self.process:
+            self.process.wait()
+
+    def deliver_blocks(self):
+        block_bytes = self.block_size * self.channels * 4
+        try:
+            self.reader = self.open_reader()
+            while not self.stop_requested.is_set():
+                data = self.reader.read(block_bytes)
+                frame_count = len(data) // (self.channels * 4)
+                if frame_count:
+                    block = np.frombuffer(data[:frame_count * self.channels * 4], dtype='<f4')
+                    self.callback(block.reshape(frame_count, self.channels), frame_count, None, CaptureStatus())
+                if len(data) < block_bytes:
+                    break
+        except (OSError, ValueError) as error:
+            if not self.stop_requested.is_set():
+                print(f"Audio stream read failed: {error}")
+        finally:
+            if self.reader:
+                self.reader.close()
+            self.audio_source.finished.set()
+
+class ProcessSource(AudioSource):
+    def build_command(self, sample_rate, channels):
+        raise NotImplementedError
+
+    def open_stream(self, sample_rate, channels, block_size, callback):
+        self.finished.clear()
+        process = subprocess.Popen(self.build_command(sample_rate, channels), stdout=subprocess.PIPE)
+        return RawStream(self, lambda: process.stdout, channels, block_size, callback, process)
+
+class FfmpegSource(ProcessSource):
+    def __init__(self, input_args, ffmpeg_path=None):
+        super().__init__()
+        self.input_args = shlex.split(input_args) if isinstance(input_args, str) else list(input_args)
+        self.ffmpeg_path = ffmpeg_path or config.FFMPEG_PATH
+
+    def build_command(self, sample_rate, channels):
+        return [self.ffmpeg_path, "-hide_banner", "-loglevel", "error", "-nostdin", *self.input_args,
+                "-f", "f32le", "-ac", str(channels), "-ar", str(sample_rate), "pipe:1"]
+
+class PulseAudioSinkSource(ProcessSource):
+    def __init__(self, sink_name):
+        super().__init__()
+        self.sink_name = re.sub(r"[^\w.-]", "_", sink_name)
+        self.module_id = None
+        self.lock = threading.Lock()
+
+    def create_sink(self):
+        with self.lock:
+            if self.module_id is None:
+                self.module_id = subprocess.run(
+                    ["pactl", "load-module", "module-null-sink", f"sink_name={self.sink_name}",
+                     f"sink_properties=device.description={self.sink_name}"],
+                    capture_output=True, text=True, check=True
+                ).stdout.strip()
+                print(f"Created PulseAudio sink {self.sink_name}")
+        return self.sink_name
+
+    def browser_environment(self):
+        return {"PULSE_SINK": self.create_sink()}
+
+    def build_command(self, sample_rate, channels):
+        return ["parec", f"--device={self.create_sink()}.monitor", "--raw", "--format=float32le",
+                f"--rate={sample_rate}", f"--channels={channels}", "--latency-msec=50"]
+
+    def close(self):
+        with self.lock:
+            if self.module_id is None:
+                return
+            try:
+                subprocess.run(["pactl", "unload-module", self.module_id], check=True, capture_output=True)
+            except (OSError, subprocess.CalledProcessError) as error:
+                print(f"Could not remove PulseAudio sink {self.sink_name}: {error}")
+            self.module_id = None
+
+class FifoSource(AudioSource):
+    def __init__(self, fifo_path, sample_rate=None, channels=None):
+        super().__init__()
+        self.fifo_path = fifo_path
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    def open_stream(self, sample_rate, channels, block_size, callback):
+        self.finished.clear()
+        return RawStream(self, lambda: open(self.fifo_path, 'rb'), channels, block_size, callback)
+
+class ReplayStream:
+    def __init__(self, replay_source, block_size, callback):
+        self.replay_source = replay_source
+        self.block_size = block_size
+        self.callback = callback
+        self.stop_requested = threading.Event()
+        self.stream_thread = None
+
+    def __enter__(self):
+        self.stream_thread = threading.Thread(target=self.deliver_blocks, daemon=True)
+        self.stream_thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop_requested.set()
+        self.stream_thread.join()
+
+    def deliver_blocks(self):
+        speed = self.replay_source.speed
+        block_seconds = self.block_size / self.replay_source.sample_rate / speed if speed > 0 else 0
+        next_deadline = time.perf_counter()
+
+        try:
+            for block in self.replay_source.iter_blocks(self.block_size):
+                if self.stop_requested.is_set():
+                    return
+
+                next_deadline = max(next_deadline + block_seconds, time.perf_counter() - block_seconds)
+                self.callback(block, len(block), None, CaptureStatus())
+                self.replay_source.delivered_frames += len(block)
+
+                remaining = next_deadline - time.perf_counter()
+                if remaining > 0:
+                    time.sleep(remaining)
+        finally:
+            self.replay_source.finished.set()
+
+class ReplaySource(AudioSource):
+    waits_for_space = True
+
+    def __init__(self, speed=None):
+        super().__init__()
+        self.speed = config.AUDIO_REPLAY_SPEED if speed is None else speed
+        self.delivered_frames = 0
+
+    def iter_blocks(self, block_size):
+        raise NotImplementedError
+
+    def open_stream(self, sample_rate, channels, block_size, callback):
+        self.finished.clear()
+        self.delivered_frames = 0
+        return ReplayStream(self, block_size, callback)
+
+class ArrayReplaySource(ReplaySource):
+    def __init__(self, audio, sample_rate, speed=None):
+        super().__init__(speed)
+        self.audio = np.asarray(audio, dtype=np.float32)
+        if self.audio.ndim == 1:
+            self.audio = self.audio[:, None]
+        self.sample_rate = sample_rate
+        self.channels = self.audio.shape[1]
+
+    def iter_blocks(self, block_size):
+        for block_start in range(0, len(self.audio), block_size):
+            yield self.audio[block_start:block_start + block_size]
+
+class FileReplaySource(ReplaySource):
+    def __init__(self, audio_file_path, speed=None):
+        import soundfile as sf
+
+        super().__init__(speed)
+        self.audio_file_path = audio_file_path
+        file_info = sf.info(audio_file_path)
+        self.sample_rate = file_info.samplerate
+        self.channels = file_info.channels
+
+    def iter_blocks(self, block_size):
+        import soundfile as sf
+
+        with sf.SoundFile(self.audio_file_path) as audio_file:
+            yield from audio_file.blocks(blocksize=block_size, dtype='float32', always_2d=True)
+
+def create_audio_source(source_type=None, device=None, session_name=None):
+    source_type = source_type or config.AUDIO_SOURCE
+    if source_type == "sounddevice":
+        return SoundDeviceSource(config.AUDIO_DEVICE if device is None else device)
+    if source_type == "pulseaudio":
+        return PulseAudioSinkSource(f"{config.PULSEAUDIO_SINK_PREFIX}_{session_name or os.getpid()}")
+    if source_type == "ffmpeg":
+        return FfmpegSource(config.AUDIO_FFMPEG_INPUT)
+    if source_type == "fifo":
+        return FifoSource(config.AUDIO_FIFO_PATH)
+    if source_type == "replay":
+        return FileReplaySource(config.AUDIO_REPLAY_FILE)
+    raise ValueError(f"Unknown audio source: {source_type}")
@@ -0,0 +1,214 @@
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import config
+from utils.metrics import get_metrics
+from utils.system_resources import read_available_memory_mb
+
+RECORDING_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3")
+
+def estimate_worker_count(model_name=None):
+    model_memory_mb = config.WHISPER_MODEL_MEMORY_MB.get(model_name or config.WHISPER_MODEL, 2000)
+    workers_by_cpu = (os.cpu_count() or 1) // config.BATCH_THREADS_PER_WORKER
+    workers_by_memory = read_available_memory_mb() // model_memory_mb
+    return max(1, int(min(workers_by_cpu, workers_by_memory)))
+
+def read_supported_extensions():
+    import soundfile as sf
+
+    available_formats = sf.available_formats()
+    return tuple(extension for extension in RECORDING_EXTENSIONS if extension[1:].upper() in available_formats)
+
+def read_recording_duration(audio_file_path):
+    import soundfile as sf
+
+    try:
+        return sf.info(audio_file_path).duration
+    except Exception:
+        return os.path.getsize(audio_file_path) / (config.AUDIO_SAMPLE_RATE * 2)
+
+def discover_recordings(recording_dirs=None):
+    recordings = []
+    supported_extensions = read_supported_extensions()
+    for recording_dir in recording_dirs or [config.RECORDINGS_DIR]:
+        for directory, _, file_names in os.walk(recording_dir):
+            for file_name in file_names:
+                if not file_name.lower().endswith(supported_extensions):
+                    continue
+                audio_file_path = os.path.abspath(os.path.join(directory, file_name))
+                file_stat = os.stat(audio_file_path)
+                recordings.append({
+                    "audio_file_path": audio_file_path,
+                    "size": file_stat.st_size,
+                    "modified_time": file_stat.st_mtime,
+                    "duration": read_recording_duration(audio_file_path)
+                })
+    return sorted(recordings, key=lambda recording: recording["duration"], reverse=True)
+
+def build_manifest_key(recording, model_name):
+    return f"{recording['audio_file_path']}|{recording['size']}|{recording['modified_time']}|{model_name}"
+
+class BatchManifest:
+    def __init__(self, manifest_path=None):
+        self.manifest_path = manifest_path or config.BATCH_MANIFEST_PATH
+        self.completed = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as manifest_file:
+                for line in manifest_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry["status"] == "completed":
+                        self.completed[entry["key"]] = entry
+                    else:
+                        self.completed.pop(entry["key"], None)
+
+    def is_completed(self, manifest_key):
+        entry = self.completed.get(manifest_key)
+        return bool(entry) and os.path.exists(entry["text_file_path"])
+
+    def record(self, entry):
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(self.manifest_path, 'a', encoding='utf-8') as manifest_file:
+            manifest_file.write(json.dumps(entry) + "\n")
+        if entry["status"] == "completed":
+            self.completed[entry["key"]] = entry
+
+def initialize_batch_worker(threads_per_worker):
+    from utils.model_cache import TORCH_AVAILABLE
+    if TORCH_AVAILABLE:
+        import torch
+        torch.set_num_threads(threads_per_worker)
+
+def transcribe_recording(recording, model_name, transcripts_dir, strategy):
+    from utils.transcription import TranscriptionService
+    from utils.file_generator import FileGenerator
+
+    audio_file_path = recording["audio_file_path"]
+    session_name = os.path.splitext(os.path.basename(audio_file_path))[0]
+    start_time = time.perf_counter()
+    try:
+        model_policy = "adaptive" if model_name == "adaptive" else "fixed"
+        transcription_service = TranscriptionService(model_name=None if model_policy == "adaptive" else model_name,
+                                                     strategy=strategy, session_name=session_name,
+                                                     model_policy=model_policy)
+        transcript, audio_info = transcription_service.transcribe(audio_file_path)
+        if not transcript:
+            raise RuntimeError(transcription_service.create_message(transcript, audio_file_path, audio_info))
+
+        file_generator = FileGenerator(transcripts_dir=transcripts_dir)
+        text_file_path, pdf_file_path = file_generator.create_transcript_files(transcript, session_name)
+        if not text_file_path or not pdf_file_path:
+            raise RuntimeError("Transcript export failed")
+        extra_file_paths = file_generator.create_structured_files(transcript, session_name)
+    finally:
+        get_metrics().save_session_report(session_name)
+
+    return {
+        "service": transcript.service_name,
+        "whisper_model": f"{transcription_service.whisper_model_name} ({transcription_service.whisper_quantization})",
+        "text_file_path": text_file_path,
+        "pdf_file_path": pdf_file_path,
+        "extra_file_paths": extra_file_paths,
+        "wall_seconds": time.perf_counter() - start_time
+    }
+
+def run_batch(recording_dirs=None, model_name=None, worker_count=None, transcripts_dir=None, manifest_path=None,
+              strategy=None, force=False):
+    model_name = model_name or config.WHISPER_MODEL
+    worker_count = worker_count or estimate_worker_count(model_name)
+    manifest = BatchManifest(manifest_path)
+
+    recordings = discover_recordings(recording_dirs)
+    pending_recordings = [
+        recording for recording in recordings
+        if force or not manifest.is_completed(build_manifest_key(recording, model_name))
+    ]
+    print(f"Found {len(recordings)} recordings, {len(pending_recordings)} to transcribe "
+          f"with {worker_count} workers ({model_name})")
+
+    summary = {
+        "model": model_name,
+        "workers": worker_count,
+        "recordings": len(recordings),
+        "skipped": len(recordings) - len(pending_recordings),
+        "completed": 0,
+        "failed": 0,
+        "audio_seconds": 0.0,
+        "wall_seconds": 0.0,
+        "audio_hours_per_wall_hour": 0.0
+    }
+    if not pending_recordings:
+        return summary
+
+    start_time = time.perf_counter()
+    executor = ProcessPoolExecutor(
+        max_workers=worker_count,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initialize_batch_worker,
+        initargs=(max(1, (os.cpu_count() or 1) // worker_count),)
+    )
+    try:
+        pending_work = {
+            executor.submit(transcribe_recording, recording, model_name, transcripts_dir, strategy): recording
+            for recording in pending_recordings
+        }
+        for finished_work in as_completed(pending_work):
+            recording = pending_work[finished_work]
+            entry = {
+                "key": build_manifest_key(recording, model_name),
+                "audio_file_path": recording["audio_file_path"],
+                "model": model_name,
+                "audio_seconds": recording["duration"]
+            }
+            try:
+                entry.update(finished_work.result(), status="completed")
+                summary["completed"] += 1
+                summary["audio_seconds"] += recording["duration"]
+            except Exception as error:
+                entry.update(status="failed", error=str(error))
+                summary["failed"] += 1
+            manifest.record(entry)
+
+            finished_count = summary["completed"] + summary["failed"]
+            print(f"[{finished_count}/{len(pending_recordings)}] {entry['status']}: "
+                  f"{os.path.basename(recording['audio_file_path'])} ({recording['duration'] / 60:.1f} min)")
+    finally:
+        executor.shutdown(cancel_futures=True)
+        summary["wall_seconds"] = time.perf_counter() - start_time
+        summary["audio_hours_per_wall_hour"] = summary["audio_seconds"] / max(summary["wall_seconds"], 1e-9)
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe a backlog of recordings without the web interface")
+    parser.add_argument("directories", nargs="*", help=f"Recording directories (default {config.RECORDINGS_DIR})")
+    parser.add_argument("--model", default=config.WHISPER_MODEL,
+                        help="Whisper model, or 'adaptive' to choose one per recording")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: sized to cores and memory)")
+    parser.add_argument("--strategy", default=config.TRANSCRIPTION_STRATEGY)
+    parser.add_argument("--transcripts-dir", default=config.TRANSCRIPTS_DIR)
+    parser.add_argument("--manifest", default=config.BATCH_MANIFEST_PATH)
+    parser.add_argument("--force", action="store_true", help="Transcribe recordings that are already completed")
+    arguments = parser.parse_args()
+    config.create_project_directories()
+
+    try:
+        summary = run_batch(arguments.directories or None, arguments.model, arguments.workers,
+                            arguments.transcripts_dir, arguments.manifest, arguments.strategy, arguments.force)
+    except KeyboardInterrupt:
+        print("Interrupted; completed recordings are kept in the manifest", file=sys.stderr)
+        sys.exit(130)
+
+    print(json.dumps(summary, indent=2))
+    if summary["wall_seconds"]:
+        print(f"Throughput: {summary['audio_hours_per_wall_hour']:.2f} audio-hours per wall-hour", file=sys.stderr)
+    if summary["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import os
+import json
+import queue
+import threading
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+import config
+
+HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+resolved_driver_path = None
+driver_path_lock = threading.Lock()
+
+def read_cached_driver_path():
+    try:
+        with open(config.CHROMEDRIVER_CACHE_PATH, 'r', encoding='utf-8') as cache_file:
+            driver_path = json.load(cache_file).get("driver_path")
+        return driver_path if driver_path and os.path.exists(driver_path) else None
+    except (OSError, ValueError):
+        return None
+
+def write_cached_driver_path(driver_path):
+    os.makedirs(os.path.dirname(config.CHROMEDRIVER_CACHE_PATH), exist_ok=True)
+    with open(config.CHROMEDRIVER_CACHE_PATH, 'w', encoding='utf-8') as cache_file:
+        json.dump({"driver_path": driver_path}, cache_file)
+
+def download_driver():
+    try:
+        return ChromeDriverManager(driver_version=config.CHROMEDRIVER_VERSION).install()
+    except Exception as error:
+        print(f"Pinned ChromeDriver download failed ({error}), trying latest...")
+        return ChromeDriverManager().install()
+
+def resolve_driver_path(refresh=False):
+    global resolved_driver_path
+    with driver_path_lock:
+        if config.CHROMEDRIVER_PATH:
+            return config.CHROMEDRIVER_PATH
+        if resolved_driver_path and not refresh:
+            return resolved_driver_path
+
+        driver_path = None if refresh else read_cached_driver_path()
+        if not driver_path:
+            driver_path = download_driver()
+            write_cached_driver_path(driver_path)
+
+        resolved_driver_path = driver_path
+        return driver_path
+
+def build_browser_options(headless=False):
+    browser_options = Options()
+    browser_options.add_experimental_option("detach", True)
+    browser_options.add_argument("--use-fake-ui-for-media-stream")
+    browser_options.add_argument("--start-maximized")
+    browser_options.add_argument("--no-sandbox")
+    browser_options.add_argument("--disable-dev-shm-usage")
+    if headless:
+        browser_options.add_argument("--headless=new")
+        browser_options.add_argument("--autoplay-policy=no-user-gesture-required")
+
+    media_permissions = {
+        "profile.default_content_setting_values": {
+            "media_stream_mic": 1,
+            "media_stream_camera": 1,
+            "notifications": 2
+        }
+    }
+    browser_options.add_experimental_option("prefs", media_permissions)
+    return browser_options
+
+def launch_browser(headless=False, environment=None):
+    service_environment = {**os.environ, **environment} if environment else None
+    try:
+        browser = webdriver.Chrome(service=Service(resolve_driver_path(), env=service_environment),
+                                   options=build_browser_options(headless))
+    except Exception as error:
+        print(f"Chrome launch failed ({error}), refreshing ChromeDriver...")
+        browser = webdriver.Chrome(service=Service(resolve_driver_path(refresh=True), env=service_environment),
+                                   options=build_browser_options(headless))
+
+    browser.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": HIDE_WEBDRIVER_SCRIPT})
+    browser.execute_script(HIDE_WEBDRIVER_SCRIPT)
+    return browser
+
+def reset_browser(browser):
+    browser.get("about:blank")
+    browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    browser.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "https://meet.google.com", "storageTypes": "all"})
+
+class BrowserPool:
+    def __init__(self, pool_size=None, headless=True, max_uses=None):
+        self.pool_size = pool_size or config.BROWSER_POOL_SIZE
+        self.headless = headless
+        self.max_uses = max_uses or config.BROWSER_POOL_MAX_USES
+        self.ready_browsers = queue.Queue()
+        self.use_counts = {}
+        self.lock = threading.Lock()
+        self.is_shut_down = False
+
+    def start(self):
+        for _ in range(self.pool_size):
+            self.launch_in_background()
+
+    def launch_in_background(self):
+        threading.Thread(target=self.launch_ready_browser, daemon=True).start()
+
+    def launch_ready_browser(self):
+        if self.is_shut_down or self.ready_browsers.qsize() >= self.pool_size:
+            return
+
+        try:
+            browser = launch_browser(self.headless)
+        except Exception as error:
+            print(f"Pre-launching browser failed: {error}")
+            return
+
+        with self.lock:
+            if self.is_shut_down:
+                browser.quit()
+                return
+            self.use_counts[id(browser)] = 0
+        self.ready_browsers.put(browser)
+
+    def acquire(self, timeout=None):
+        try:
+            browser = self.ready_browsers.get(timeout=timeout or config.BROWSER_POOL_ACQUIRE_TIMEOUT)
+        except queue.Empty:
+            print("No warm browser available, launching a cold one")
+            browser = launch_browser(self.headless)
+            with self.lock:
+                self.use_counts[id(browser)] = 0
+
+        with self.lock:
+            self.use_counts[id(browser)] += 1
+        self.launch_in_background()
+        return browser
+
+    def release(self, browser):
+        with self.lock:
+            use_count = self.use_counts.get(id(browser), self.max_uses)
+            reusable = (
+                not self.is_shut_down
+                and use_count < self.max_uses
+                and self.ready_browsers.qsize() < self.pool_size
+            )
+
+        if reusable:
+            try:
+                reset_browser(browser)
+                self.ready_browsers.put(browser)
+                return
+            except Exception as error:
+                print(f"Browser reset failed, discarding it: {error}")
+
+        self.discard(browser)
+
+    def discard(self, browser):
+        with self.lock:
+            self.use_counts.pop(id(browser), None)
+        try:
+            browser.quit()
+        except Exception as error:
+            print(f"Browser quit failed: {error}")
+
+    def shutdown(self):
+        with self.lock:
+            self.is_shut_down = True
+        while not self.ready_browsers.empty():
+            self.discard(self.ready_browsers.get_nowait())
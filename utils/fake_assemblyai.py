@@ -0,0 +1,133 @@
+import json
+import time
+import uuid
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class FakeAssemblyAIHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, payload, status_code=200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        fake_server = self.server.fake_server
+        if self.path == "/v2/upload":
+            upload_size = len(self.read_body())
+            time.sleep(fake_server.upload_seconds_per_mb * upload_size / (1024 * 1024))
+            upload_id = uuid.uuid4().hex
+            fake_server.uploaded_bytes += upload_size
+            self.send_json({"upload_url": f"{fake_server.base_url}/files/{upload_id}"})
+        elif self.path == "/v2/transcript":
+            request = json.loads(self.read_body() or b"{}")
+            transcript_id = uuid.uuid4().hex
+            fake_server.transcripts[transcript_id] = {
+                "audio_url": request.get("audio_url"),
+                "created_at": time.time()
+            }
+            self.send_json(fake_server.describe_transcript(transcript_id))
+        else:
+            self.send_json({"error": "Not found"}, 404)
+
+    def do_GET(self):
+        transcript_id = self.path.rsplit('/', 1)[-1]
+        if self.path.startswith("/v2/transcript/") and transcript_id in self.server.fake_server.transcripts:
+            self.send_json(self.server.fake_server.describe_transcript(transcript_id))
+        else:
+            self.send_json({"error": "Transcript not found"}, 404)
+
+    def do_DELETE(self):
+        transcript_id = self.path.rsplit('/', 1)[-1]
+        fake_server = self.server.fake_server
+        if transcript_id in fake_server.transcripts:
+            fake_server.deleted_ids.append(transcript_id)
+            self.send_json(fake_server.describe_transcript(transcript_id))
+        else:
+            self.send_json({"error": "Transcript not found"}, 404)
+
+class FakeAssemblyAIServer:
+    def __init__(self, transcript_text="This is a transcript from the local AssemblyAI stand-in.",
+                 processing_seconds=1.0, upload_seconds_per_mb=0.0, fail=False, host="127.0.0.1", port=0):
+        self.transcript_text = transcript_text
+        self.processing_seconds = processing_seconds
+        self.upload_seconds_per_mb = upload_seconds_per_mb
+        self.fail = fail
+        self.transcripts = {}
+        self.deleted_ids = []
+        self.uploaded_bytes = 0
+        self.http_server = ThreadingHTTPServer((host, port), FakeAssemblyAIHandler)
+        self.http_server.fake_server = self
+        self.server_thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def describe_transcript(self, transcript_id):
+        transcript = self.transcripts[transcript_id]
+        is_finished = time.time() - transcript["created_at"] >= self.processing_seconds
+        response = {"id": transcript_id, "audio_url": transcript["audio_url"], "status": "processing", "text": None}
+
+        if is_finished and self.fail:
+            response.update({"status": "error", "error": "Simulated transcription failure"})
+        elif is_finished:
+            response.update({"status": "completed", "text": self.transcript_text, "confidence": 0.9,
+                             "words": self.build_words()})
+        return response
+
+    def build_words(self):
+        return [
+            {"text": word, "start": index * 400, "end": index * 400 + 350, "confidence": 0.9}
+            for index, word in enumerate(self.transcript_text.split())
+        ]
+
+    def start(self):
+        self.server_thread = threading.Thread(target=self.http_server.serve_forever, daemon=True)
+        self.server_thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.http_server.shutdown()
+        self.http_server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the AssemblyAI transcription API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--processing-seconds", type=float, default=1.0)
+    parser.add_argument("--upload-seconds-per-mb", type=float, default=0.0)
+    parser.add_argument("--fail", action="store_true")
+    arguments = parser.parse_args()
+
+    fake_server = FakeAssemblyAIServer(
+        processing_seconds=arguments.processing_seconds,
+        upload_seconds_per_mb=arguments.upload_seconds_per_mb,
+        fail=arguments.fail,
+        port=arguments.port
+    )
+    print(f"Fake AssemblyAI listening on {fake_server.base_url}")
+    print(f"Set ASSEMBLYAI_BASE_URL={fake_server.base_url} and any ASSEMBLYAI_API_KEY to use it")
+    try:
+        fake_server.http_server.serve_forever()
+    except KeyboardInterrupt:
+        fake_server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,30 @@
 import os
 from datetime import datetime
-from fpdf import FPDF
+import config
+from utils.transcript_export import TranscriptExporter, iter_text_lines
+from utils.metrics import get_metrics
+from utils.transcript_index import get_transcript_index
+from utils.transcript_model import Transcript, RENDERERS
 
 class FileGenerator:
+    def __init__(self, transcripts_dir=None, exporter=None, transcript_index=None):
+        self.transcripts_dir = transcripts_dir or config.TRANSCRIPTS_DIR
+        self.exporter = exporter or TranscriptExporter()
+        self.transcript_index = transcript_index
+        if transcript_index is None and config.TRANSCRIPT_INDEX_ENABLED:
+            self.transcript_index = get_transcript_index()
+    
     def create_text_file(self, transcript_content, session_name):
         try:
-            text_folder = 'assets/transcripts/text'
-            os.makedirs(text_folder, exist_ok=True)
-            
             current_time = datetime.now()
-            timestamp = current_time.strftime('%Y%m%d_%H%M%S')
-            text_filename = f"{text_folder}/transcript_{timestamp}_{session_name}.txt"
-            
-            header_content = self.build_transcript_header(session_name, current_time)
-            complete_content = header_content + transcript_content
-            
-            with open(text_filename, 'w', encoding='utf-8') as text_file:
-                text_file.write(complete_content)
+            text_filename = self.build_output_path('text', 'txt', session_name, current_time)
             
+            self.exporter.export(
+                self.iter_segments(transcript_content),
+                text_file_path=text_filename,
+                header_text=self.build_transcript_header(session_name, current_time, transcript_content)
+            )
+            self.index_transcript(text_filename, session_name)
             return text_filename
             
         except Exception as error:
@@ -26,55 +33,99 @@ class FileGenerator:
     
     def create_pdf_file(self, transcript_content, session_name):
         try:
-            pdf_folder = 'assets/transcripts/pdf'
-            os.makedirs(pdf_folder, exist_ok=True)
-            
             current_time = datetime.now()
-            timestamp = current_time.strftime('%Y%m%d_%H%M%S')
-            pdf_filename = f"{pdf_folder}/transcript_{timestamp}_{session_name}.pdf"
-            
-            pdf_document = FPDF()
-            pdf_document.add_page()
+            pdf_filename = self.build_output_path('pdf', 'pdf', session_name, current_time)
             
-            self.add_pdf_header(pdf_document, current_time, session_name)
-            self.add_pdf_content(pdf_document, transcript_content)
-            
-            pdf_document.output(pdf_filename)
+            self.exporter.export(
+                self.iter_segments(transcript_content),
+                pdf_file_path=pdf_filename,
+                pdf_header_lines=self.build_pdf_header_lines(session_name, current_time, transcript_content)
+            )
             return pdf_filename
             
         except Exception as error:
             print(f"Failed to create PDF file: {error}")
             return None
     
-    def build_transcript_header(self, session_name, creation_time):
+    def create_transcript_files(self, transcript_content, session_name):
+        try:
+            current_time = datetime.now()
+            text_filename = self.build_output_path('text', 'txt', session_name, current_time)
+            pdf_filename = self.build_output_path('pdf', 'pdf', session_name, current_time)
+            
+            with get_metrics().span("export", session_name):
+                output_paths = self.exporter.export(
+                    self.iter_segments(transcript_content),
+                    text_file_path=text_filename,
+                    pdf_file_path=pdf_filename,
+                    header_text=self.build_transcript_header(session_name, current_time, transcript_content),
+                    pdf_header_lines=self.build_pdf_header_lines(session_name, current_time, transcript_content)
+                )
+            self.index_transcript(text_filename, session_name)
+            return output_paths
+            
+        except Exception as error:
+            print(f"Failed to create transcript files: {error}")
+            return None, None
+    
+    def create_structured_files(self, transcript, session_name, formats=None):
+        output_paths = {}
+        current_time = datetime.now()
+        for output_format in formats or config.EXPORT_EXTRA_FORMATS:
+            try:
+                output_filename = self.build_output_path(output_format, output_format, session_name, current_time)
+                with get_metrics().span("export", session_name, format=output_format):
+                    with open(output_filename, 'w', encoding='utf-8') as output_file:
+                        output_file.writelines(RENDERERS[output_format](transcript))
+                output_paths[output_format] = output_filename
+            except Exception as error:
+                print(f"Failed to create {output_format.upper()} file: {error}")
+        return output_paths
+    
+    def index_transcript(self, text_filename, session_name):
+        if not self.transcript_index:
+            return
+        try:
+            with get_metrics().span("index", session_name):
+                self.transcript_index.index_text_file(text_filename, session_name)
+        except Exception as error:
+            print(f"Failed to index transcript: {error}")
+    
+    def iter_segments(self, transcript_content):
+        if isinstance(transcript_content, str):
+            return iter_text_lines(transcript_content)
+        return iter(transcript_content)
+    
+    def build_output_path(self, folder_name, extension, session_name, creation_time):
+        output_folder = os.path.join(self.transcripts_dir, folder_name)
+        os.makedirs(output_folder, exist_ok=True)
+        
+        timestamp = creation_time.strftime('%Y%m%d_%H%M%S')
+        return f"{output_folder}/transcript_{timestamp}_{session_name}.{extension}"
+    
+    def build_transcript_header(self, session_name, creation_time, transcript_content=None):
         formatted_date = creation_time.strftime('%Y-%m-%d %H:%M:%S')
+        transcript_details = "".join(f"{line}\n" for line in self.build_transcript_details(transcript_content))
         
         header = f"""Meeting Transcript
 Generated: {formatted_date}
 Session: {session_name}
-{'='*60}
+{transcript_details}{'='*60}
 
 """
         return header
     
-    def add_pdf_header(self, pdf_doc, creation_time, session_name):
-        pdf_doc.set_font("Arial", "B", 16)
-        pdf_doc.cell(0, 10, "Meeting Transcript", ln=True, align='C')
-        pdf_doc.ln(3)
-        
-        pdf_doc.set_font("Arial", size=10)
-        pdf_doc.cell(0, 8, f"Generated: {creation_time.strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
-        pdf_doc.cell(0, 8, f"Session: {session_name}", ln=True)
-        pdf_doc.ln(8)
+    def build_pdf_header_lines(self, session_name, creation_time, transcript_content=None):
+        return [
+            f"Generated: {creation_time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Session: {session_name}",
+            *self.build_transcript_details(transcript_content)
+        ]
     
-    def add_pdf_content(self, pdf_doc, transcript_text):
-        pdf_doc.set_font("Arial", size=11)
-        text_lines = transcript_text.split('\n')
-        
-        for line in text_lines:
-            if pdf_doc.get_y() > 270:
-                pdf_doc.add_page()
-            
-            clean_line = line.encode('latin-1', 'replace').decode('latin-1')
-            display_line = clean_line[:85] if len(clean_line) > 85 else clean_line
-            pdf_doc.cell(0, 6, display_line, ln=True)
+    def build_transcript_details(self, transcript_content):
+        if not isinstance(transcript_content, Transcript):
+            return []
+        return [
+            f"Service: {transcript_content.service_name}",
+            f"Duration: {transcript_content.duration:.1f}s"
+        ]
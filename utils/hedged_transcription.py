@@ -0,0 +1,156 @@
+import os
+import asyncio
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import config
+from utils.model_cache import WHISPER_AVAILABLE
+from utils.audio_processing import WHISPER_SAMPLE_RATE, load_whisper_audio
+from utils.parallel_transcription import split_at_silences
+from utils.transcript_model import Transcript
+from utils.vad import trim_silence
+from utils.metrics import get_metrics
+
+try:
+    import assemblyai as aai
+    ASSEMBLYAI_AVAILABLE = True
+except ImportError:
+    ASSEMBLYAI_AVAILABLE = False
+
+def is_acceptable_transcript(text):
+    return bool(text) and len(text.strip()) > 10
+
+class HedgedTranscriber:
+    def __init__(self, transcription_service, hedge_delay=None, poll_interval=None):
+        self.transcription_service = transcription_service
+        self.hedge_delay = config.HEDGE_DELAY_SECONDS if hedge_delay is None else hedge_delay
+        self.poll_interval = poll_interval or config.ASSEMBLYAI_POLL_INTERVAL
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hedged-transcription")
+        self.metrics = get_metrics()
+
+    async def run_in_thread(self, function, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(function, *args, **kwargs))
+
+    async def run_assemblyai(self, audio_file_path):
+        upload_file_path = None
+        offset_map = None
+        transcript = None
+        try:
+            if config.VAD_ENABLED:
+                upload_file_path, offset_map = await self.run_in_thread(
+                    self.transcription_service.write_upload_file, audio_file_path
+                )
+
+            assemblyai_client = self.transcription_service.assemblyai_client
+            transcript = await self.run_in_thread(assemblyai_client.submit, upload_file_path or audio_file_path)
+            while transcript.status not in (aai.TranscriptStatus.completed, aai.TranscriptStatus.error):
+                await asyncio.sleep(self.poll_interval)
+                transcript = await self.run_in_thread(aai.Transcript.get_by_id, transcript.id)
+
+            if transcript.status == aai.TranscriptStatus.error:
+                print(f"AssemblyAI failed: {transcript.error}")
+                return None
+            return self.transcription_service.build_assemblyai_transcript(transcript, offset_map)
+
+        except asyncio.CancelledError:
+            if transcript and transcript.id:
+                self.executor.submit(self.delete_remote_transcript, transcript.id)
+            raise
+        finally:
+            if upload_file_path and os.path.exists(upload_file_path):
+                try:
+                    os.remove(upload_file_path)
+                except OSError:
+                    pass
+
+    def delete_remote_transcript(self, transcript_id):
+        try:
+            aai.Transcript.delete_by_id(transcript_id)
+        except Exception as error:
+            print(f"Could not cancel AssemblyAI transcript {transcript_id}: {error}")
+
+    async def run_whisper(self, audio_file_path):
+        transcription_service = self.transcription_service
+        speech_audio = await self.run_in_thread(load_whisper_audio, audio_file_path)
+        offset_map = None
+        if config.VAD_ENABLED:
+            speech_audio, offset_map = await self.run_in_thread(trim_silence, speech_audio)
+
+        whisper_model = await self.run_in_thread(transcription_service.get_whisper_model)
+
+        transcript = Transcript("Whisper")
+        for segment_start, segment_end in split_at_silences(speech_audio):
+            result = await self.run_in_thread(
+                whisper_model.transcribe, speech_audio[segment_start:segment_end], fp16=False,
+                word_timestamps=config.WHISPER_WORD_TIMESTAMPS
+            )
+            chunk_transcript = Transcript.from_whisper_result(result)
+            chunk_transcript.shift(segment_start / WHISPER_SAMPLE_RATE)
+            transcript.extend(chunk_transcript)
+
+        if offset_map:
+            transcript.remap_times(offset_map.to_original_time)
+        return transcript
+
+    async def timed(self, backend_run, backend_name):
+        with self.metrics.span("transcribe", self.transcription_service.session_name, backend=backend_name,
+                               hedged=True):
+            return await backend_run
+
+    async def transcribe(self, audio_file_path):
+        running_backends = {}
+        whisper_started = False
+
+        session_name = self.transcription_service.session_name
+
+        def start_whisper():
+            whisper_run = self.run_whisper(audio_file_path)
+            running_backends[asyncio.create_task(self.timed(whisper_run, "whisper"))] = "Whisper"
+
+        if ASSEMBLYAI_AVAILABLE and self.transcription_service.assemblyai_client:
+            assemblyai_run = self.run_assemblyai(audio_file_path)
+            running_backends[asyncio.create_task(self.timed(assemblyai_run, "assemblyai"))] = "AssemblyAI"
+
+        try:
+            while running_backends or (WHISPER_AVAILABLE and not whisper_started):
+                if WHISPER_AVAILABLE and not whisper_started and (not running_backends or self.hedge_delay <= 0):
+                    start_whisper()
+                    whisper_started = True
+
+                hedge_timeout = self.hedge_delay if WHISPER_AVAILABLE and not whisper_started else None
+                finished_backends, _ = await asyncio.wait(
+                    running_backends, timeout=hedge_timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not finished_backends:
+                    print(f"No transcript after {self.hedge_delay}s, starting Whisper alongside AssemblyAI")
+                    self.metrics.increment("hedges", session=session_name)
+                    start_whisper()
+                    whisper_started = True
+                    continue
+
+                for finished_backend in finished_backends:
+                    service_name = running_backends.pop(finished_backend)
+                    if finished_backend.exception():
+                        print(f"{service_name} failed: {finished_backend.exception()}")
+                        continue
+                    transcript = finished_backend.result()
+                    if transcript and is_acceptable_transcript(transcript.text):
+                        return transcript, service_name
+
+                if WHISPER_AVAILABLE and not whisper_started:
+                    start_whisper()
+                    whisper_started = True
+
+            return None, None
+
+        finally:
+            for running_backend in running_backends:
+                running_backend.cancel()
+            await asyncio.gather(*running_backends, return_exceptions=True)
+
+    def transcribe_sync(self, audio_file_path):
+        try:
+            return asyncio.run(self.transcribe(audio_file_path))
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
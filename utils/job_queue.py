@@ -0,0 +1,282 @@
+import os
+import json
+import time
+import sqlite3
+import argparse
+import threading
+import multiprocessing
+from contextlib import contextmanager
+import config
+from utils.metrics import get_metrics
+from utils.transcript_model import LIVE_SERVICE_NAME, Transcript
+
+JOB_COLUMNS = [
+    "job_id", "session_name", "audio_file_path", "live_transcript", "status", "stage", "progress",
+    "attempts", "max_attempts", "error", "result", "worker_id", "available_at", "lease_expires_at",
+    "created_at", "updated_at"
+]
+
+class JobQueue:
+    def __init__(self, database_path=None):
+        self.database_path = database_path or config.JOB_QUEUE_PATH
+        os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_name TEXT NOT NULL,
+                    audio_file_path TEXT NOT NULL,
+                    live_transcript TEXT,
+                    status TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    progress REAL NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    error TEXT,
+                    result TEXT,
+                    worker_id TEXT,
+                    available_at REAL NOT NULL,
+                    lease_expires_at REAL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, available_at)")
+
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def enqueue(self, session_name, audio_file_path, live_transcript=None, max_attempts=None):
+        now = time.time()
+        if isinstance(live_transcript, str):
+            live_transcript = Transcript.from_text(live_transcript, LIVE_SERVICE_NAME)
+        if live_transcript is not None:
+            live_transcript = json.dumps(live_transcript.to_dict())
+        with self.connect() as connection:
+            cursor = connection.execute(
+                """INSERT INTO jobs (session_name, audio_file_path, live_transcript, status, stage, max_attempts,
+                                     available_at, created_at, updated_at)
+                   VALUES (?, ?, ?, 'queued', 'queued', ?, ?, ?, ?)""",
+                (session_name, audio_file_path, live_transcript, max_attempts or config.JOB_MAX_ATTEMPTS,
+                 now, now, now)
+            )
+            return cursor.lastrowid
+
+    def claim(self, worker_id):
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    """UPDATE jobs SET status = 'failed', stage = 'failed', lease_expires_at = NULL, updated_at = ?,
+                                      error = COALESCE(error, 'Worker stopped before finishing (lease expired)')
+                       WHERE status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts""",
+                    (now, now)
+                )
+                row = connection.execute(
+                    """SELECT job_id FROM jobs
+                       WHERE (status = 'queued' AND available_at <= ?)
+                          OR (status = 'running' AND lease_expires_at < ? AND attempts < max_attempts)
+                       ORDER BY created_at LIMIT 1""",
+                    (now, now)
+                ).fetchone()
+                if row:
+                    connection.execute(
+                        """UPDATE jobs SET status = 'running', stage = 'starting', progress = 0,
+                                          attempts = attempts + 1, worker_id = ?, lease_expires_at = ?,
+                                          updated_at = ?
+                           WHERE job_id = ?""",
+                        (worker_id, now + config.JOB_LEASE_SECONDS, now, row[0])
+                    )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+        return self.get_job(row[0]) if row else None
+
+    def update_progress(self, job_id, stage, progress):
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET stage = ?, progress = ?, lease_expires_at = ?, updated_at = ? WHERE job_id = ?",
+                (stage, progress, now + config.JOB_LEASE_SECONDS, now, job_id)
+            )
+
+    def extend_lease(self, job_id):
+        now = time.time()
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE jobs SET lease_expires_at = ?, updated_at = ? WHERE job_id = ? AND status = 'running'",
+                (now + config.JOB_LEASE_SECONDS, now, job_id)
+            )
+
+    def complete(self, job_id, result):
+        with self.connect() as connection:
+            connection.execute(
+                """UPDATE jobs SET status = 'completed', stage = 'completed', progress = 1, result = ?,
+                                  error = NULL, lease_expires_at = NULL, updated_at = ?
+                   WHERE job_id = ?""",
+                (json.dumps(result), time.time(), job_id)
+            )
+
+    def fail(self, job_id, error_message):
+        now = time.time()
+        job = self.get_job(job_id)
+        should_retry = job["attempts"] < job["max_attempts"]
+        get_metrics().increment("job_retries" if should_retry else "job_failures", session=job["session_name"])
+        retry_delay = config.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job["attempts"] - 1)
+
+        with self.connect() as connection:
+            connection.execute(
+                """UPDATE jobs SET status = ?, stage = ?, error = ?, available_at = ?, lease_expires_at = NULL,
+                                  updated_at = ?
+                   WHERE job_id = ?""",
+                ("queued" if should_retry else "failed", "retrying" if should_retry else "failed",
+                 error_message, now + retry_delay, now, job_id)
+            )
+
+    def get_job(self, job_id):
+        with self.connect() as connection:
+            row = connection.execute(f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs WHERE job_id = ?",
+                                     (job_id,)).fetchone()
+        return self.row_to_job(row) if row else None
+
+    def list_jobs(self, limit=20):
+        with self.connect() as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs ORDER BY job_id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self.row_to_job(row) for row in rows]
+
+    def row_to_job(self, row):
+        job = dict(zip(JOB_COLUMNS, row))
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+def process_job(job_queue, job):
+    from utils.transcription import TranscriptionService
+    from utils.file_generator import FileGenerator
+
+    job_id = job["job_id"]
+    live_transcript = None
+    if job["live_transcript"]:
+        live_transcript = Transcript.from_dict(json.loads(job["live_transcript"]))
+
+    job_queue.update_progress(job_id, "transcribing", 0.1)
+    transcription_service = TranscriptionService(session_name=job["session_name"])
+    transcript, audio_info = transcription_service.transcribe(job["audio_file_path"], live_transcript=live_transcript)
+    transcript_text = transcription_service.create_message(transcript, job["audio_file_path"], audio_info)
+
+    job_queue.update_progress(job_id, "exporting", 0.8)
+    file_generator = FileGenerator()
+    text_file_path, pdf_file_path = file_generator.create_transcript_files(
+        transcript or transcript_text,
+        job["session_name"]
+    )
+    if not text_file_path or not pdf_file_path:
+        raise RuntimeError("Transcript export failed")
+    extra_file_paths = file_generator.create_structured_files(transcript, job["session_name"]) if transcript else {}
+
+    return {
+        "audio_file_path": job["audio_file_path"],
+        "transcript_text": transcript_text,
+        "text_file_path": text_file_path,
+        "pdf_file_path": pdf_file_path,
+        "extra_file_paths": extra_file_paths
+    }
+
+def run_worker(database_path=None, worker_id=None, stop_when_idle=False):
+    job_queue = JobQueue(database_path)
+    worker_id = worker_id or f"worker-{os.getpid()}"
+    print(f"Job worker {worker_id} started")
+
+    while True:
+        job = job_queue.claim(worker_id)
+        if not job:
+            if stop_when_idle:
+                return
+            time.sleep(config.JOB_POLL_INTERVAL)
+            continue
+
+        print(f"{worker_id} processing job {job['job_id']} (attempt {job['attempts']})")
+        claimed_at = time.time()
+        get_metrics().record_duration("queue_wait", claimed_at - job["available_at"], claimed_at,
+                                      job["session_name"])
+        job_finished = threading.Event()
+        heartbeat_thread = threading.Thread(
+            target=keep_lease_alive, args=(job_queue, job["job_id"], job_finished), daemon=True
+        )
+        heartbeat_thread.start()
+        try:
+            job_queue.complete(job["job_id"], process_job(job_queue, job))
+        except Exception as error:
+            print(f"Job {job['job_id']} failed: {error}")
+            job_queue.fail(job["job_id"], str(error))
+        finally:
+            job_finished.set()
+            heartbeat_thread.join()
+            get_metrics().save_session_report(job["session_name"])
+
+def keep_lease_alive(job_queue, job_id, job_finished):
+    while not job_finished.wait(config.JOB_LEASE_SECONDS / 3):
+        job_queue.extend_lease(job_id)
+
+class JobWorkerPool:
+    def __init__(self, worker_count=None, database_path=None):
+        self.worker_count = worker_count or config.JOB_WORKERS
+        self.database_path = database_path or config.JOB_QUEUE_PATH
+        self.worker_processes = []
+
+    def start(self):
+        process_context = multiprocessing.get_context("spawn")
+        for worker_number in range(self.worker_count):
+            worker_process = process_context.Process(
+                target=run_worker,
+                args=(self.database_path, f"worker-{os.getpid()}-{worker_number}"),
+                daemon=True
+            )
+            worker_process.start()
+            self.worker_processes.append(worker_process)
+        return self
+
+    def ensure_running(self):
+        for index, worker_process in enumerate(self.worker_processes):
+            if not worker_process.is_alive():
+                print(f"Restarting job worker {index}")
+                process_context = multiprocessing.get_context("spawn")
+                self.worker_processes[index] = process_context.Process(
+                    target=run_worker,
+                    args=(self.database_path, f"worker-{os.getpid()}-{index}"),
+                    daemon=True
+                )
+                self.worker_processes[index].start()
+
+    def stop(self):
+        for worker_process in self.worker_processes:
+            worker_process.terminate()
+        for worker_process in self.worker_processes:
+            worker_process.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run post-meeting processing workers")
+    parser.add_argument("--workers", type=int, default=config.JOB_WORKERS)
+    parser.add_argument("--database", default=config.JOB_QUEUE_PATH)
+    arguments = parser.parse_args()
+    config.create_project_directories()
+
+    worker_pool = JobWorkerPool(arguments.workers, arguments.database).start()
+    try:
+        while True:
+            time.sleep(5)
+            worker_pool.ensure_running()
+    except KeyboardInterrupt:
+        worker_pool.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import queue
+import threading
+import numpy as np
+import config
+from utils.model_cache import WHISPER_AVAILABLE, get_model_cache
+from utils.audio_processing import resample_audio, find_quietest_frame, int16_to_float
+from utils.metrics import get_metrics
+from utils.transcript_model import LIVE_SERVICE_NAME, Transcript
+
+class LiveTranscriber:
+    def __init__(self, sample_rate, model_name=None, model_cache=None, session_name=None):
+        self.sample_rate = sample_rate
+        self.session_name = session_name
+        self.metrics = get_metrics()
+        self.model_name = model_name
+        self.model_cache = model_cache or get_model_cache()
+        self.window_frames = int(config.LIVE_WINDOW_SECONDS * sample_rate)
+        self.overlap_frames = int(config.LIVE_OVERLAP_SECONDS * sample_rate)
+        self.pending_chunks = []
+        self.pending_frames = 0
+        self.overlap_audio = np.zeros(0, dtype=np.float32)
+        self.window_start_frame = 0
+        self.window_queue = queue.Queue()
+        self.worker_thread = None
+        self.transcript = Transcript(LIVE_SERVICE_NAME)
+        self.segments_lock = threading.Lock()
+
+    def start(self):
+        if not WHISPER_AVAILABLE:
+            print("Whisper not installed, live transcription disabled")
+            return False
+
+        self.worker_thread = threading.Thread(target=self.process_windows, daemon=True)
+        self.worker_thread.start()
+        return True
+
+    def add_audio(self, audio_data):
+        if audio_data.dtype == np.int16:
+            audio_data = int16_to_float(audio_data)
+        mono_audio = audio_data.mean(axis=1) if audio_data.ndim > 1 else audio_data
+        self.pending_chunks.append(mono_audio.astype(np.float32))
+        self.pending_frames += len(mono_audio)
+
+        if self.pending_frames >= self.window_frames:
+            pending_audio = np.concatenate(self.pending_chunks)
+            cut_frame = find_quietest_frame(
+                pending_audio,
+                self.window_frames // 2,
+                self.window_frames,
+                int(config.LIVE_SILENCE_FRAME_SECONDS * self.sample_rate)
+            )
+            self.submit_window(pending_audio[:cut_frame])
+
+            remaining_audio = pending_audio[cut_frame:]
+            self.pending_chunks = [remaining_audio]
+            self.pending_frames = len(remaining_audio)
+
+    def submit_window(self, window_audio):
+        overlap_seconds = len(self.overlap_audio) / self.sample_rate
+        window_start = self.window_start_frame / self.sample_rate - overlap_seconds
+        full_window = np.concatenate((self.overlap_audio, window_audio))
+
+        self.window_queue.put((resample_audio(full_window, self.sample_rate), window_start, overlap_seconds))
+
+        self.window_start_frame += len(window_audio)
+        self.overlap_audio = window_audio[-self.overlap_frames:] if self.overlap_frames else self.overlap_audio[:0]
+
+    def process_windows(self):
+        while True:
+            window = self.window_queue.get()
+            if window is None:
+                break
+
+            try:
+                with self.metrics.span("live_window", self.session_name):
+                    self.transcribe_window(*window)
+            except Exception as error:
+                print(f"Live transcription window failed: {error}")
+
+    def transcribe_window(self, window_audio, window_start, overlap_seconds):
+        whisper_model = self.model_cache.get_model(self.model_name)
+        result = whisper_model.transcribe(
+            window_audio,
+            fp16=False,
+            word_timestamps=config.WHISPER_WORD_TIMESTAMPS,
+            initial_prompt=self.get_partial_transcript()[-200:] or None
+        )
+
+        with self.segments_lock:
+            for segment in result["segments"]:
+                if (segment["start"] + segment["end"]) / 2 < overlap_seconds:
+                    continue
+                self.transcript.add_segment(
+                    window_start + segment["start"],
+                    window_start + segment["end"],
+                    segment["text"],
+                    [(window_start + word["start"], window_start + word["end"], word["word"])
+                     for word in segment.get("words", [])]
+                )
+
+    def get_partial_transcript(self):
+        with self.segments_lock:
+            return self.transcript.text
+
+    def finish(self):
+        if self.pending_frames:
+            self.submit_window(np.concatenate(self.pending_chunks))
+            self.pending_chunks = []
+            self.pending_frames = 0
+
+        self.window_queue.put(None)
+        if self.worker_thread:
+            self.worker_thread.join()
+
+        return self.transcript
@@ -1,164 +1,169 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from utils.browser_pool import launch_browser
 from utils.audio_recorder import AudioRecorder
-import time
+from utils.audio_sources import create_audio_source
+from utils.live_transcription import LiveTranscriber
+from utils.selector_stats import PROBE_SELECTORS_SCRIPT, get_selector_stats
+from utils.metrics import get_metrics
 import config
 
+MICROPHONE_SELECTORS = [
+    ("CSS", '[aria-label*="microphone"]'),
+    ("CSS", '[aria-label*="Turn off microphone"]'),
+    ("CSS", '[data-testid*="mic"]'),
+    ("CSS", 'div[aria-label*="Mute"]')
+]
+
+CAMERA_SELECTORS = [
+    ("CSS", '[aria-label*="camera"]'),
+    ("CSS", '[aria-label*="Turn off camera"]'),
+    ("CSS", '[data-testid*="camera"]'),
+    ("CSS", 'div[aria-label*="camera off"]')
+]
+
+JOIN_BUTTON_SELECTORS = [
+    ("XPATH", "//span[contains(text(), 'Join now')]"),
+    ("XPATH", "//span[contains(text(), 'Ask to join')]"),
+    ("XPATH", "//div[contains(text(), 'Join now')]"),
+    ("CSS", "[data-testid='join-button']"),
+    ("CSS", "button[jsname='Qx7uuf']")
+]
+
+LEAVE_BUTTON_SELECTORS = [
+    ("CSS", '[aria-label*="Leave call"]'),
+    ("CSS", '[data-testid*="leave"]'),
+    ("CSS", 'button[aria-label*="Leave call"]')
+]
+
 class GoogleMeetBot:
-    def __init__(self):
+    def __init__(self, recordings_dir=None, audio_device=None, headless=None, browser_pool=None,
+                 session_name=None, audio_source=None):
+        self.recordings_dir = recordings_dir or config.RECORDINGS_DIR
+        self.audio_device = audio_device
+        self.audio_source = audio_source or create_audio_source(device=audio_device, session_name=session_name)
+        self.headless = config.BROWSER_HEADLESS if headless is None else headless
+        self.browser_pool = browser_pool
         self.browser = None
+        self.browser_is_pooled = False
         self.audio_recorder = None
+        self.live_transcriber = None
         self.meeting_is_active = False
+        self.selector_stats = get_selector_stats()
+        self.metrics = get_metrics()
+        self.session_name = session_name
         
     def setup_browser(self):
-        browser_options = Options()
-        browser_options.add_experimental_option("detach", True)
-        browser_options.add_argument("--use-fake-ui-for-media-stream")
-        browser_options.add_argument("--start-maximized")
-        browser_options.add_argument("--no-sandbox")
-        browser_options.add_argument("--disable-dev-shm-usage")
-        
-        media_permissions = {
-            "profile.default_content_setting_values": {
-                "media_stream_mic": 1,
-                "media_stream_camera": 1,
-                "notifications": 2
-            }
-        }
-        browser_options.add_experimental_option("prefs", media_permissions)
-        
         try:
-            print("Setting up Chrome browser...")
-            chrome_service = Service(ChromeDriverManager(driver_version="139.0.7258.80").install())
-            self.browser = webdriver.Chrome(service=chrome_service, options=browser_options)
-            
-            self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            browser_environment = self.audio_source.browser_environment()
+            self.browser_is_pooled = bool(self.browser_pool) and not browser_environment
+            with self.metrics.span("browser_setup", self.session_name, pooled=self.browser_is_pooled):
+                if self.browser_is_pooled:
+                    print("Taking Chrome browser from pool...")
+                    self.browser = self.browser_pool.acquire()
+                else:
+                    print("Setting up Chrome browser...")
+                    self.browser = launch_browser(self.headless, browser_environment)
             
             print("✅ Chrome setup successful")
             return True
             
         except Exception as error:
-            print("Chrome setup failed, trying fallback...")
-            try:
-                chrome_service = Service(ChromeDriverManager().install())
-                self.browser = webdriver.Chrome(service=chrome_service, options=browser_options)
-                self.browser.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                print("✅ Fallback Chrome working")
-                return True
-            except Exception as fallback_error:
-                print(f"Both attempts failed: {fallback_error}")
-                return False
+            print(f"Chrome setup failed: {error}")
+            return False
     
     def join_meeting(self, meeting_url):
         if not self.setup_browser():
             return False
         
         try:
-            print(f"Opening meeting: {meeting_url}")
-            self.browser.get(meeting_url)
-            time.sleep(8)
-            
-            print("Configuring audio and video...")
-            
-            self.turn_off_microphone()
-            self.turn_off_camera()
-            
-            print("Looking for join button...")
-            join_successful = self.attempt_to_join()
+            with self.metrics.span("join", self.session_name):
+                print(f"Opening meeting: {meeting_url}")
+                self.browser.get(meeting_url)
+                
+                if not self.wait_for_selectors("join", JOIN_BUTTON_SELECTORS, config.JOIN_READY_TIMEOUT):
+                    print("Join screen not detected, continuing anyway")
+                
+                print("Configuring audio and video...")
+                
+                self.turn_off_microphone()
+                self.turn_off_camera()
+                
+                print("Looking for join button...")
+                join_successful = self.attempt_to_join()
+                in_meeting = self.wait_for_selectors("leave", LEAVE_BUTTON_SELECTORS, config.JOIN_CONFIRM_TIMEOUT)
+                self.selector_stats.save()
             
-            if join_successful:
+            if join_successful or in_meeting:
                 print("✅ Meeting joined successfully")
-                self.meeting_is_active = True
-                time.sleep(5)
-                return True
             else:
                 print("Join attempt completed")
-                self.meeting_is_active = True
-                return True
+            self.meeting_is_active = True
+            return True
                 
         except Exception as error:
             print(f"Meeting join failed: {error}")
             return False
     
-    def turn_off_microphone(self):
-        microphone_selectors = [
-            '[aria-label*="microphone"]',
-            '[aria-label*="Turn off microphone"]',
-            '[data-testid*="mic"]',
-            'div[aria-label*="Mute"]'
-        ]
+    def probe_selectors(self, group_name, candidates, click=True):
+        ordered_candidates = self.selector_stats.order_candidates(group_name, candidates)
+        try:
+            with self.metrics.span("selector_probe", self.session_name, group=group_name):
+                winner_index = self.browser.execute_script(PROBE_SELECTORS_SCRIPT, ordered_candidates, click)
+        except WebDriverException as error:
+            print(f"Selector probe for {group_name} failed: {error.msg}")
+            return None
         
-        for selector in microphone_selectors:
-            try:
-                mic_button = self.browser.find_element(By.CSS_SELECTOR, selector)
-                if mic_button.is_displayed():
-                    mic_button.click()
-                    print("Microphone disabled")
-                    time.sleep(1)
-                    break
-            except:
-                continue
+        winning_selector = ordered_candidates[winner_index][1] if winner_index >= 0 else None
+        if click:
+            self.selector_stats.record_probe(group_name, winning_selector)
+        return winning_selector
+    
+    def wait_for_selectors(self, group_name, candidates, timeout):
+        try:
+            WebDriverWait(self.browser, timeout, poll_frequency=config.JOIN_POLL_INTERVAL).until(
+                lambda browser: self.probe_selectors(group_name, candidates, click=False)
+            )
+            return True
+        except TimeoutException:
+            self.metrics.increment("selector_wait_timeouts", session=self.session_name, group=group_name)
+            return False
+    
+    def turn_off_microphone(self):
+        if self.probe_selectors("microphone", MICROPHONE_SELECTORS):
+            print("Microphone disabled")
     
     def turn_off_camera(self):
-        camera_selectors = [
-            '[aria-label*="camera"]',
-            '[aria-label*="Turn off camera"]',
-            '[data-testid*="camera"]',
-            'div[aria-label*="camera off"]'
-        ]
-        
-        for selector in camera_selectors:
-            try:
-                camera_button = self.browser.find_element(By.CSS_SELECTOR, selector)
-                if camera_button.is_displayed():
-                    camera_button.click()
-                    print("Camera disabled")
-                    time.sleep(1)
-                    break
-            except:
-                continue
+        if self.probe_selectors("camera", CAMERA_SELECTORS):
+            print("Camera disabled")
     
     def attempt_to_join(self):
-        join_button_options = [
-            ("XPATH", "//span[contains(text(), 'Join now')]"),
-            ("XPATH", "//span[contains(text(), 'Ask to join')]"),
-            ("XPATH", "//div[contains(text(), 'Join now')]"),
-            ("CSS", "[data-testid='join-button']"),
-            ("CSS", "button[jsname='Qx7uuf']")
-        ]
-        
-        for search_method, selector in join_button_options:
-            try:
-                if search_method == "XPATH":
-                    join_button = self.browser.find_element(By.XPATH, selector)
-                else:
-                    join_button = self.browser.find_element(By.CSS_SELECTOR, selector)
-                
-                if join_button.is_displayed() and join_button.is_enabled():
-                    join_button.click()
-                    print(f"Clicked join button using: {selector}")
-                    return True
-            except:
-                continue
+        join_selector = self.probe_selectors("join", JOIN_BUTTON_SELECTORS)
+        if join_selector:
+            print(f"Clicked join button using: {join_selector}")
+            return True
         
         print("Join button not found, trying Enter key")
+        self.metrics.increment("join_fallbacks", session=self.session_name)
         self.browser.find_element(By.TAG_NAME, 'body').send_keys(Keys.ENTER)
-        time.sleep(2)
         return False
     
-    def start_recording(self, session_name):
+    def start_recording(self, session_name, live_transcription=False):
         if not self.meeting_is_active:
             print("No active meeting to record")
             return False
         
+        self.session_name = session_name
         try:
             print(f"Starting audio recording: {session_name}")
-            self.audio_recorder = AudioRecorder()
-            recording_started = self.audio_recorder.start_recording(session_name, config.RECORDINGS_DIR)
+            self.audio_recorder = AudioRecorder(device=self.audio_device, audio_source=self.audio_source)
+            
+            if live_transcription:
+                self.start_live_transcription()
+            
+            recording_started = self.audio_recorder.start_recording(session_name, self.recordings_dir)
             
             if recording_started:
                 print("✅ Recording started")
@@ -169,8 +174,27 @@ class GoogleMeetBot:
                 
         except Exception as error:
             print(f"Recording error: {error}")
+            self.metrics.increment("errors", session=session_name, stage="start_recording")
             return False
     
+    def start_live_transcription(self):
+        live_transcriber = LiveTranscriber(self.audio_recorder.sample_rate, session_name=self.session_name)
+        if live_transcriber.start():
+            self.live_transcriber = live_transcriber
+            self.audio_recorder.add_block_listener(live_transcriber.add_audio)
+            print("✅ Live transcription started")
+    
+    def get_live_transcript(self):
+        if self.live_transcriber:
+            return self.live_transcriber.get_partial_transcript()
+        return None
+    
+    def finish_live_transcription(self):
+        if self.live_transcriber:
+            print("Finishing live transcription...")
+            return self.live_transcriber.finish()
+        return None
+    
     def stop_recording(self):
         if self.audio_recorder:
             print("Stopping recording...")
@@ -182,29 +206,30 @@ class GoogleMeetBot:
     def leave_meeting(self):
         print("Leaving meeting...")
         try:
-            self.find_and_click_leave_button()
+            with self.metrics.span("leave", self.session_name):
+                self.find_and_click_leave_button()
         except Exception as error:
             print(f"Could not leave gracefully: {error}")
         
         finally:
             if self.browser:
-                self.browser.quit()
-                print("Browser closed")
+                if self.browser_is_pooled:
+                    self.browser_pool.release(self.browser)
+                    print("Browser returned to pool")
+                else:
+                    self.browser.quit()
+                    print("Browser closed")
+                self.browser = None
                 self.meeting_is_active = False
+            self.audio_source.close()
+            self.save_session_report()
+    
+    def save_session_report(self):
+        if self.session_name:
+            return self.metrics.save_session_report(self.session_name)
+        return None
     
     def find_and_click_leave_button(self):
-        leave_button_selectors = [
-            '[aria-label*="Leave call"]',
-            '[data-testid*="leave"]',
-            'button[aria-label*="Leave call"]'
-        ]
-        
-        for selector in leave_button_selectors:
-            try:
-                leave_button = self.browser.find_element(By.CSS_SELECTOR, selector)
-                if leave_button.is_displayed():
-                    leave_button.click()
-                    print("Left meeting via button")
-                    break
-            except:
-                continue
+        if self.probe_selectors("leave", LEAVE_BUTTON_SELECTORS):
+            print("Left meeting via button")
+            self.selector_stats.save()
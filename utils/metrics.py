@@ -0,0 +1,236 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import config
+
+METRIC_PREFIX = "meetbot"
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    label_text = ",".join(f'{name}="{str(value).replace(chr(34), chr(39))}"' for name, value in labels)
+    return "{" + label_text + "}"
+
+def new_session_report():
+    return {"stages": {}, "counters": {}, "timeline": []}
+
+class MetricsRegistry:
+    def __init__(self, metrics_dir=None, reports_dir=None):
+        self.metrics_dir = metrics_dir or config.METRICS_DIR
+        self.reports_dir = reports_dir or config.SESSION_REPORTS_DIR
+        self.counters = {}
+        self.timings = {}
+        self.sessions = {}
+        self.lock = threading.Lock()
+        self.snapshot_name = f"{os.getpid()}-{int(time.time() * 1000)}.json"
+
+    def increment(self, name, amount=1, session=None, **labels):
+        counter_key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[counter_key] = self.counters.get(counter_key, 0) + amount
+            if session:
+                session_counters = self.sessions.setdefault(session, new_session_report())["counters"]
+                session_counters[name] = session_counters.get(name, 0) + amount
+
+    @contextmanager
+    def span(self, stage, session=None, **labels):
+        started_at = time.time()
+        start_time = time.perf_counter()
+        error_name = None
+        try:
+            yield
+        except BaseException as error:
+            error_name = type(error).__name__
+            raise
+        finally:
+            self.record_duration(stage, time.perf_counter() - start_time, started_at, session, error_name, labels)
+
+    def record_duration(self, stage, seconds, started_at, session=None, error_name=None, labels=None):
+        labels = labels or {}
+        timing_key = (stage, tuple(sorted(labels.items())))
+        with self.lock:
+            timing = self.timings.setdefault(timing_key, [0, 0.0, 0.0, 0])
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            timing[3] += 1 if error_name else 0
+
+            if not session:
+                return
+            session_report = self.sessions.setdefault(session, new_session_report())
+            stage_totals = session_report["stages"].setdefault(
+                stage, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "errors": 0}
+            )
+            stage_totals["count"] += 1
+            stage_totals["total_seconds"] += seconds
+            stage_totals["max_seconds"] = max(stage_totals["max_seconds"], seconds)
+            stage_totals["errors"] += 1 if error_name else 0
+
+            if len(session_report["timeline"]) < config.METRICS_TIMELINE_LIMIT:
+                session_report["timeline"].append({
+                    "stage": stage,
+                    "labels": labels,
+                    "started_at": started_at,
+                    "seconds": seconds,
+                    "error": error_name
+                })
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+                "timings": [[stage, list(labels), timing] for (stage, labels), timing in self.timings.items()]
+            }
+
+    def flush(self):
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        snapshot_path = os.path.join(self.metrics_dir, self.snapshot_name)
+        with open(f"{snapshot_path}.tmp", 'w', encoding='utf-8') as snapshot_file:
+            json.dump(self.snapshot(), snapshot_file)
+        os.replace(f"{snapshot_path}.tmp", snapshot_path)
+
+    def collect_all_processes(self):
+        counters = {}
+        timings = {}
+        snapshots = [self.snapshot()]
+        if os.path.isdir(self.metrics_dir):
+            stale_before = time.time() - config.METRICS_SNAPSHOT_MAX_AGE_SECONDS
+            for file_name in os.listdir(self.metrics_dir):
+                if not file_name.endswith(".json") or file_name == self.snapshot_name:
+                    continue
+                snapshot_path = os.path.join(self.metrics_dir, file_name)
+                try:
+                    if os.path.getmtime(snapshot_path) < stale_before:
+                        os.remove(snapshot_path)
+                        continue
+                    with open(snapshot_path, encoding='utf-8') as snapshot_file:
+                        snapshots.append(json.load(snapshot_file))
+                except (OSError, ValueError) as error:
+                    print(f"Skipping unreadable metrics snapshot {file_name}: {error}")
+
+        for snapshot in snapshots:
+            for name, labels, value in snapshot["counters"]:
+                counter_key = (name, tuple(tuple(label) for label in labels))
+                counters[counter_key] = counters.get(counter_key, 0) + value
+            for stage, labels, (count, total_seconds, max_seconds, errors) in snapshot["timings"]:
+                timing = timings.setdefault((stage, tuple(tuple(label) for label in labels)), [0, 0.0, 0.0, 0])
+                timing[0] += count
+                timing[1] += total_seconds
+                timing[2] = max(timing[2], max_seconds)
+                timing[3] += errors
+        return counters, timings
+
+    def render_prometheus(self):
+        counters, timings = self.collect_all_processes()
+        output_lines = []
+
+        counter_names = sorted({name for name, _ in counters})
+        for counter_name in counter_names:
+            metric_name = f"{METRIC_PREFIX}_{counter_name}_total"
+            output_lines.append(f"# TYPE {metric_name} counter")
+            for (name, labels), value in sorted(counters.items()):
+                if name == counter_name:
+                    output_lines.append(f"{metric_name}{format_labels(labels)} {value}")
+
+        stage_metric = f"{METRIC_PREFIX}_stage_duration_seconds"
+        output_lines.append(f"# TYPE {stage_metric} summary")
+        for (stage, labels), (count, total_seconds, _, _) in sorted(timings.items()):
+            stage_labels = format_labels((("stage", stage),) + labels)
+            output_lines.append(f"{stage_metric}_count{stage_labels} {count}")
+            output_lines.append(f"{stage_metric}_sum{stage_labels} {total_seconds:.6f}")
+
+        output_lines.append(f"# TYPE {METRIC_PREFIX}_stage_duration_max_seconds gauge")
+        for (stage, labels), (_, _, max_seconds, _) in sorted(timings.items()):
+            stage_labels = format_labels((("stage", stage),) + labels)
+            output_lines.append(f"{METRIC_PREFIX}_stage_duration_max_seconds{stage_labels} {max_seconds:.6f}")
+
+        output_lines.append(f"# TYPE {METRIC_PREFIX}_stage_errors_total counter")
+        for (stage, labels), (_, _, _, errors) in sorted(timings.items()):
+            stage_labels = format_labels((("stage", stage),) + labels)
+            output_lines.append(f"{METRIC_PREFIX}_stage_errors_total{stage_labels} {errors}")
+
+        return "\n".join(output_lines) + "\n"
+
+    def get_report_path(self, session):
+        return os.path.join(self.reports_dir, f"{session}.json")
+
+    def save_session_report(self, session):
+        with self.lock:
+            session_report = self.sessions.pop(session, None)
+        if not session_report:
+            return None
+
+        report_path = self.get_report_path(session)
+        saved_report = self.load_session_report(session) or {"session": session, **new_session_report()}
+
+        for stage, stage_totals in session_report["stages"].items():
+            saved_totals = saved_report["stages"].setdefault(
+                stage, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0, "errors": 0}
+            )
+            saved_totals["count"] += stage_totals["count"]
+            saved_totals["total_seconds"] += stage_totals["total_seconds"]
+            saved_totals["max_seconds"] = max(saved_totals["max_seconds"], stage_totals["max_seconds"])
+            saved_totals["errors"] += stage_totals["errors"]
+        for name, value in session_report["counters"].items():
+            saved_report["counters"][name] = saved_report["counters"].get(name, 0) + value
+        saved_report["timeline"] = sorted(saved_report["timeline"] + session_report["timeline"],
+                                          key=lambda span: span["started_at"])
+
+        os.makedirs(self.reports_dir, exist_ok=True)
+        with open(f"{report_path}.tmp", 'w', encoding='utf-8') as report_file:
+            json.dump(saved_report, report_file, indent=2)
+        os.replace(f"{report_path}.tmp", report_path)
+        self.flush()
+        return report_path
+
+    def load_session_report(self, session):
+        report_path = self.get_report_path(session)
+        if not os.path.exists(report_path):
+            return None
+        with open(report_path, encoding='utf-8') as report_file:
+            return json.load(report_file)
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body, content_type, status_code=200):
+        body = body.encode('utf-8')
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        registry = self.server.registry
+        if self.path == "/metrics":
+            self.send_body(registry.render_prometheus(), "text/plain; version=0.0.4")
+        elif self.path.startswith("/sessions/"):
+            session_report = registry.load_session_report(os.path.basename(self.path))
+            if session_report:
+                self.send_body(json.dumps(session_report, indent=2), "application/json")
+            else:
+                self.send_body(json.dumps({"error": "Session not found"}), "application/json", 404)
+        else:
+            self.send_body(json.dumps({"error": "Not found"}), "application/json", 404)
+
+def start_metrics_server(port=None, registry=None, host="0.0.0.0"):
+    http_server = ThreadingHTTPServer((host, config.METRICS_PORT if port is None else port), MetricsRequestHandler)
+    http_server.registry = registry or get_metrics()
+    threading.Thread(target=http_server.serve_forever, daemon=True).start()
+    print(f"Metrics available on http://{host}:{http_server.server_address[1]}/metrics")
+    return http_server
+
+shared_metrics = None
+shared_metrics_lock = threading.Lock()
+
+def get_metrics():
+    global shared_metrics
+    with shared_metrics_lock:
+        if shared_metrics is None:
+            shared_metrics = MetricsRegistry()
+        return shared_metrics
@@ -0,0 +1,128 @@
+import threading
+import importlib.util
+from collections import OrderedDict
+import config
+from utils.metrics import get_metrics
+
+WHISPER_AVAILABLE = importlib.util.find_spec("whisper") is not None
+TORCH_AVAILABLE = importlib.util.find_spec("torch") is not None
+WHISPER_QUANTIZATIONS = ("none", "int8")
+
+def resolve_device(device=None):
+    if device:
+        return device
+    if TORCH_AVAILABLE:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+    return "cpu"
+
+def estimate_model_bytes(model):
+    import torch
+
+    tensors = list(model.parameters()) + list(model.buffers())
+    tensors += [module.weight() for module in model.modules()
+                if isinstance(module, torch.ao.nn.quantized.dynamic.Linear)]
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+def quantize_model(model):
+    import torch
+    import whisper.model
+
+    for module in model.modules():
+        if isinstance(module, whisper.model.Linear):
+            module.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+class WhisperModelCache:
+    def __init__(self, max_models=None, memory_budget_mb=None):
+        self.max_models = max_models or config.WHISPER_CACHE_MAX_MODELS
+        self.memory_budget_bytes = (memory_budget_mb or config.WHISPER_CACHE_MEMORY_MB) * 1024 * 1024
+        self.models = OrderedDict()
+        self.model_sizes = {}
+        self.loading_locks = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_model(self, model_name=None, device=None, quantization=None):
+        device = resolve_device(device)
+        quantization = quantization or config.WHISPER_QUANTIZATION
+        if quantization not in WHISPER_QUANTIZATIONS:
+            raise ValueError(f"Unknown Whisper quantization: {quantization}")
+        if quantization != "none" and device != "cpu":
+            print(f"{quantization} quantization is only supported on CPU, loading full precision on {device}")
+            quantization = "none"
+        cache_key = (model_name or config.WHISPER_MODEL, device, quantization)
+
+        with self.lock:
+            if cache_key in self.models:
+                self.hits += 1
+                self.models.move_to_end(cache_key)
+                return self.models[cache_key]
+            loading_lock = self.loading_locks.setdefault(cache_key, threading.Lock())
+
+        with loading_lock:
+            with self.lock:
+                if cache_key in self.models:
+                    self.hits += 1
+                    self.models.move_to_end(cache_key)
+                    return self.models[cache_key]
+
+            print(f"Loading Whisper model: {cache_key[0]} on {cache_key[1]} ({cache_key[2]})")
+            model = self.load_model(*cache_key)
+
+            with self.lock:
+                self.misses += 1
+                self.models[cache_key] = model
+                self.model_sizes[cache_key] = estimate_model_bytes(model)
+                self.evict_if_needed()
+            return model
+
+    def load_model(self, model_name, device, quantization="none"):
+        if not WHISPER_AVAILABLE:
+            raise RuntimeError("Whisper is not installed")
+        import whisper
+        with get_metrics().span("model_load", model=model_name, device=device, quantization=quantization):
+            model = whisper.load_model(model_name, device=device)
+            if quantization == "int8":
+                model = quantize_model(model)
+            return model
+
+    def evict_if_needed(self):
+        evicted_cuda_model = False
+        while len(self.models) > 1 and (
+            len(self.models) > self.max_models or sum(self.model_sizes.values()) > self.memory_budget_bytes
+        ):
+            cache_key, _ = self.models.popitem(last=False)
+            del self.model_sizes[cache_key]
+            evicted_cuda_model = evicted_cuda_model or cache_key[1].startswith("cuda")
+            print(f"Evicted Whisper model: {cache_key[0]} on {cache_key[1]} ({cache_key[2]})")
+
+        if evicted_cuda_model and TORCH_AVAILABLE:
+            import torch
+            torch.cuda.empty_cache()
+
+    def clear(self):
+        with self.lock:
+            self.models.clear()
+            self.model_sizes.clear()
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "loaded_models": [f"{name}@{device}/{quantization}" for name, device, quantization in self.models],
+                "memory_mb": sum(self.model_sizes.values()) / (1024 * 1024),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+shared_model_cache = None
+shared_model_cache_lock = threading.Lock()
+
+def get_model_cache():
+    global shared_model_cache
+    with shared_model_cache_lock:
+        if shared_model_cache is None:
+            shared_model_cache = WhisperModelCache()
+        return shared_model_cache
@@ -0,0 +1,29 @@
+import config
+from utils.model_cache import resolve_device
+from utils.system_resources import read_available_cores, read_available_memory_mb
+
+def predict_transcribe_seconds(model_name, quantization, duration, available_cores):
+    cpu_seconds = config.WHISPER_MODEL_CPU_RTF[model_name] * duration
+    if quantization == "int8":
+        cpu_seconds /= config.WHISPER_INT8_SPEEDUP
+    return cpu_seconds / available_cores ** config.WHISPER_THREAD_SCALING
+
+def choose_whisper_model(duration, available_cores=None, target_rtf=None, device=None):
+    if resolve_device(device) != "cpu":
+        return config.WHISPER_MODEL, "none", None
+
+    available_cores = available_cores or read_available_cores()
+    available_memory_mb = read_available_memory_mb()
+    target_rtf = target_rtf or config.WHISPER_POLICY_TARGET_RTF
+    budget_seconds = max(duration * target_rtf, config.WHISPER_POLICY_MIN_BUDGET_SECONDS)
+
+    for model_name in reversed(config.WHISPER_POLICY_MODELS):
+        if config.WHISPER_MODEL_MEMORY_MB.get(model_name, 0) > available_memory_mb:
+            continue
+        for quantization in ("none", "int8"):
+            predicted_seconds = predict_transcribe_seconds(model_name, quantization, duration, available_cores)
+            if predicted_seconds <= budget_seconds:
+                return model_name, quantization, predicted_seconds
+
+    fastest_model = config.WHISPER_POLICY_MODELS[0]
+    return fastest_model, "int8", predict_transcribe_seconds(fastest_model, "int8", duration, available_cores)
@@ -0,0 +1,304 @@
+import os
+import re
+import json
+import heapq
+import threading
+import argparse
+from datetime import datetime, timedelta, timezone
+import config
+from utils.metrics import get_metrics, start_metrics_server
+from utils.system_resources import read_available_memory_mb
+
+MEET_URL_PATTERN = re.compile(r"https://meet\.google\.com/[a-z0-9-]+")
+
+def estimate_host_capacity():
+    bots_by_cpu = (os.cpu_count() or 1) / config.BOT_CPU_CORES
+    bots_by_memory = read_available_memory_mb() / config.BOT_MEMORY_MB
+    return max(1, int(min(bots_by_cpu, bots_by_memory)))
+
+def parse_ics_datetime(value):
+    value = value.split(':')[-1].strip()
+    if value.endswith('Z'):
+        return datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    if 'T' in value:
+        return datetime.strptime(value, '%Y%m%dT%H%M%S')
+    return datetime.strptime(value, '%Y%m%d')
+
+def read_calendar_feed(feed_path):
+    with open(feed_path, 'r', encoding='utf-8') as feed_file:
+        feed_content = feed_file.read()
+
+    if feed_path.endswith('.json'):
+        return [
+            {
+                "meeting_url": entry["url"],
+                "start_time": datetime.fromisoformat(entry["start"]) if entry.get("start") else None,
+                "duration_minutes": entry.get("duration_minutes", config.ORCHESTRATOR_DEFAULT_MINUTES),
+                "meeting_id": entry.get("id")
+            }
+            for entry in json.loads(feed_content)
+        ]
+
+    unfolded_content = re.sub(r"\r?\n[ \t]", "", feed_content)
+    meetings = []
+    for event in re.findall(r"BEGIN:VEVENT(.*?)END:VEVENT", unfolded_content, re.S):
+        meet_url = MEET_URL_PATTERN.search(event)
+        start_line = re.search(r"^DTSTART[^\n]*", event, re.M)
+        end_line = re.search(r"^DTEND[^\n]*", event, re.M)
+        if not meet_url or not start_line:
+            continue
+
+        start_time = parse_ics_datetime(start_line.group(0))
+        duration_minutes = config.ORCHESTRATOR_DEFAULT_MINUTES
+        if end_line:
+            duration_minutes = (parse_ics_datetime(end_line.group(0)) - start_time).total_seconds() / 60
+
+        meetings.append({
+            "meeting_url": meet_url.group(0),
+            "start_time": start_time,
+            "duration_minutes": duration_minutes,
+            "meeting_id": None
+        })
+    return meetings
+
+class MeetingJob:
+    def __init__(self, meeting_url, start_time, duration_minutes, meeting_id, output_root):
+        self.meeting_url = meeting_url
+        self.start_time = start_time
+        self.duration_minutes = duration_minutes
+        self.meeting_id = meeting_id
+        self.recordings_dir = os.path.join(output_root, meeting_id, 'recordings')
+        self.transcripts_dir = os.path.join(output_root, meeting_id, 'transcripts')
+        self.state = "scheduled"
+        self.error = None
+        self.audio_file_path = None
+        self.text_file_path = None
+        self.pdf_file_path = None
+        self.extra_file_paths = {}
+        self.joined_at = None
+        self.finished_at = None
+        self.stop_requested = threading.Event()
+
+    def to_dict(self):
+        return {
+            "meeting_id": self.meeting_id,
+            "meeting_url": self.meeting_url,
+            "state": self.state,
+            "start_time": self.start_time.isoformat(),
+            "duration_minutes": self.duration_minutes,
+            "joined_at": self.joined_at.isoformat() if self.joined_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "audio_file": self.audio_file_path,
+            "text_file": self.text_file_path,
+            "pdf_file": self.pdf_file_path,
+            "extra_files": self.extra_file_paths,
+            "error": self.error
+        }
+
+class MeetingOrchestrator:
+    def __init__(self, max_concurrent_bots=None, max_concurrent_processing=None, output_root=None,
+                 audio_source_type=None):
+        from utils.audio_sources import ISOLATED_SOURCE_TYPES
+
+        self.max_concurrent_bots = max_concurrent_bots or config.ORCHESTRATOR_MAX_BOTS or estimate_host_capacity()
+        self.audio_source_type = audio_source_type or config.ORCHESTRATOR_AUDIO_SOURCE
+        if self.max_concurrent_bots > 1 and self.audio_source_type not in ISOLATED_SOURCE_TYPES:
+            raise ValueError(f"Audio source '{self.audio_source_type}' is shared by all bots; "
+                             f"use pulseaudio or run with --max-bots 1")
+        self.output_root = output_root or config.ORCHESTRATOR_OUTPUT_DIR
+        self.bot_slots = threading.BoundedSemaphore(self.max_concurrent_bots)
+        self.processing_slots = threading.BoundedSemaphore(
+            max_concurrent_processing or config.ORCHESTRATOR_MAX_PROCESSING
+        )
+        self.jobs = {}
+        self.pending_jobs = []
+        self.jobs_lock = threading.Condition()
+        self.shutdown_requested = threading.Event()
+        self.scheduler_thread = None
+        self.meeting_threads = []
+        self.browser_pool = None
+
+    def schedule_meeting(self, meeting_url, start_time=None, duration_minutes=None, meeting_id=None):
+        start_time = start_time or datetime.now()
+        meeting_id = meeting_id or f"{start_time.strftime('%Y%m%d_%H%M%S')}_{len(self.jobs):04d}"
+        job = MeetingJob(
+            meeting_url,
+            start_time,
+            duration_minutes or config.ORCHESTRATOR_DEFAULT_MINUTES,
+            meeting_id,
+            self.output_root
+        )
+
+        with self.jobs_lock:
+            self.jobs[meeting_id] = job
+            heapq.heappush(self.pending_jobs, (start_time, meeting_id))
+            self.jobs_lock.notify()
+        return job
+
+    def schedule_calendar_feed(self, feed_path):
+        now = datetime.now()
+        return [
+            self.schedule_meeting(**meeting)
+            for meeting in read_calendar_feed(feed_path)
+            if meeting["start_time"] is None
+            or meeting["start_time"] + timedelta(minutes=meeting["duration_minutes"]) > now
+        ]
+
+    def start(self):
+        from utils.browser_pool import BrowserPool
+        from utils.audio_sources import BROWSER_ENVIRONMENT_SOURCE_TYPES
+
+        print(f"Orchestrator running with up to {self.max_concurrent_bots} concurrent bots")
+        if self.audio_source_type not in BROWSER_ENVIRONMENT_SOURCE_TYPES:
+            self.browser_pool = BrowserPool(pool_size=min(config.BROWSER_POOL_SIZE, self.max_concurrent_bots))
+            self.browser_pool.start()
+        self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
+        self.scheduler_thread.start()
+
+    def run_scheduler(self):
+        while not self.shutdown_requested.is_set():
+            with self.jobs_lock:
+                if not self.pending_jobs:
+                    self.jobs_lock.wait(1)
+                    continue
+
+                start_time, meeting_id = self.pending_jobs[0]
+                seconds_until_start = (start_time - datetime.now()).total_seconds()
+                if seconds_until_start > 0:
+                    self.jobs_lock.wait(min(seconds_until_start, 30))
+                    continue
+                heapq.heappop(self.pending_jobs)
+
+            job = self.jobs[meeting_id]
+            job.state = "waiting_for_slot"
+            while not self.bot_slots.acquire(timeout=1):
+                if self.shutdown_requested.is_set():
+                    return
+
+            meeting_thread = threading.Thread(target=self.run_meeting, args=(job,), daemon=True)
+            self.meeting_threads.append(meeting_thread)
+            meeting_thread.start()
+
+    def run_meeting(self, job):
+        from utils.meet_bot import GoogleMeetBot
+        from utils.audio_sources import create_audio_source
+
+        meet_bot = GoogleMeetBot(
+            recordings_dir=job.recordings_dir,
+            headless=True,
+            browser_pool=self.browser_pool,
+            session_name=job.meeting_id,
+            audio_source=create_audio_source(self.audio_source_type, session_name=job.meeting_id)
+        )
+        try:
+            job.state = "joining"
+            if not meet_bot.join_meeting(job.meeting_url):
+                raise RuntimeError("Failed to join meeting")
+
+            job.joined_at = datetime.now()
+            if not meet_bot.start_recording(job.meeting_id):
+                raise RuntimeError("Failed to start recording")
+
+            job.state = "recording"
+            meeting_end = job.start_time + timedelta(minutes=job.duration_minutes)
+            job.stop_requested.wait(max(0, (meeting_end - datetime.now()).total_seconds()))
+
+            job.audio_file_path = meet_bot.stop_recording()
+        except Exception as error:
+            job.state = "failed"
+            job.error = str(error)
+            print(f"Meeting {job.meeting_id} failed: {error}")
+        finally:
+            meet_bot.leave_meeting()
+            self.bot_slots.release()
+
+        if job.audio_file_path:
+            self.process_recording(job)
+        elif job.state != "failed":
+            job.state = "failed"
+            job.error = "No audio captured"
+        job.finished_at = datetime.now()
+
+    def process_recording(self, job):
+        from utils.transcription import TranscriptionService
+        from utils.file_generator import FileGenerator
+
+        job.state = "queued_for_processing"
+        with self.processing_slots:
+            try:
+                job.state = "processing"
+                transcription_service = TranscriptionService(session_name=job.meeting_id)
+                transcript, audio_info = transcription_service.transcribe(job.audio_file_path)
+
+                file_generator = FileGenerator(transcripts_dir=job.transcripts_dir)
+                job.text_file_path, job.pdf_file_path = file_generator.create_transcript_files(
+                    transcript or transcription_service.create_message(transcript, job.audio_file_path, audio_info),
+                    job.meeting_id
+                )
+                if transcript:
+                    job.extra_file_paths = file_generator.create_structured_files(transcript, job.meeting_id)
+                job.state = "completed"
+            except Exception as error:
+                job.state = "failed"
+                job.error = str(error)
+                print(f"Processing {job.meeting_id} failed: {error}")
+            finally:
+                get_metrics().save_session_report(job.meeting_id)
+
+    def stop_meeting(self, meeting_id):
+        job = self.jobs.get(meeting_id)
+        if job:
+            job.stop_requested.set()
+
+    def get_status(self):
+        with self.jobs_lock:
+            return [job.to_dict() for job in self.jobs.values()]
+
+    def shutdown(self, wait=True):
+        self.shutdown_requested.set()
+        with self.jobs_lock:
+            self.jobs_lock.notify_all()
+        for job in list(self.jobs.values()):
+            job.stop_requested.set()
+        if wait:
+            for meeting_thread in self.meeting_threads:
+                meeting_thread.join()
+        if self.browser_pool:
+            self.browser_pool.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description="Attend scheduled Google Meet sessions in parallel")
+    parser.add_argument("feed", nargs="?", help="Calendar feed (.ics or .json)")
+    parser.add_argument("--url", action="append", default=[], help="Meeting URL to join immediately")
+    parser.add_argument("--minutes", type=float, default=config.ORCHESTRATOR_DEFAULT_MINUTES)
+    parser.add_argument("--max-bots", type=int, default=None)
+    parser.add_argument("--audio-source", default=config.ORCHESTRATOR_AUDIO_SOURCE,
+                        choices=["pulseaudio", "replay", "sounddevice", "ffmpeg", "fifo"],
+                        help="Where each bot records from; only pulseaudio and replay isolate concurrent bots")
+    parser.add_argument("--metrics-port", type=int, default=config.METRICS_PORT,
+                        help="Port for the Prometheus metrics endpoint (0 disables it)")
+    arguments = parser.parse_args()
+    config.create_project_directories()
+
+    if arguments.metrics_port:
+        start_metrics_server(arguments.metrics_port)
+
+    orchestrator = MeetingOrchestrator(max_concurrent_bots=arguments.max_bots,
+                                       audio_source_type=arguments.audio_source)
+    if arguments.feed:
+        orchestrator.schedule_calendar_feed(arguments.feed)
+    for meeting_url in arguments.url:
+        orchestrator.schedule_meeting(meeting_url, duration_minutes=arguments.minutes)
+
+    orchestrator.start()
+    try:
+        while any(job["state"] not in ("completed", "failed") for job in orchestrator.get_status()):
+            orchestrator.shutdown_requested.wait(10)
+            print(json.dumps(orchestrator.get_status(), indent=2))
+    except KeyboardInterrupt:
+        print("Stopping all meetings...")
+    finally:
+        orchestrator.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import os
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import config
+from utils.audio_processing import WHISPER_SAMPLE_RATE, find_quietest_frame
+from utils.model_cache import get_model_cache
+from utils.system_resources import read_available_memory_mb
+
+worker_model = None
+
+def initialize_worker(model_name, threads_per_worker, quantization=None):
+    global worker_model
+    import torch
+    torch.set_num_threads(threads_per_worker)
+    worker_model = get_model_cache().get_model(model_name, device="cpu", quantization=quantization)
+
+def transcribe_segment(segment_audio, segment_start):
+    result = worker_model.transcribe(segment_audio, fp16=False, word_timestamps=config.WHISPER_WORD_TIMESTAMPS)
+    for segment in result["segments"]:
+        segment["start"] += segment_start
+        segment["end"] += segment_start
+        for word in segment.get("words", []):
+            word["start"] += segment_start
+            word["end"] += segment_start
+    return result["segments"]
+
+def split_at_silences(audio_data, sample_rate=WHISPER_SAMPLE_RATE):
+    target_length = int(config.PARALLEL_SEGMENT_SECONDS * sample_rate)
+    search_length = int(config.PARALLEL_SPLIT_SEARCH_SECONDS * sample_rate)
+    frame_length = int(config.LIVE_SILENCE_FRAME_SECONDS * sample_rate)
+
+    boundaries = [0]
+    while len(audio_data) - boundaries[-1] > target_length + search_length:
+        target_cut = boundaries[-1] + target_length
+        boundaries.append(find_quietest_frame(audio_data, target_cut - search_length,
+                                              target_cut + search_length, frame_length))
+    boundaries.append(len(audio_data))
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def estimate_worker_count(model_name):
+    model_memory_mb = config.WHISPER_MODEL_MEMORY_MB.get(model_name, 2000)
+    workers_by_memory = int(read_available_memory_mb() // model_memory_mb)
+    return max(1, min(os.cpu_count() or 1, workers_by_memory))
+
+class ParallelTranscriber:
+    def __init__(self, model_name=None, worker_count=None, quantization=None):
+        self.model_name = model_name or config.WHISPER_MODEL
+        self.quantization = quantization or config.WHISPER_QUANTIZATION
+        self.worker_count = worker_count or config.WHISPER_PARALLEL_WORKERS or estimate_worker_count(self.model_name)
+        self.executor = None
+        self.active_transcriptions = 0
+        self.retired = False
+        self.lock = threading.Lock()
+
+    def get_executor(self):
+        if self.executor is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // self.worker_count)
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initialize_worker,
+                initargs=(self.model_name, threads_per_worker, self.quantization)
+            )
+        return self.executor
+
+    def transcribe(self, audio_data, sample_rate=WHISPER_SAMPLE_RATE):
+        segment_bounds = split_at_silences(audio_data, sample_rate)
+        print(f"Transcribing {len(segment_bounds)} segments across {self.worker_count} workers")
+
+        with self.lock:
+            self.active_transcriptions += 1
+            executor = self.get_executor()
+        try:
+            pending_segments = [
+                executor.submit(transcribe_segment, audio_data[start:end], start / sample_rate)
+                for start, end in segment_bounds
+            ]
+
+            segments = []
+            for pending_segment in pending_segments:
+                segments.extend(pending_segment.result())
+        finally:
+            with self.lock:
+                self.active_transcriptions -= 1
+                if self.retired and not self.active_transcriptions:
+                    self.shutdown()
+
+        return {
+            "text": " ".join(segment["text"].strip() for segment in segments if segment["text"].strip()),
+            "segments": segments
+        }
+
+    def retire(self):
+        with self.lock:
+            self.retired = True
+            if not self.active_transcriptions:
+                self.shutdown()
+
+    def shutdown(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+shared_transcribers = OrderedDict()
+shared_transcribers_lock = threading.Lock()
+
+def get_parallel_transcriber(model_name=None, worker_count=None, quantization=None):
+    transcriber_key = (model_name or config.WHISPER_MODEL, worker_count or config.WHISPER_PARALLEL_WORKERS,
+                       quantization or config.WHISPER_QUANTIZATION)
+    with shared_transcribers_lock:
+        transcriber = shared_transcribers.get(transcriber_key)
+        if transcriber is None:
+            transcriber = shared_transcribers[transcriber_key] = ParallelTranscriber(*transcriber_key)
+        shared_transcribers.move_to_end(transcriber_key)
+
+        while len(shared_transcribers) > config.WHISPER_PARALLEL_MAX_POOLS:
+            _, evicted_transcriber = shared_transcribers.popitem(last=False)
+            evicted_transcriber.retire()
+        return transcriber
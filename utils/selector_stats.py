@@ -0,0 +1,92 @@
+import os
+import json
+import threading
+import config
+
+PROBE_SELECTORS_SCRIPT = """
+const candidates = arguments[0];
+const shouldClick = arguments[1];
+
+for (let index = 0; index < candidates.length; index++) {
+    const [searchMethod, selector] = candidates[index];
+    let element = null;
+    try {
+        element = searchMethod === "XPATH"
+            ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(selector);
+    } catch (error) {
+        continue;
+    }
+    if (!element) {
+        continue;
+    }
+
+    const bounds = element.getBoundingClientRect();
+    const style = window.getComputedStyle(element);
+    if (!bounds.width || !bounds.height || style.visibility === "hidden" || style.display === "none") {
+        continue;
+    }
+
+    const clickable = element.closest("button, [role='button']") || element;
+    if (clickable.disabled || clickable.getAttribute("aria-disabled") === "true") {
+        continue;
+    }
+
+    if (shouldClick) {
+        clickable.click();
+    }
+    return index;
+}
+return -1;
+"""
+
+class SelectorStats:
+    def __init__(self, stats_path=None):
+        self.stats_path = stats_path or config.SELECTOR_STATS_PATH
+        self.lock = threading.Lock()
+        self.stats = self.load()
+
+    def load(self):
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as stats_file:
+                return json.load(stats_file)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        with self.lock:
+            os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+            temporary_path = f"{self.stats_path}.{os.getpid()}.tmp"
+            with open(temporary_path, 'w', encoding='utf-8') as stats_file:
+                json.dump(self.stats, stats_file, indent=2)
+            os.replace(temporary_path, self.stats_path)
+
+    def order_candidates(self, group_name, candidates):
+        with self.lock:
+            group_stats = self.stats.get(group_name, {})
+            last_winner = group_stats.get("last_winner")
+            attempts = max(1, group_stats.get("attempts", 0))
+            hits = group_stats.get("hits", {})
+
+        return sorted(
+            candidates,
+            key=lambda candidate: (candidate[1] != last_winner, -hits.get(candidate[1], 0) / attempts)
+        )
+
+    def record_probe(self, group_name, winning_selector):
+        with self.lock:
+            group_stats = self.stats.setdefault(group_name, {"attempts": 0, "hits": {}, "last_winner": None})
+            group_stats["attempts"] += 1
+            if winning_selector:
+                group_stats["hits"][winning_selector] = group_stats["hits"].get(winning_selector, 0) + 1
+                group_stats["last_winner"] = winning_selector
+
+shared_selector_stats = {}
+shared_selector_stats_lock = threading.Lock()
+
+def get_selector_stats(stats_path=None):
+    stats_path = stats_path or config.SELECTOR_STATS_PATH
+    with shared_selector_stats_lock:
+        if stats_path not in shared_selector_stats:
+            shared_selector_stats[stats_path] = SelectorStats(stats_path)
+        return shared_selector_stats[stats_path]
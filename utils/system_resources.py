@@ -0,0 +1,19 @@
+import os
+
+def read_available_memory_mb():
+    try:
+        with open('/proc/meminfo') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def read_available_cores():
+    cpu_count = os.cpu_count() or 1
+    try:
+        load_average = os.getloadavg()[0]
+    except OSError:
+        load_average = 0.0
+    return max(1.0, cpu_count - load_average)
@@ -0,0 +1,156 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+import numpy as np
+import config
+from utils.audio_processing import WHISPER_SAMPLE_RATE, map_wav_file, load_whisper_audio, int16_to_float
+
+HASH_CHUNK_FRAMES = WHISPER_SAMPLE_RATE * 60
+
+def hash_audio_samples(audio_data):
+    audio_hash = hashlib.blake2b(digest_size=20)
+    for chunk_start in range(0, len(audio_data), HASH_CHUNK_FRAMES):
+        chunk = audio_data[chunk_start:chunk_start + HASH_CHUNK_FRAMES]
+        if chunk.dtype == np.int16:
+            chunk = int16_to_float(chunk)
+        audio_hash.update(np.ascontiguousarray(chunk, dtype=np.float32).data)
+    return audio_hash.hexdigest()
+
+def hash_audio_file(audio_file_path):
+    mapped_audio, sample_rate = map_wav_file(audio_file_path)
+    if mapped_audio is not None and sample_rate == WHISPER_SAMPLE_RATE and mapped_audio.shape[1] == 1:
+        return hash_audio_samples(mapped_audio[:, 0])
+    return hash_audio_samples(load_whisper_audio(audio_file_path))
+
+class TranscriptCache:
+    def __init__(self, cache_path=None, max_size_mb=None):
+        self.cache_path = cache_path or config.TRANSCRIPT_CACHE_PATH
+        self.max_size_bytes = (max_size_mb or config.TRANSCRIPT_CACHE_MAX_MB) * 1024 * 1024
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS transcripts (
+                    cache_key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS transcripts_by_access ON transcripts (last_access);
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    file_path TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    modified_time REAL NOT NULL,
+                    audio_hash TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+            """)
+
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.cache_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get_audio_hash(self, audio_file_path):
+        file_path = os.path.abspath(audio_file_path)
+        file_status = os.stat(file_path)
+        with self.connect() as connection:
+            cached_hash = connection.execute(
+                "SELECT audio_hash FROM file_hashes WHERE file_path = ? AND file_size = ? AND modified_time = ?",
+                (file_path, file_status.st_size, file_status.st_mtime)
+            ).fetchone()
+        if cached_hash:
+            return cached_hash[0]
+
+        audio_hash = hash_audio_file(file_path)
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)",
+                (file_path, file_status.st_size, file_status.st_mtime, audio_hash)
+            )
+        return audio_hash
+
+    def build_key(self, audio_hash, backend_name, backend_options):
+        key_material = json.dumps([audio_hash, backend_name, backend_options], sort_keys=True)
+        return hashlib.sha256(key_material.encode('utf-8')).hexdigest()
+
+    def get(self, audio_hash, backend_name, backend_options):
+        cache_key = self.build_key(audio_hash, backend_name, backend_options)
+        with self.connect() as connection:
+            row = connection.execute("SELECT payload FROM transcripts WHERE cache_key = ?", (cache_key,)).fetchone()
+            if row:
+                connection.execute(
+                    "UPDATE transcripts SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key)
+                )
+            self.increment_stat(connection, "hits" if row else "misses")
+        return json.loads(row[0]) if row else None
+
+    def put(self, audio_hash, backend_name, backend_options, value):
+        cache_key = self.build_key(audio_hash, backend_name, backend_options)
+        payload = json.dumps(value)
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?, ?)",
+                (cache_key, payload, len(payload.encode('utf-8')), time.time())
+            )
+            self.evict_if_needed(connection)
+
+    def evict_if_needed(self, connection):
+        total_size = connection.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM transcripts").fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return
+
+        evicted_entries = 0
+        for cache_key, size_bytes in connection.execute(
+            "SELECT cache_key, size_bytes FROM transcripts ORDER BY last_access"
+        ).fetchall():
+            if total_size <= self.max_size_bytes:
+                break
+            connection.execute("DELETE FROM transcripts WHERE cache_key = ?", (cache_key,))
+            total_size -= size_bytes
+            evicted_entries += 1
+        self.increment_stat(connection, "evictions", evicted_entries)
+
+    def increment_stat(self, connection, stat_name, amount=1):
+        connection.execute(
+            "INSERT INTO cache_stats VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (stat_name, amount)
+        )
+
+    def get_stats(self):
+        with self.connect() as connection:
+            stats = dict(connection.execute("SELECT name, value FROM cache_stats").fetchall())
+            entries, size_bytes = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM transcripts"
+            ).fetchone()
+
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        return {
+            "entries": entries,
+            "size_mb": size_bytes / (1024 * 1024),
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+            "evictions": stats.get("evictions", 0),
+            "hit_rate": stats.get("hits", 0) / lookups if lookups else 0.0
+        }
+
+shared_transcript_cache = None
+shared_transcript_cache_lock = threading.Lock()
+
+def get_transcript_cache():
+    global shared_transcript_cache
+    with shared_transcript_cache_lock:
+        if shared_transcript_cache is None:
+            shared_transcript_cache = TranscriptCache()
+        return shared_transcript_cache
@@ -0,0 +1,192 @@
+import io
+import os
+import queue
+import threading
+from fpdf import FPDF
+import config
+from utils.transcript_model import format_timestamp
+
+UNICODE_FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/TTF/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf"
+]
+
+def find_unicode_font():
+    if config.PDF_FONT_PATH and os.path.exists(config.PDF_FONT_PATH):
+        return config.PDF_FONT_PATH
+    for font_path in UNICODE_FONT_CANDIDATES:
+        if os.path.exists(font_path):
+            return font_path
+    return None
+
+def format_segment(segment):
+    if isinstance(segment, str):
+        return segment
+    if isinstance(segment, dict):
+        return f"[{format_timestamp(segment['start'])}] {segment['text'].strip()}"
+    if not segment.has_timing:
+        return segment.text
+    return f"[{format_timestamp(segment.start)}] {segment.text}"
+
+def iter_text_lines(transcript_text):
+    for line in io.StringIO(transcript_text):
+        yield line.rstrip('\n')
+
+class FontMetrics:
+    def __init__(self, pdf_document):
+        self.pdf_document = pdf_document
+        self.character_widths = {}
+
+    def text_width(self, text):
+        width = 0.0
+        for character in text:
+            character_width = self.character_widths.get(character)
+            if character_width is None:
+                character_width = self.pdf_document.get_string_width(character)
+                self.character_widths[character] = character_width
+            width += character_width
+        return width
+
+    def wrap_text(self, text, max_width):
+        if not text:
+            return [""]
+
+        wrapped_lines = []
+        current_line = ""
+        current_width = 0.0
+        space_width = self.text_width(" ")
+
+        for word in text.split(" "):
+            word_width = self.text_width(word)
+            separator_width = space_width if current_line else 0.0
+
+            if current_width + separator_width + word_width <= max_width:
+                current_line = f"{current_line} {word}" if current_line else word
+                current_width += separator_width + word_width
+                continue
+
+            if current_line:
+                wrapped_lines.append(current_line)
+                current_line, current_width = "", 0.0
+
+            while word_width > max_width:
+                split_index = self.fit_characters(word, max_width)
+                wrapped_lines.append(word[:split_index])
+                word = word[split_index:]
+                word_width = self.text_width(word)
+
+            current_line, current_width = word, word_width
+
+        wrapped_lines.append(current_line)
+        return wrapped_lines
+
+    def fit_characters(self, word, max_width):
+        width = 0.0
+        for index, character in enumerate(word):
+            width += self.text_width(character)
+            if width > max_width:
+                return max(1, index)
+        return len(word)
+
+class TranscriptExporter:
+    def __init__(self, font_path=None, parallel=None):
+        self.font_path = font_path or find_unicode_font()
+        self.parallel = config.EXPORT_PARALLEL if parallel is None else parallel
+
+    def create_pdf_document(self):
+        pdf_document = FPDF()
+        pdf_document.set_auto_page_break(auto=True, margin=15)
+        if self.font_path:
+            pdf_document.add_font("TranscriptFont", "", self.font_path)
+            pdf_document.add_font("TranscriptFont", "B", self.font_path)
+        return pdf_document
+
+    def set_font(self, pdf_document, style="", size=11):
+        if self.font_path:
+            pdf_document.set_font("TranscriptFont", style, size)
+        else:
+            pdf_document.set_font("Helvetica", style, size)
+
+    def prepare_text(self, text):
+        if self.font_path:
+            return text
+        return text.encode('latin-1', 'replace').decode('latin-1')
+
+    def write_pdf_header(self, pdf_document, header_lines):
+        self.set_font(pdf_document, "B", 16)
+        pdf_document.cell(0, 10, "Meeting Transcript", ln=True, align='C')
+        pdf_document.ln(3)
+
+        self.set_font(pdf_document, size=10)
+        for header_line in header_lines:
+            pdf_document.cell(0, 8, self.prepare_text(header_line), ln=True)
+        pdf_document.ln(8)
+
+    def export(self, segments, text_file_path=None, pdf_file_path=None, header_text="", pdf_header_lines=()):
+        text_writer = None
+        text_file = None
+        try:
+            try:
+                if text_file_path:
+                    text_file = open(text_file_path, 'w', encoding='utf-8')
+                    text_file.write(header_text)
+                    if self.parallel and pdf_file_path:
+                        text_writer = BackgroundLineWriter(text_file)
+
+                pdf_document = None
+                if pdf_file_path:
+                    pdf_document = self.create_pdf_document()
+                    pdf_document.add_page()
+                    self.write_pdf_header(pdf_document, pdf_header_lines)
+                    self.set_font(pdf_document)
+                    font_metrics = FontMetrics(pdf_document)
+                    line_width = pdf_document.epw - 2 * pdf_document.c_margin
+
+                for segment in segments:
+                    line = format_segment(segment)
+                    if text_writer:
+                        text_writer.write_line(line)
+                    elif text_file:
+                        text_file.write(line + '\n')
+
+                    if pdf_document:
+                        for wrapped_line in font_metrics.wrap_text(self.prepare_text(line), line_width):
+                            pdf_document.cell(0, 6, wrapped_line, ln=True)
+            finally:
+                if text_writer:
+                    text_writer.close()
+                if text_file:
+                    text_file.close()
+
+            if pdf_document:
+                pdf_document.output(pdf_file_path)
+        except Exception:
+            for partial_file_path in (text_file_path, pdf_file_path):
+                if partial_file_path and os.path.exists(partial_file_path):
+                    os.remove(partial_file_path)
+            raise
+        return text_file_path, pdf_file_path
+
+class BackgroundLineWriter:
+    def __init__(self, output_file):
+        self.output_file = output_file
+        self.pending_lines = queue.Queue(maxsize=config.EXPORT_QUEUE_LINES)
+        self.writer_thread = threading.Thread(target=self.write_lines, daemon=True)
+        self.writer_thread.start()
+
+    def write_line(self, line):
+        self.pending_lines.put(line)
+
+    def write_lines(self):
+        line = self.pending_lines.get()
+        while line is not None:
+            self.output_file.write(line + '\n')
+            line = self.pending_lines.get()
+
+    def close(self):
+        self.pending_lines.put(None)
+        self.writer_thread.join()
@@ -0,0 +1,218 @@
+import os
+import re
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from contextlib import contextmanager
+import config
+from utils.transcript_model import format_timestamp
+
+TIMESTAMP_PATTERN = re.compile(r"^\[(\d+):(\d{2}):(\d{2})\]\s*(.*)$")
+HEADER_FIELD_PATTERN = re.compile(r"^(Generated|Session): (.*)$")
+INDEX_BATCH_SIZE = 5000
+
+def parse_transcript_file(text_file_path, header):
+    in_header = True
+    with open(text_file_path, encoding='utf-8', errors='replace') as text_file:
+        for line in text_file:
+            line = line.strip()
+            if in_header:
+                header_field = HEADER_FIELD_PATTERN.match(line)
+                if header_field:
+                    header[header_field.group(1).lower()] = header_field.group(2)
+                elif line.startswith("====="):
+                    in_header = False
+                continue
+
+            if not line:
+                continue
+            timestamped_line = TIMESTAMP_PATTERN.match(line)
+            if timestamped_line:
+                hours, minutes, seconds, text = timestamped_line.groups()
+                yield int(hours) * 3600 + int(minutes) * 60 + int(seconds), text
+            else:
+                yield None, line
+
+def build_match_query(search_text):
+    search_terms = re.findall(r"\w+", search_text, flags=re.UNICODE)
+    if not search_terms:
+        return None
+    quoted_terms = [f'"{term}"' for term in search_terms]
+    quoted_terms[-1] += "*"
+    return " ".join(quoted_terms)
+
+class TranscriptIndex:
+    def __init__(self, index_path=None):
+        self.index_path = index_path or config.TRANSCRIPT_INDEX_PATH
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        with self.connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS transcripts (
+                    transcript_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    text_file_path TEXT UNIQUE NOT NULL,
+                    session_name TEXT,
+                    generated_at TEXT,
+                    modified_time REAL NOT NULL,
+                    segment_count INTEGER NOT NULL,
+                    first_segment_id INTEGER,
+                    last_segment_id INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS transcripts_by_session ON transcripts (session_name);
+                CREATE VIRTUAL TABLE IF NOT EXISTS segments USING fts5(
+                    text,
+                    transcript_id UNINDEXED,
+                    start_seconds UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                );
+            """)
+
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.index_path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def index_text_file(self, text_file_path, session_name=None):
+        text_file_path = os.path.abspath(text_file_path)
+        modified_time = os.path.getmtime(text_file_path)
+        header = {}
+
+        with self.connect() as connection:
+            existing = connection.execute(
+                "SELECT transcript_id, first_segment_id, last_segment_id FROM transcripts WHERE text_file_path = ?",
+                (text_file_path,)
+            ).fetchone()
+            if existing:
+                connection.execute("DELETE FROM segments WHERE rowid BETWEEN ? AND ?", existing[1:])
+                connection.execute("DELETE FROM transcripts WHERE transcript_id = ?", existing[:1])
+
+            transcript_id = connection.execute(
+                "INSERT INTO transcripts (text_file_path, modified_time, segment_count) VALUES (?, ?, 0)",
+                (text_file_path, modified_time)
+            ).lastrowid
+
+            first_segment_id = connection.execute("SELECT COALESCE(MAX(rowid), 0) + 1 FROM segments").fetchone()[0]
+            segment_count = 0
+            segment_rows = []
+            for start_seconds, text in parse_transcript_file(text_file_path, header):
+                segment_rows.append((text, transcript_id, start_seconds))
+                if len(segment_rows) >= INDEX_BATCH_SIZE:
+                    connection.executemany("INSERT INTO segments VALUES (?, ?, ?)", segment_rows)
+                    segment_count += len(segment_rows)
+                    segment_rows = []
+            connection.executemany("INSERT INTO segments VALUES (?, ?, ?)", segment_rows)
+            segment_count += len(segment_rows)
+
+            connection.execute(
+                """UPDATE transcripts SET session_name = ?, generated_at = ?, segment_count = ?,
+                                          first_segment_id = ?, last_segment_id = ?
+                   WHERE transcript_id = ?""",
+                (session_name or header.get("session"), header.get("generated"), segment_count,
+                 first_segment_id, first_segment_id + segment_count - 1, transcript_id)
+            )
+        return segment_count
+
+    def backfill(self, text_dirs=None):
+        text_dirs = text_dirs or [os.path.join(config.TRANSCRIPTS_DIR, 'text')]
+        with self.connect() as connection:
+            indexed_files = dict(connection.execute("SELECT text_file_path, modified_time FROM transcripts"))
+
+        indexed_count = 0
+        for text_dir in text_dirs:
+            for directory, _, file_names in os.walk(text_dir):
+                for file_name in sorted(file_names):
+                    if not file_name.endswith(".txt"):
+                        continue
+                    text_file_path = os.path.abspath(os.path.join(directory, file_name))
+                    if indexed_files.get(text_file_path) == os.path.getmtime(text_file_path):
+                        continue
+                    try:
+                        self.index_text_file(text_file_path)
+                        indexed_count += 1
+                    except (OSError, sqlite3.Error) as error:
+                        print(f"Could not index {text_file_path}: {error}")
+        return indexed_count
+
+    def search(self, search_text, limit=None, session_name=None):
+        match_query = build_match_query(search_text)
+        if not match_query:
+            return []
+
+        query = """
+            SELECT transcripts.session_name, transcripts.generated_at, transcripts.text_file_path,
+                   segments.start_seconds, snippet(segments, 0, '**', '**', '…', 16)
+            FROM segments JOIN transcripts ON transcripts.transcript_id = segments.transcript_id
+            WHERE segments MATCH ?
+        """
+        parameters = [match_query]
+        if session_name:
+            query += " AND transcripts.session_name = ?"
+            parameters.append(session_name)
+        query += " ORDER BY rank LIMIT ?"
+        parameters.append(limit or config.SEARCH_RESULT_LIMIT)
+
+        with self.connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return [
+            {
+                "session_name": session_name,
+                "generated_at": generated_at,
+                "text_file_path": text_file_path,
+                "start_seconds": start_seconds,
+                "snippet": snippet
+            }
+            for session_name, generated_at, text_file_path, start_seconds, snippet in rows
+        ]
+
+    def get_stats(self):
+        with self.connect() as connection:
+            transcript_count, segment_count = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(segment_count), 0) FROM transcripts"
+            ).fetchone()
+        return {"transcripts": transcript_count, "segments": segment_count}
+
+shared_transcript_index = None
+shared_transcript_index_lock = threading.Lock()
+
+def get_transcript_index():
+    global shared_transcript_index
+    with shared_transcript_index_lock:
+        if shared_transcript_index is None:
+            shared_transcript_index = TranscriptIndex()
+        return shared_transcript_index
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the transcript search index")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    backfill_parser = subcommands.add_parser("backfill", help="Index transcript files that are not indexed yet")
+    backfill_parser.add_argument("directories", nargs="*")
+    search_parser = subcommands.add_parser("search", help="Search indexed transcripts")
+    search_parser.add_argument("query")
+    search_parser.add_argument("--session")
+    search_parser.add_argument("--limit", type=int, default=config.SEARCH_RESULT_LIMIT)
+    arguments = parser.parse_args()
+
+    transcript_index = get_transcript_index()
+    if arguments.command == "backfill":
+        start_time = time.perf_counter()
+        indexed_count = transcript_index.backfill(arguments.directories or None)
+        print(f"Indexed {indexed_count} transcripts in {time.perf_counter() - start_time:.1f}s "
+              f"({transcript_index.get_stats()['transcripts']} total)")
+        return
+
+    start_time = time.perf_counter()
+    results = transcript_index.search(arguments.query, arguments.limit, arguments.session)
+    for result in results:
+        start_seconds = result["start_seconds"]
+        position = f" @ {format_timestamp(start_seconds)}" if start_seconds is not None else ""
+        print(f"{result['session_name']}{position}: {result['snippet']}")
+    print(f"{len(results)} results in {(time.perf_counter() - start_time) * 1000:.0f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
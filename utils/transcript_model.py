@@ -0,0 +1,216 @@
+import json
+import math
+from array import array
+from datetime import datetime
+
+SENTENCE_ENDINGS = (".", "?", "!")
+MAX_WORDS_PER_SEGMENT = 30
+LIVE_SERVICE_NAME = "Whisper (live)"
+
+class Word:
+    __slots__ = ("start", "end", "text")
+
+    def __init__(self, start, end, text):
+        self.start = start
+        self.end = end
+        self.text = text
+
+class Segment:
+    __slots__ = ("start", "end", "text", "words")
+
+    def __init__(self, start, end, text, words=()):
+        self.start = start
+        self.end = end
+        self.text = text
+        self.words = words
+
+    @property
+    def has_timing(self):
+        return not math.isnan(self.start)
+
+class Transcript:
+    def __init__(self, service_name=None, audio_file_path=None, duration=0.0, generated_at=None):
+        self.service_name = service_name
+        self.audio_file_path = audio_file_path
+        self.duration = duration
+        self.generated_at = generated_at or datetime.now()
+        self.segment_starts = array('d')
+        self.segment_ends = array('d')
+        self.segment_texts = []
+        self.word_offsets = array('L', [0])
+        self.word_starts = array('d')
+        self.word_ends = array('d')
+        self.word_texts = []
+
+    def add_segment(self, start, end, text, words=()):
+        text = text.strip()
+        if not text:
+            return
+        self.segment_starts.append(math.nan if start is None else start)
+        self.segment_ends.append(math.nan if end is None else end)
+        self.segment_texts.append(text)
+        for word_start, word_end, word_text in words:
+            self.word_starts.append(word_start)
+            self.word_ends.append(word_end)
+            self.word_texts.append(word_text.strip())
+        self.word_offsets.append(len(self.word_texts))
+
+    def __len__(self):
+        return len(self.segment_texts)
+
+    def __iter__(self):
+        for index in range(len(self.segment_texts)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        words = tuple(
+            Word(self.word_starts[word_index], self.word_ends[word_index], self.word_texts[word_index])
+            for word_index in range(self.word_offsets[index], self.word_offsets[index + 1])
+        )
+        return Segment(self.segment_starts[index], self.segment_ends[index], self.segment_texts[index], words)
+
+    @property
+    def text(self):
+        return " ".join(self.segment_texts)
+
+    @property
+    def has_timing(self):
+        return bool(self.segment_starts) and not math.isnan(self.segment_starts[0])
+
+    def shift(self, offset_seconds):
+        for times in (self.segment_starts, self.segment_ends, self.word_starts, self.word_ends):
+            for index in range(len(times)):
+                times[index] += offset_seconds
+
+    def remap_times(self, time_mapper):
+        import numpy as np
+        for attribute_name in ("segment_starts", "segment_ends", "word_starts", "word_ends"):
+            times = getattr(self, attribute_name)
+            if len(times):
+                mapped_times = time_mapper(np.frombuffer(times, dtype=np.float64))
+                setattr(self, attribute_name, array('d', np.asarray(mapped_times, dtype=np.float64).tobytes()))
+
+    def extend(self, other_transcript):
+        for segment in other_transcript:
+            self.add_segment(segment.start, segment.end, segment.text,
+                             [(word.start, word.end, word.text) for word in segment.words])
+
+    def to_dict(self):
+        return {
+            "service": self.service_name,
+            "duration": self.duration,
+            "segments": {
+                "start": [None if math.isnan(start) else start for start in self.segment_starts],
+                "end": [None if math.isnan(end) else end for end in self.segment_ends],
+                "text": self.segment_texts,
+                "word_offsets": list(self.word_offsets)
+            },
+            "words": {"start": list(self.word_starts), "end": list(self.word_ends), "text": self.word_texts}
+        }
+
+    @classmethod
+    def from_dict(cls, transcript_data, audio_file_path=None):
+        transcript = cls(transcript_data.get("service"), audio_file_path, transcript_data.get("duration", 0.0))
+        if "segments" not in transcript_data:
+            transcript.add_segment(None, None, transcript_data.get("text", ""))
+            return transcript
+
+        segments = transcript_data["segments"]
+        words = transcript_data["words"]
+        transcript.segment_starts = array('d', (math.nan if start is None else start for start in segments["start"]))
+        transcript.segment_ends = array('d', (math.nan if end is None else end for end in segments["end"]))
+        transcript.segment_texts = list(segments["text"])
+        transcript.word_offsets = array('L', segments["word_offsets"])
+        transcript.word_starts = array('d', words["start"])
+        transcript.word_ends = array('d', words["end"])
+        transcript.word_texts = list(words["text"])
+        return transcript
+
+    @classmethod
+    def from_whisper_result(cls, whisper_result, service_name="Whisper", audio_file_path=None, duration=0.0):
+        transcript = cls(service_name, audio_file_path, duration)
+        for segment in whisper_result["segments"]:
+            transcript.add_segment(
+                segment["start"],
+                segment["end"],
+                segment["text"],
+                [(word["start"], word["end"], word["word"]) for word in segment.get("words", [])]
+            )
+        return transcript
+
+    @classmethod
+    def from_words(cls, words, service_name, audio_file_path=None, duration=0.0):
+        transcript = cls(service_name, audio_file_path, duration)
+        pending_words = []
+        for word_start, word_end, word_text in words:
+            pending_words.append((word_start, word_end, word_text))
+            if word_text.endswith(SENTENCE_ENDINGS) or len(pending_words) >= MAX_WORDS_PER_SEGMENT:
+                transcript.add_word_segment(pending_words)
+                pending_words = []
+        transcript.add_word_segment(pending_words)
+        return transcript
+
+    def add_word_segment(self, words):
+        if words:
+            self.add_segment(words[0][0], words[-1][1], " ".join(word[2] for word in words), words)
+
+    @classmethod
+    def from_text(cls, text, service_name, audio_file_path=None, duration=0.0):
+        transcript = cls(service_name, audio_file_path, duration)
+        transcript.add_segment(None, None, text)
+        return transcript
+
+def format_timestamp(seconds):
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+def format_clock(seconds, millisecond_separator):
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{millisecond_separator}{milliseconds:03d}"
+
+def iter_timed_segments(transcript):
+    previous_end = 0.0
+    for segment in transcript:
+        start = segment.start if segment.has_timing else previous_end
+        end = segment.end if segment.has_timing else start + max(2.0, len(segment.text.split()) * 0.4)
+        previous_end = end
+        yield start, end, segment.text
+
+def render_srt(transcript):
+    for cue_number, (start, end, text) in enumerate(iter_timed_segments(transcript), start=1):
+        yield f"{cue_number}\n{format_clock(start, ',')} --> {format_clock(end, ',')}\n{text}\n\n"
+
+def render_vtt(transcript):
+    yield "WEBVTT\n\n"
+    for start, end, text in iter_timed_segments(transcript):
+        yield f"{format_clock(start, '.')} --> {format_clock(end, '.')}\n{text}\n\n"
+
+def render_json(transcript):
+    yield json.dumps({
+        "service": transcript.service_name,
+        "audio_file": transcript.audio_file_path,
+        "duration": transcript.duration,
+        "generated": transcript.generated_at.isoformat(timespec='seconds')
+    })[:-1] + ', "segments": ['
+
+    for index, segment in enumerate(transcript):
+        segment_data = {
+            "start": segment.start if segment.has_timing else None,
+            "end": segment.end if segment.has_timing else None,
+            "text": segment.text
+        }
+        if segment.words:
+            segment_data["words"] = [{"start": word.start, "end": word.end, "text": word.text}
+                                     for word in segment.words]
+        yield ("," if index else "") + "\n" + json.dumps(segment_data, ensure_ascii=False)
+    yield "\n]}\n"
+
+RENDERERS = {
+    "srt": render_srt,
+    "vtt": render_vtt,
+    "json": render_json
+}
@@ -1,12 +1,17 @@
 import os
 import numpy as np
 from datetime import datetime
-
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+import tempfile
+import config
+from utils.model_cache import WHISPER_AVAILABLE, get_model_cache
+from utils.model_policy import choose_whisper_model
+from utils.audio_processing import WHISPER_SAMPLE_RATE, load_whisper_audio, write_wav
+from utils.vad import trim_silence
+from utils.parallel_transcription import get_parallel_transcriber
+from utils.transcript_cache import get_transcript_cache
+from utils.hedged_transcription import HedgedTranscriber, is_acceptable_transcript
+from utils.transcript_model import LIVE_SERVICE_NAME, Transcript
+from utils.metrics import get_metrics
 
 try:
     import assemblyai as aai
@@ -14,84 +19,296 @@ try:
 except ImportError:
     ASSEMBLYAI_AVAILABLE = False
 
+def analyze_audio_blocks(audio_blocks, frame_length):
+    max_volume = 0.0
+    sum_of_squares = 0.0
+    sample_count = 0
+    clipped_samples = 0
+    frame_count = 0
+    silent_frames = 0
+    
+    for audio_block in audio_blocks:
+        if not len(audio_block):
+            continue
+        
+        absolute_block = np.abs(audio_block)
+        max_volume = max(max_volume, float(absolute_block.max()))
+        sum_of_squares += float(np.dot(audio_block.ravel(), audio_block.ravel()))
+        sample_count += audio_block.size
+        clipped_samples += int(np.count_nonzero(absolute_block >= config.AUDIO_CLIPPING_LEVEL))
+        
+        mono_block = audio_block.mean(axis=1)
+        block_frames = -(-len(mono_block) // frame_length)
+        padded_block = np.zeros(block_frames * frame_length, dtype=np.float32)
+        padded_block[:len(mono_block)] = mono_block
+        frame_rms = np.sqrt(np.mean(padded_block.reshape(block_frames, frame_length) ** 2, axis=1))
+        frame_count += block_frames
+        silent_frames += int(np.count_nonzero(frame_rms < config.AUDIO_SILENCE_RMS))
+    
+    return {
+        "max_volume": max_volume,
+        "rms_volume": float(np.sqrt(sum_of_squares / sample_count)) if sample_count else 0.0,
+        "clipping_ratio": clipped_samples / sample_count if sample_count else 0.0,
+        "silence_ratio": silent_frames / frame_count if frame_count else 1.0
+    }
+
+BACKEND_SERVICE_NAMES = {"assemblyai": "AssemblyAI", "whisper": "Whisper"}
+
 class TranscriptionService:
-    def __init__(self):
-        self.whisper_model = None
+    def __init__(self, model_cache=None, model_name=None, parallel=None, transcript_cache=None, strategy=None,
+                 session_name=None, quantization=None, model_policy=None):
+        self.model_cache = model_cache or get_model_cache()
+        self.model_name = model_name
+        self.quantization = quantization
+        self.model_policy = model_policy or config.WHISPER_MODEL_POLICY
+        self.whisper_model_name = model_name or config.WHISPER_MODEL
+        self.whisper_quantization = quantization or config.WHISPER_QUANTIZATION
+        self.parallel = config.WHISPER_PARALLEL_ENABLED if parallel is None else parallel
+        self.strategy = strategy or config.TRANSCRIPTION_STRATEGY
+        self.transcript_cache = transcript_cache
+        if transcript_cache is None and config.TRANSCRIPT_CACHE_ENABLED:
+            self.transcript_cache = get_transcript_cache()
         self.assemblyai_client = None
-        
-        if WHISPER_AVAILABLE:
-            self.whisper_model = whisper.load_model("base")
+        self.session_name = session_name
+        self.metrics = get_metrics()
         
         if ASSEMBLYAI_AVAILABLE:
             api_key = os.getenv('ASSEMBLYAI_API_KEY')
             if api_key:
                 aai.settings.api_key = api_key
+                if config.ASSEMBLYAI_BASE_URL:
+                    aai.settings.base_url = config.ASSEMBLYAI_BASE_URL
+                aai.settings.polling_interval = config.ASSEMBLYAI_POLL_INTERVAL
                 self.assemblyai_client = aai.Transcriber()
     
-    def transcribe_audio(self, audio_file_path):
+    def transcribe_audio(self, audio_file_path, live_transcript=None):
+        transcript, audio_info = self.transcribe(audio_file_path, live_transcript)
+        return self.create_message(transcript, audio_file_path, audio_info)
+    
+    def transcribe(self, audio_file_path, live_transcript=None):
         if not os.path.exists(audio_file_path):
-            return "Audio file not found"
+            return None, None
         
-        audio_info = self.get_audio_info(audio_file_path)
+        with self.metrics.span("audio_info", self.session_name):
+            audio_info = self.get_audio_info(audio_file_path)
         
         if audio_info["too_small"] or audio_info["no_content"]:
-            return self.create_error_message(audio_file_path, audio_info)
+            return None, audio_info
         
+        self.select_whisper_model(audio_info["duration"])
         transcript = None
-        service_used = None
+        audio_hash = None
+        
+        if isinstance(live_transcript, str):
+            live_transcript = Transcript.from_text(live_transcript, LIVE_SERVICE_NAME)
+        if live_transcript and is_acceptable_transcript(live_transcript.text):
+            transcript = live_transcript
+            transcript.service_name = LIVE_SERVICE_NAME
         
-        if self.assemblyai_client:
-            transcript = self.use_assemblyai(audio_file_path)
-            if transcript:
-                service_used = "AssemblyAI"
+        if not transcript and self.transcript_cache:
+            try:
+                audio_hash = self.transcript_cache.get_audio_hash(audio_file_path)
+            except Exception as error:
+                print(f"Transcript cache unavailable: {error}")
+                self.metrics.increment("errors", session=self.session_name, stage="transcript_cache")
         
-        if not transcript and self.whisper_model:
-            transcript = self.use_whisper(audio_file_path)
-            if transcript:
-                service_used = "Whisper"
+        if not transcript and self.should_hedge():
+            transcript = self.transcribe_hedged(audio_file_path, audio_hash)
         
+        elif not transcript:
+            if self.assemblyai_client:
+                transcript = self.run_backend_cached(
+                    "assemblyai", audio_hash, self.get_backend_options("assemblyai"),
+                    lambda: self.use_assemblyai(audio_file_path)
+                )
+            
+            if not transcript and WHISPER_AVAILABLE:
+                transcript = self.run_backend_cached(
+                    "whisper", audio_hash, self.get_backend_options("whisper"),
+                    lambda: self.use_whisper(audio_file_path)
+                )
+        
+        service_used = transcript.service_name if transcript else "none"
+        self.metrics.increment("transcriptions", session=self.session_name, service=service_used)
         if transcript:
-            return self.create_success_message(transcript, audio_file_path, audio_info, service_used)
-        else:
-            return self.create_failure_message(audio_file_path, audio_info)
+            transcript.audio_file_path = audio_file_path
+            transcript.duration = audio_info["duration"]
+        return transcript, audio_info
+    
+    def create_message(self, transcript, audio_file_path, audio_info):
+        if audio_info is None:
+            return "Audio file not found"
+        if audio_info["too_small"] or audio_info["no_content"]:
+            return self.create_error_message(audio_file_path, audio_info)
+        if transcript:
+            return self.create_success_message(transcript.text, audio_file_path, audio_info, transcript.service_name)
+        return self.create_failure_message(audio_file_path, audio_info)
+    
+    def select_whisper_model(self, duration):
+        if self.model_name or self.model_policy != "adaptive":
+            return self.whisper_model_name, self.whisper_quantization
+        
+        self.whisper_model_name, self.whisper_quantization, predicted_seconds = choose_whisper_model(duration)
+        print(f"Selected Whisper {self.whisper_model_name} ({self.whisper_quantization}) for {duration:.0f}s of audio, "
+              f"predicted {predicted_seconds or 0:.0f}s")
+        self.metrics.increment("model_selections", session=self.session_name, model=self.whisper_model_name,
+                               quantization=self.whisper_quantization)
+        return self.whisper_model_name, self.whisper_quantization
+    
+    def get_whisper_model(self):
+        return self.model_cache.get_model(self.whisper_model_name, quantization=self.whisper_quantization)
+    
+    def should_hedge(self):
+        return self.strategy == "hedged" and self.assemblyai_client is not None and WHISPER_AVAILABLE
+    
+    def transcribe_hedged(self, audio_file_path, audio_hash):
+        if audio_hash:
+            for backend_name in BACKEND_SERVICE_NAMES:
+                cached_transcript = self.get_cached_transcript(audio_hash, backend_name)
+                if cached_transcript:
+                    return cached_transcript
+        
+        transcript, service_used = HedgedTranscriber(self).transcribe_sync(audio_file_path)
+        if transcript and audio_hash:
+            backend_name = next(name for name, service in BACKEND_SERVICE_NAMES.items() if service == service_used)
+            backend_options = self.get_backend_options(backend_name)
+            self.transcript_cache.put(audio_hash, backend_name, backend_options, transcript.to_dict())
+        return transcript
+    
+    def get_backend_options(self, backend_name):
+        if backend_name == "whisper":
+            return {"model": self.whisper_model_name, "quantization": self.whisper_quantization,
+                    "vad": config.VAD_ENABLED, "fp16": False, "word_timestamps": config.WHISPER_WORD_TIMESTAMPS}
+        return {"vad": config.VAD_ENABLED}
+    
+    def get_cached_transcript(self, audio_hash, backend_name):
+        cached_result = self.transcript_cache.get(audio_hash, backend_name, self.get_backend_options(backend_name))
+        self.record_cache_lookup(backend_name, cached_result)
+        if not cached_result:
+            return None
+        
+        print(f"Transcript cache hit ({backend_name})")
+        cached_transcript = Transcript.from_dict(cached_result)
+        cached_transcript.service_name = BACKEND_SERVICE_NAMES[backend_name]
+        return cached_transcript
+    
+    def run_backend_cached(self, backend_name, audio_hash, backend_options, run_backend):
+        if audio_hash:
+            cached_transcript = self.get_cached_transcript(audio_hash, backend_name)
+            if cached_transcript:
+                return cached_transcript
+        
+        transcript = run_backend()
+        if transcript and audio_hash:
+            self.transcript_cache.put(audio_hash, backend_name, backend_options, transcript.to_dict())
+        return transcript
+    
+    def record_cache_lookup(self, backend_name, cached_result):
+        self.metrics.increment("transcript_cache_lookups", session=self.session_name, backend=backend_name,
+                               result="hit" if cached_result else "miss")
     
     def get_audio_info(self, audio_file_path):
         try:
             import soundfile as sf
             file_size = os.path.getsize(audio_file_path)
-            audio_data, sample_rate = sf.read(audio_file_path)
-            max_volume = np.max(np.abs(audio_data))
-            duration = len(audio_data) / sample_rate
+            file_info = sf.info(audio_file_path)
+            frame_length = max(1, int(file_info.samplerate * config.AUDIO_ANALYSIS_FRAME_SECONDS))
+            audio_blocks = sf.blocks(
+                audio_file_path,
+                blocksize=frame_length * config.AUDIO_ANALYSIS_FRAMES_PER_BLOCK,
+                dtype='float32',
+                always_2d=True
+            )
+            audio_stats = analyze_audio_blocks(audio_blocks, frame_length)
             
-            return {
-                "duration": duration,
-                "file_size": file_size,
-                "max_volume": max_volume,
-                "too_small": file_size < 1000,
-                "no_content": max_volume < 0.001
-            }
-        except:
-            return {"duration": 0, "file_size": 0, "max_volume": 0, "too_small": True, "no_content": True}
+            return self.build_audio_info(file_info.frames / file_info.samplerate, file_size, audio_stats)
+        except Exception as error:
+            print(f"Could not analyse audio: {error}")
+            self.metrics.increment("errors", session=self.session_name, stage="audio_info")
+            return {"duration": 0, "file_size": 0, "max_volume": 0, "rms_volume": 0, "clipping_ratio": 0,
+                    "silence_ratio": 1, "too_small": True, "no_content": True}
+    
+    def build_audio_info(self, duration, file_size, audio_stats):
+        return {
+            "duration": duration,
+            "file_size": file_size,
+            **audio_stats,
+            "too_small": file_size < 1000,
+            "no_content": audio_stats["max_volume"] < 0.001
+        }
     
     def use_assemblyai(self, audio_file_path):
+        upload_file_path = None
+        offset_map = None
         try:
-            result = self.assemblyai_client.transcribe(audio_file_path)
+            if config.VAD_ENABLED:
+                upload_file_path, offset_map = self.write_upload_file(audio_file_path)
+            with self.metrics.span("transcribe", self.session_name, backend="assemblyai"):
+                result = self.assemblyai_client.transcribe(upload_file_path or audio_file_path)
             if result.status != aai.TranscriptStatus.error:
-                text = result.text.strip()
-                return text if len(text) > 10 else None
-        except:
-            pass
+                transcript = self.build_assemblyai_transcript(result, offset_map)
+                return transcript if is_acceptable_transcript(transcript.text) else None
+            print(f"AssemblyAI failed: {result.error}")
+            self.metrics.increment("errors", session=self.session_name, stage="transcribe", backend="assemblyai")
+        except Exception as error:
+            print(f"AssemblyAI failed: {error}")
+        finally:
+            if upload_file_path and os.path.exists(upload_file_path):
+                os.remove(upload_file_path)
         return None
     
+    def build_assemblyai_transcript(self, result, offset_map=None):
+        if result.words:
+            transcript = Transcript.from_words(
+                ((word.start / 1000, word.end / 1000, word.text) for word in result.words),
+                BACKEND_SERVICE_NAMES["assemblyai"]
+            )
+        else:
+            transcript = Transcript.from_text(result.text or "", BACKEND_SERVICE_NAMES["assemblyai"])
+        if offset_map:
+            transcript.remap_times(offset_map.to_original_time)
+        return transcript
+    
     def use_whisper(self, audio_file_path):
         try:
-            result = self.whisper_model.transcribe(audio_file_path, fp16=False)
-            text = result["text"].strip()
-            return text if len(text) > 10 else None
-        except:
-            pass
+            with self.metrics.span("transcribe", self.session_name, backend="whisper"):
+                result = self.run_whisper(audio_file_path)
+            transcript = Transcript.from_whisper_result(result, BACKEND_SERVICE_NAMES["whisper"])
+            return transcript if is_acceptable_transcript(transcript.text) else None
+        except Exception as error:
+            print(f"Whisper failed: {error}")
         return None
     
+    def run_whisper(self, audio_file_path):
+        speech_audio = load_whisper_audio(audio_file_path)
+        offset_map = None
+        if config.VAD_ENABLED:
+            speech_audio, offset_map = trim_silence(speech_audio)
+        
+        if not len(speech_audio):
+            return {"text": "", "segments": []}
+        
+        if self.parallel and len(speech_audio) >= config.WHISPER_PARALLEL_MIN_SECONDS * WHISPER_SAMPLE_RATE:
+            result = get_parallel_transcriber(self.whisper_model_name,
+                                              quantization=self.whisper_quantization).transcribe(speech_audio)
+        else:
+            whisper_model = self.get_whisper_model()
+            result = whisper_model.transcribe(
+                speech_audio,
+                fp16=False,
+                word_timestamps=config.WHISPER_WORD_TIMESTAMPS
+            )
+        
+        if offset_map:
+            offset_map.remap_segments(result["segments"])
+        return result
+    
+    def write_upload_file(self, audio_file_path):
+        upload_audio, offset_map = trim_silence(load_whisper_audio(audio_file_path))
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as upload_file:
+            upload_file_path = upload_file.name
+        return write_wav(upload_file_path, upload_audio), offset_map
+    
     def create_success_message(self, transcript_text, audio_file_path, audio_info, service_name):
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         filename = os.path.basename(audio_file_path)
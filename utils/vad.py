@@ -0,0 +1,100 @@
+import numpy as np
+import config
+from utils.audio_processing import WHISPER_SAMPLE_RATE
+
+class OffsetMap:
+    def __init__(self, original_starts, trimmed_starts, sample_rate):
+        self.original_starts = np.asarray(original_starts, dtype=np.int64)
+        self.trimmed_starts = np.asarray(trimmed_starts, dtype=np.int64)
+        self.sample_rate = sample_rate
+
+    def to_original_time(self, trimmed_seconds):
+        if not len(self.trimmed_starts):
+            return trimmed_seconds
+
+        trimmed_samples = np.asarray(trimmed_seconds) * self.sample_rate
+        region_index = np.searchsorted(self.trimmed_starts, trimmed_samples, side='right') - 1
+        region_index = np.clip(region_index, 0, len(self.trimmed_starts) - 1)
+        original_samples = self.original_starts[region_index] + (trimmed_samples - self.trimmed_starts[region_index])
+        return original_samples / self.sample_rate
+
+    def remap_segments(self, segments):
+        for segment in segments:
+            segment["start"] = float(self.to_original_time(segment["start"]))
+            segment["end"] = float(self.to_original_time(segment["end"]))
+            for word in segment.get("words", []):
+                word["start"] = float(self.to_original_time(word["start"]))
+                word["end"] = float(self.to_original_time(word["end"]))
+        return segments
+
+class VoiceActivityDetector:
+    def __init__(self, sample_rate=WHISPER_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * config.VAD_FRAME_SECONDS)
+        self.hangover_frames = int(config.VAD_HANGOVER_SECONDS / config.VAD_FRAME_SECONDS)
+        self.preroll_frames = int(config.VAD_PREROLL_SECONDS / config.VAD_FRAME_SECONDS)
+        self.min_gap_frames = int(config.VAD_MIN_GAP_SECONDS / config.VAD_FRAME_SECONDS)
+
+    def detect_speech_frames(self, audio_data):
+        frame_count = len(audio_data) // self.frame_length
+        if frame_count == 0:
+            return np.zeros(0, dtype=bool)
+
+        frames = audio_data[:frame_count * self.frame_length].reshape(frame_count, self.frame_length)
+        frame_energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+        zero_crossing_rate = np.mean(np.abs(np.diff(np.signbit(frames), axis=1)), axis=1)
+
+        noise_floor_db = np.percentile(frame_energy_db, 10)
+        if np.percentile(frame_energy_db, 90) - noise_floor_db < config.VAD_ENERGY_MARGIN_DB:
+            return self.apply_hangover(frame_energy_db > config.VAD_MIN_ENERGY_DB)
+        energy_threshold_db = max(noise_floor_db + config.VAD_ENERGY_MARGIN_DB, config.VAD_MIN_ENERGY_DB)
+
+        voiced_frames = frame_energy_db > energy_threshold_db
+        unvoiced_frames = (
+            (frame_energy_db > energy_threshold_db - config.VAD_UNVOICED_MARGIN_DB)
+            & (zero_crossing_rate > config.VAD_UNVOICED_ZCR)
+        )
+        return self.apply_hangover(voiced_frames | unvoiced_frames)
+
+    def apply_hangover(self, speech_frames):
+        frame_count = len(speech_frames)
+        speech_counts = speech_frames.astype(np.int32)
+        hangover_kernel = np.ones(self.hangover_frames + 1, dtype=np.int32)
+        preroll_kernel = np.ones(self.preroll_frames + 1, dtype=np.int32)
+
+        extended_forward = np.convolve(speech_counts, hangover_kernel)[:frame_count] > 0
+        extended_backward = np.convolve(speech_counts[::-1], preroll_kernel)[:frame_count][::-1] > 0
+        return extended_forward | extended_backward
+
+    def find_speech_regions(self, audio_data):
+        speech_frames = self.detect_speech_frames(audio_data)
+        if not speech_frames.any():
+            return []
+
+        frame_edges = np.diff(np.concatenate(([0], speech_frames.astype(np.int8), [0])))
+        region_starts = np.flatnonzero(frame_edges == 1)
+        region_ends = np.flatnonzero(frame_edges == -1)
+
+        gap_lengths = region_starts[1:] - region_ends[:-1]
+        keep_boundary = gap_lengths >= self.min_gap_frames
+        region_starts = np.concatenate((region_starts[:1], region_starts[1:][keep_boundary]))
+        region_ends = np.concatenate((region_ends[:-1][keep_boundary], region_ends[-1:]))
+
+        region_ends = np.where(region_ends == len(speech_frames), len(audio_data) / self.frame_length, region_ends)
+        return [
+            (int(start * self.frame_length), int(end * self.frame_length))
+            for start, end in zip(region_starts, region_ends)
+        ]
+
+def trim_silence(audio_data, sample_rate=WHISPER_SAMPLE_RATE, detector=None):
+    detector = detector or VoiceActivityDetector(sample_rate)
+    speech_regions = detector.find_speech_regions(audio_data)
+    if not speech_regions:
+        return audio_data, OffsetMap([], [], sample_rate)
+
+    region_lengths = np.array([end - start for start, end in speech_regions])
+    trimmed_starts = np.concatenate(([0], np.cumsum(region_lengths)[:-1]))
+    trimmed_audio = np.concatenate([audio_data[start:end] for start, end in speech_regions])
+
+    original_starts = [start for start, _ in speech_regions]
+    return trimmed_audio, OffsetMap(original_starts, trimmed_starts, sample_rate)